@@ -0,0 +1,194 @@
+"""Headless benchmarks of the engine's hot paths.
+
+Runs the engine with SDL's dummy video driver and writes the results as JSON, so they can be compared
+across commits.
+
+Usage:
+
+    python benchmarks/run.py --sizes 1000 10000 50000 --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import logging
+import pygame as pg
+
+from pygame_tools_tafh import (
+    Engine, GameObject, Tween, SurfaceComponent, RectShapeComponent, CircleShapeComponent, LabelComponent, ShapeComponent
+)
+from pygame_tools_tafh.core.registry import Registry
+from pygame_tools_tafh.net.serialization import serialize, deserialize, encode_message, decode_message
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def measure(function, repeat: int) -> dict[str, float]:
+    """Calls the function repeat times.
+
+    Returns:
+        Mean, minimum and maximum duration of a call in milliseconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        function()
+        times.append((time.perf_counter_ns() - start) / 1e6)
+    return {"mean": sum(times) / len(times), "min": min(times), "max": max(times)}
+
+
+def reset():
+    """Removes all game objects and tweens left by the previous scene.
+    """
+    Tween.stop_all()
+    Registry.current().destroy()
+    GameObject("camera")
+
+
+def build_scene(size: int):
+    """Creates size game objects spread over a grid, with shapes, surfaces and labels in equal parts.
+    """
+    surface = pg.Surface((16, 16))
+    surface.fill((0, 128, 255))
+    columns = int(size ** 0.5) + 1
+    for i in range(size):
+        go = GameObject(f"object{i}")
+        go.position = Vector2d(i % columns * 20 - 400, i // columns * 20 - 300)
+        go.z_index = i % 8
+        kind = i % 4
+        if kind == 0:
+            go.add_component(RectShapeComponent((255, 0, 0), Vector2d(12, 12)))
+        elif kind == 1:
+            go.add_component(CircleShapeComponent((0, 255, 0), 6))
+        elif kind == 2:
+            go.add_component(SurfaceComponent(surface))
+        else:
+            go.add_component(LabelComponent(str(i % 100), (255, 255, 255), size=12))
+
+
+def bench_scene(engine: Engine, size: int, repeat: int) -> dict[str, dict[str, float]]:
+    reset()
+    build_scene(size)
+    objects = list(GameObject.objects)
+    engine.render()
+
+    def update():
+        for obj in objects:
+            obj.update(16)
+
+    def z_sort():
+        # Moving an object to another layer invalidates the drawing order.
+        obj = objects[1]
+        obj.z_index = (obj.z_index + 1) % 8
+        GameObject.render_queue.get_order()
+
+    def get_component():
+        for obj in objects:
+            if obj.contains_component(ShapeComponent):
+                obj.get_component(ShapeComponent)
+
+    def tweens():
+        Tween.update_all(16)
+
+    results = {
+        "update": measure(update, repeat),
+        "draw": measure(engine.render, repeat),
+        "z_sort": measure(z_sort, repeat),
+        "get_component": measure(get_component, repeat),
+    }
+
+    # Vector values are interpolated tween by tween.
+    for obj in objects[1:]:
+        Tween(obj, "position", Vector2d(0, 0), Vector2d(100, 100), 1_000_000).start()
+    results["tween_update_all"] = measure(tweens, repeat)
+    Tween.stop_all()
+
+    # Numeric values are advanced in NumPy batches when numpy is installed.
+    for obj in objects[1:]:
+        Tween(obj, "position.x", 0, 100, 1_000_000).start()
+        Tween(obj, "position.y", 0, 100, 1_000_000).start()
+    results["tween_update_all_numeric"] = measure(tweens, repeat)
+    Tween.stop_all()
+
+    # Moving the camera invalidates the projection and the visible set of every frame.
+    camera = GameObject.get_by_tag("camera")
+
+    def scroll():
+        camera.position = Vector2d(camera.position.x + 1, 0)
+        engine.render()
+
+    results["draw_scrolling"] = measure(scroll, repeat)
+
+    # Tearing the scene down can be measured only once per build.
+    results["scene_destroy"] = measure(lambda: Registry.current().destroy(), 1)
+    return results
+
+
+def bench_serialization(repeat: int, count: int = 1000) -> dict[str, dict[str, float]]:
+    message = {
+        "objects": [
+            {"id": i, "x": i * 1.5, "y": -i * 0.5, "name": f"object{i}", "alive": True, "tags": [1, 2, 3]}
+            for i in range(count)
+        ]
+    }
+    data = serialize(message)
+    frame = encode_message("state", message)
+    return {
+        "serialize": measure(lambda: serialize(message), repeat),
+        "deserialize": measure(lambda: deserialize(data), repeat),
+        "encode_message": measure(lambda: encode_message("state", message), repeat),
+        "decode_message": measure(lambda: decode_message(memoryview(frame)[4:]), repeat),
+    }
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs headless benchmarks of the engine.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="numbers of game objects")
+    parser.add_argument("--repeat", type=int, default=20, help="measured calls per benchmark")
+    parser.add_argument("--output", help="JSON file to write the results to, stdout if omitted")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    engine = Engine("benchmark", 60, (800, 600))
+
+    results = {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "repeat": args.repeat,
+        "unit": "ms",
+        "scenes": {},
+        "serialization": bench_serialization(args.repeat),
+    }
+    for size in args.sizes:
+        results["scenes"][str(size)] = bench_scene(engine, size, args.repeat)
+        print(f"{size} objects done", file=sys.stderr)
+    reset()
+
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as file:
+            file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,34 @@ from .components import *
 from .components.keybind import *
 from .components.movement import *
 from .core.game_object import *
+from .core.camera import Viewport
+from .core.transform_store import TransformStore
+from .core.prefab import Prefab, ObjectPool
 from .engine import *
 from .tween import *
+from .profiler import Profiler
+from .input import Input, KeyEdge
+from .loader import AssetLoader
+from .asset_manager import AssetManager
 from . import vmath
 
 __all__ = [
     "Engine",
     "GameObject",
+    "Transform",
+    "Viewport",
+    "TransformStore",
+    "Prefab",
+    "ObjectPool",
     "Component",
     "SurfaceComponent",
     "Scene",
     "Tween",
+    "Profiler",
+    "Input",
+    "KeyEdge",
+    "AssetLoader",
+    "AssetManager",
     "vmath",
     "KeybindComponent",
     "MovementComponent",
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+import logging
+import os
+import pygame as pg
+
+from .loader import AssetLoader
+
+
+class AssetManager:
+    """Shares images loaded from files as surfaces in the display format.
+
+    Every image is loaded once and converted with convert() or convert_alpha(), which makes blitting it several
+    times faster. Images in use are reference counted (see acquire() and release()). Unreferenced images stay
+    cached until the memory of all cached images exceeds budget, then the least recently used ones are dropped.
+
+    budget      Maximum size of cached surfaces in bytes. Referenced surfaces are never dropped, even over budget.
+    memory      Current size of cached surfaces in bytes.
+    hits        Number of requests served from the cache.
+    misses      Number of requests that loaded an image.
+    evictions   Number of dropped images.
+    """
+    default: "AssetManager | None" = None
+
+    budget: int
+    memory: int
+    hits: int
+    misses: int
+    evictions: int
+    _surfaces: OrderedDict[str, pg.Surface]
+    _refs: dict[str, int]
+    _pending: dict[str, Future]
+
+    def __init__(self, budget: int = 256 << 20):
+        self.budget = budget
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+        self._refs = {}
+        self._pending = {}
+
+    @staticmethod
+    def get_default() -> "AssetManager":
+        """Returns the asset manager shared by the engine and the components.
+        """
+        if AssetManager.default is None:
+            AssetManager.default = AssetManager()
+        return AssetManager.default
+
+    @staticmethod
+    def convert(surface: pg.Surface) -> pg.Surface:
+        """Converts the surface to the display format, keeping per-pixel alpha if it has any.
+
+        Returns the surface unchanged while there is no display.
+        """
+        if pg.display.get_surface() is None:
+            return surface
+        if surface.get_flags() & pg.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def preload(self, loader: AssetLoader, path: str) -> Future:
+        """Loads the image in the background. It is converted on the first get() or acquire().
+        """
+        key = AssetManager._key(path)
+        future = self._pending.get(key)
+        if future is None and key not in self._surfaces:
+            future = self._pending[key] = loader.image(path)
+        return future
+
+    def get(self, path: str) -> pg.Surface:
+        """Returns the image without taking a reference. The surface must not be modified.
+        """
+        key = AssetManager._key(path)
+        surface = self._load(key, path)
+        self._evict(key)
+        return surface
+
+    def acquire(self, path: str) -> pg.Surface:
+        """Returns the image and takes a reference to it, so it stays cached until release() is called.
+        """
+        key = AssetManager._key(path)
+        surface = self._load(key, path)
+        # The reference is taken before evicting, so the acquired image is never dropped.
+        self._refs[key] = self._refs.get(key, 0) + 1
+        self._evict()
+        return surface
+
+    def _load(self, key: str, path: str) -> pg.Surface:
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        future = self._pending.pop(key, None)
+        surface = future.result() if future is not None else pg.image.load(path)
+        surface = AssetManager.convert(surface)
+        self._surfaces[key] = surface
+        self.memory += AssetManager.get_size(surface)
+        return surface
+
+    def release(self, path: str):
+        """Releases a reference taken by acquire().
+        """
+        key = AssetManager._key(path)
+        count = self._refs.get(key, 0) - 1
+        if count < 0:
+            raise Exception(f"Asset released more times than acquired: {path}")
+        if count == 0:
+            del self._refs[key]
+            self._evict()
+        else:
+            self._refs[key] = count
+
+    def clear(self):
+        """Drops all unreferenced images.
+        """
+        for key in [key for key in self._surfaces if key not in self._refs]:
+            self._drop(key)
+
+    def _evict(self, protected: str | None = None):
+        """Drops least recently used unreferenced images until the cache fits the budget.
+
+        Args:
+            protected   Key of an image that is kept even if unreferenced, e.g. the one just returned by get().
+        """
+        if self.memory <= self.budget:
+            return
+        for key in list(self._surfaces):
+            if self.memory <= self.budget:
+                break
+            if key not in self._refs and key != protected:
+                self._drop(key)
+                self.evictions += 1
+        if self.memory > self.budget:
+            logging.warning(f"Assets in use take {self.memory} bytes, over the budget of {self.budget}")
+
+    def _drop(self, key: str):
+        surface = self._surfaces.pop(key)
+        self.memory -= AssetManager.get_size(surface)
+
+    @staticmethod
+    def get_size(surface: pg.Surface) -> int:
+        """Returns the size of the pixels of the surface in bytes.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def stats(self) -> dict[str, int | float]:
+        requests = self.hits + self.misses
+        return {
+            "assets": len(self._surfaces),
+            "referenced": len(self._refs),
+            "memory": self.memory,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+        }
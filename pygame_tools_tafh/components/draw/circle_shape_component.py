@@ -1,17 +1,55 @@
 from .draw import circle
+from .shape_cache import rasterize
 from .shape_component import ShapeComponent
-from ...core.game_object import GameObject
+from ...core.spatial import Bounds
 from ...vmath.vector import Vector2d
+import math
 import pygame
 
 
 class CircleShapeComponent(ShapeComponent):
-    def __init__(self, color: tuple[int, int, int], radius: float):
-        super().__init__(color)
+    """Circle centered at the game object position.
+
+    radius  Radius of the circle.
+    """
+
+    def __init__(self, color: tuple[int, int, int], radius: float, width: int = 0, cached: bool = False, antialias: bool = False):
+        super().__init__(color, width, cached, antialias)
         self.radius = radius
 
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    @radius.setter
+    def radius(self, value: float):
+        self._radius = value
+        self.invalidate()
+
     def draw(self):
-        circle(self.game_object, Vector2d(0, 0), self.radius, self.color)
+        if self.cached:
+            self.draw_cached()
+        else:
+            circle(self.game_object, Vector2d(0, 0), self.radius, self.color, self.width)
+
+    def cache_key(self):
+        return self._radius
+
+    def rasterize(self, zoom: float) -> pygame.Surface:
+        radius = self._radius * zoom
+        diameter = max(1, math.ceil(radius * 2))
+        return rasterize(
+            (diameter, diameter),
+            self.antialias,
+            lambda surface, scale: pygame.draw.circle(
+                surface, self.color, (diameter * scale / 2, diameter * scale / 2), radius * scale, self.width * scale
+            )
+        )
+
+    def get_bounds(self) -> Bounds | None:
+        center = self.game_object.transform.world_position
+        radius = self._radius
+        return center.x - radius, center.y - radius, center.x + radius, center.y + radius
 
     def interception(self, position: Vector2d) -> bool:
-        return position.mod() <= self.radius
\ No newline at end of file
+        return position.length_squared() <= self.radius * self.radius
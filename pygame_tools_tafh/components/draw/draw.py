@@ -1,26 +1,39 @@
 import pygame
 from ...core.game_object import GameObject
+from ...core.camera import Viewport
 from ...vmath import Vector2d
 
 
+def _project(go: GameObject, position: Vector2d) -> tuple[float, float]:
+    """Projects a position relative to the game object to the display using the current viewport.
+    """
+    viewport = Viewport.current
+    origin = go.transform.render_position
+    return (
+        (origin.x + position.x) * viewport.zoom + viewport.offset_x,
+        (origin.y + position.y) * viewport.zoom + viewport.offset_y
+    )
+
 def circle(go: GameObject, position: Vector2d, radius: int, color: tuple[int, int, int] = (255, 255, 255), width: int = 0):
     """Draws a circle relative to the game object position.
     """
     pygame.draw.circle(
         pygame.display.get_surface(),
         color,
-        (go.get_relative_coords() + position).as_tuple(),
-        radius,
+        _project(go, position),
+        radius * Viewport.current.zoom,
         width
     )
 
 def rect(go: GameObject, position: Vector2d, size: Vector2d, color: tuple[int, int, int] = (255, 255, 255), width: int = 0):
     """Draws a rectangle relative to the game object position.
     """
+    zoom = Viewport.current.zoom
+    x, y = _project(go, position)
     pygame.draw.rect(
         pygame.display.get_surface(),
         color,
-        (go.get_relative_coords() + position - size / 2).as_tuple() + size.as_tuple(),
+        (x - size.x * zoom / 2, y - size.y * zoom / 2, size.x * zoom, size.y * zoom),
         width
     )
 
@@ -30,18 +43,20 @@ def line(go: GameObject, start: Vector2d, end: Vector2d, color: tuple[int, int,
     pygame.draw.line(
         pygame.display.get_surface(),
         color,
-        (go.get_relative_coords() + start).as_tuple(),
-        (go.get_relative_coords() + end).as_tuple(),
+        _project(go, start),
+        _project(go, end),
         width
     )
 
 def arc(go: GameObject, position: Vector2d, radius1: int, radius2: int, start_angle: float, end_angle: float, color: tuple[int, int, int] = (255, 255, 255), width: int = 0):
     """Draws an arc relative to the game object position.
     """
+    zoom = Viewport.current.zoom
+    x, y = _project(go, position)
     pygame.draw.arc(
         pygame.display.get_surface(),
         color,
-        (go.get_relative_coords() + position - Vector2d(radius1, radius2)).as_tuple() + (radius1 * 2, radius2 * 2),
+        (x - radius1 * zoom, y - radius2 * zoom, radius1 * 2 * zoom, radius2 * 2 * zoom),
         start_angle,
         end_angle,
         width
@@ -53,16 +68,18 @@ def polygon(go: GameObject, points: list[Vector2d], color: tuple[int, int, int]
     pygame.draw.polygon(
         pygame.display.get_surface(),
         color,
-        [(go.get_relative_coords() + point).as_tuple() for point in points],
+        [_project(go, point) for point in points],
         width
     )
 
 def ellipse(go: GameObject, position: Vector2d, size: Vector2d, color: tuple[int, int, int] = (255, 255, 255), width: int = 0):
     """Draws an ellipse relative to the game object position.
     """
+    zoom = Viewport.current.zoom
+    x, y = _project(go, position)
     pygame.draw.ellipse(
         pygame.display.get_surface(),
         color,
-        (go.get_relative_coords() + position - size / 2).as_tuple() + size.as_tuple(),
+        (x - size.x * zoom / 2, y - size.y * zoom / 2, size.x * zoom, size.y * zoom),
         width
-    )
\ No newline at end of file
+    )
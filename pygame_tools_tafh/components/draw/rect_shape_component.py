@@ -1,20 +1,61 @@
+import math
 import pygame
 
 from .draw import rect
+from .shape_cache import rasterize
 from .shape_component import ShapeComponent
-from ...core.game_object import GameObject
+from ...core.transform import TrackedVector
+from ...core.spatial import Bounds
 from ...vmath.vector import Vector2d
 
 
 class RectShapeComponent(ShapeComponent):
+    """Rectangle centered at the game object position.
 
-    def __init__(self, color: tuple[int, int, int], size: Vector2d):
-        super().__init__(color)
+    size    Size of the rectangle. Changing its components in place resizes the rectangle too.
+    """
+
+    def __init__(self, color: tuple[int, int, int], size: Vector2d, width: int = 0, cached: bool = False, antialias: bool = False):
+        super().__init__(color, width, cached, antialias)
         self.size = size
 
+    @property
+    def size(self) -> Vector2d:
+        return self._size
+
+    @size.setter
+    def size(self, value: Vector2d):
+        # Copy into a tracked vector, so changes of size.x and size.y are noticed as well.
+        self._size = TrackedVector(self, value.x, value.y)
+        self.invalidate()
+
+    def clone(self) -> "RectShapeComponent":
+        component = super().clone()
+        component._size = TrackedVector(component, self._size.x, self._size.y)
+        return component
+
     def draw(self):
-        rect(self.game_object, Vector2d(0, 0), self.size, self.color)
+        if self.cached:
+            self.draw_cached()
+        else:
+            rect(self.game_object, Vector2d(0, 0), self.size, self.color, self.width)
+
+    def cache_key(self):
+        return self._size.x, self._size.y
+
+    def rasterize(self, zoom: float) -> pygame.Surface:
+        size = (max(1, math.ceil(self._size.x * zoom)), max(1, math.ceil(self._size.y * zoom)))
+        return rasterize(
+            size,
+            self.antialias,
+            lambda surface, scale: pygame.draw.rect(surface, self.color, surface.get_rect(), self.width * scale)
+        )
+
+    def get_bounds(self) -> Bounds | None:
+        center = self.game_object.transform.world_position
+        half_x = self._size.x / 2
+        half_y = self._size.y / 2
+        return center.x - half_x, center.y - half_y, center.x + half_x, center.y + half_y
 
     def interception(self, position: Vector2d) -> bool:
-        temp = position.operation(self.size, lambda a, b: -b/2 <= a <= b/2)
-        return bool(temp.x) and bool(temp.y)
\ No newline at end of file
+        return abs(position.x) <= self.size.x / 2 and abs(position.y) <= self.size.y / 2
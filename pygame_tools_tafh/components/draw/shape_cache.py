@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from typing import Callable, Hashable
+import pygame
+
+
+class ShapeCache:
+    """Least recently used cache of pre-rasterized shapes, shared by all cached shape components.
+
+    capacity    Maximum number of kept surfaces.
+    hits        Number of get() calls served from the cache.
+    misses      Number of get() calls that rasterized the shape.
+    """
+    capacity: int
+    hits: int
+    misses: int
+    _surfaces: OrderedDict[Hashable, pygame.Surface]
+
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def get(self, key: Hashable, rasterize: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Returns the surface cached under the key, or stores the result of rasterize().
+        """
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = rasterize()
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+def rasterize(size: tuple[int, int], antialias: bool, draw: Callable[[pygame.Surface, float], None]) -> pygame.Surface:
+    """Creates a transparent surface and draws a shape on it.
+
+    Args:
+        size        Size of the surface.
+        antialias   Draw at a higher resolution and scale down, to smooth the edges.
+        draw        Draws the shape on the surface given as the first argument, with coordinates multiplied by
+                    the scale given as the second.
+    """
+    if not antialias:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        draw(surface, 1)
+        return surface
+
+    scale = 4
+    surface = pygame.Surface((size[0] * scale, size[1] * scale), pygame.SRCALPHA)
+    draw(surface, scale)
+    return pygame.transform.smoothscale(surface, size)
+
+
+shape_cache = ShapeCache()
@@ -1,25 +1,127 @@
-from ...core.game_object import Component
+from typing import Hashable
+import pygame
+
+from ...core.game_object import Component, GameObject
+from ...core.camera import Viewport
+from ...core.spatial import Bounds
+from ...core.sprite_batch import SpriteBatch
 from ...vmath.vector import Vector2d
+from .shape_cache import shape_cache
 
 
 class ShapeComponent(Component):
     """Generic class for the components that represent geometric shapes.
 
-    color   Fill color of the shape.
+    World bounds of shapes are kept in GameObject.spatial_index, which is used for hit-testing and culling.
+
+    Cached shapes are rasterized once into a surface shared through shape_cache and blitted through SpriteBatch,
+    instead of being drawn with pygame.draw every frame. The surface is looked up again only after a property of
+    the shape or the zoom changes.
+
+    color       Fill color of the shape.
+    width       Width of the outline in pixels. The shape is filled if 0.
+    cached      If true, the shape is drawn from a pre-rasterized surface. Always false for shapes that don't
+                implement rasterize(), which are drawn with draw() instead.
+    antialias   Smooth the edges of the cached surface.
     """
-    def __init__(self, color: tuple[int, int, int]):
+    _color: tuple[int, int, int]
+    _width: int = 0
+    _cached: bool = False
+    _antialias: bool = False
+    _surface: tuple[float, pygame.Surface] | None = None
+
+    def __init__(self, color: tuple[int, int, int], width: int = 0, cached: bool = False, antialias: bool = False):
         self.color = color
+        self.width = width
+        self.cached = cached
+        self.antialias = antialias
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        return self._color
+
+    @color.setter
+    def color(self, value: tuple[int, int, int]):
+        self._color = value
+        self.invalidate()
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @width.setter
+    def width(self, value: int):
+        self._width = value
+        self.invalidate()
+
+    @property
+    def cached(self) -> bool:
+        return self._cached and self.can_rasterize()
+
+    @cached.setter
+    def cached(self, value: bool):
+        self._cached = value
+        self.batched = self.cached
+        self._surface = None
+
+    def can_rasterize(self) -> bool:
+        """Checks if the shape implements rasterize(), so it can be cached.
+        """
+        return type(self).rasterize is not ShapeComponent.rasterize
+
+    @property
+    def antialias(self) -> bool:
+        return self._antialias
+
+    @antialias.setter
+    def antialias(self, value: bool):
+        self._antialias = value
+        self.invalidate()
+
+    def invalidate(self):
+        """Drops the cached surface and updates the bounds after a property of the shape changed.
+        """
+        self._surface = None
+        GameObject.spatial_index.mark(self)
 
     def draw(self):
         pass
 
+    def cache_key(self) -> Hashable:
+        """Returns parameters of the shape other than color and width, used to find its cached surface.
+        """
+        return None
+
+    def rasterize(self, zoom: float) -> pygame.Surface:
+        """Draws the shape centered on a new surface. Shapes that don't override it are never cached.
+        """
+        raise NotImplementedError()
+
+    def get_surface(self, zoom: float) -> pygame.Surface:
+        """Returns the pre-rasterized shape for the zoom.
+        """
+        cached = self._surface
+        if cached is None or cached[0] != zoom:
+            key = (type(self), self.cache_key(), self._color, self._width, self._antialias, zoom)
+            cached = self._surface = (zoom, shape_cache.get(key, lambda: self.rasterize(zoom)))
+        return cached[1]
+
+    def draw_cached(self):
+        viewport = Viewport.current
+        surface = self.get_surface(viewport.zoom)
+        x, y = viewport.to_screen(self.game_object.transform.render_position)
+        SpriteBatch.blit(surface, (x - surface.get_width() / 2, y - surface.get_height() / 2))
+
+    def get_bounds(self) -> Bounds | None:
+        return None
+
     def interception(self, position: Vector2d) -> bool:
         """Checks if position is inside of the shape.
-        
+
         Args:
             position: Position to check.
-        
+
         Returns:
             True if the position is inside of the shape, False otherwise.
         """
-        return False
\ No newline at end of file
+        return False
@@ -1,24 +1,94 @@
 from ...core.game_object import Component, GameObject
+from ...core.camera import Viewport
+from ...core.spatial import Bounds
+from ...core.sprite_batch import SpriteBatch
+from ...asset_manager import AssetManager
 import pygame as pg
 from ...vmath import Vector2d
 
 class SurfaceComponent(Component):
     """Necessary component to handle everything with game_object's display
 
-    pg_surf     Associated pygame.Surface 
+    Surfaces are drawn through SpriteBatch. The screen position is cached until the game object moves (see
+    Transform.revision), the surface changes or the projection of the viewport changes.
+
+    Given a path instead of a surface, the image is taken from AssetManager.default in the display format and
+    shared with every other component showing it, until the component is destroyed or pg_surf is replaced.
+
+    pg_surf     Associated pygame.Surface
+    asset       Path of the image shown, or None if pg_surf was given directly.
     """
-    pg_surf: pg.Surface
+    batched = True
+
+    _pg_surf: pg.Surface
+    _dest: tuple | None = None
+    asset: str | None = None
 
-    def __init__(self, surface: pg.Surface, pos: Vector2d = Vector2d(0, 0)):
+    def __init__(self, surface: pg.Surface | str, pos: Vector2d | None = None):
         super().__init__()
-        self.pg_surf = surface
+        if isinstance(surface, str):
+            self.pg_surf = AssetManager.get_default().acquire(surface)
+            self.asset = surface
+        else:
+            self.pg_surf = surface
+
+    def destroy(self):
+        self._release_asset()
+
+    def _release_asset(self):
+        if self.asset is not None:
+            AssetManager.get_default().release(self.asset)
+            self.asset = None
+
+    def clone(self) -> "SurfaceComponent":
+        component = super().clone()
+        component._dest = None
+        if component.asset is not None:
+            AssetManager.get_default().acquire(component.asset)
+        return component
+
+    @property
+    def pg_surf(self) -> pg.Surface:
+        return self._pg_surf
+
+    @pg_surf.setter
+    def pg_surf(self, surface: pg.Surface):
+        self._release_asset()
+        self._pg_surf = surface
+        GameObject.spatial_index.mark(self)
+
+    def get_scaled(self, zoom: float) -> pg.Surface:
+        """Returns pg_surf scaled by the zoom of a viewport. The last scaled surface is reused.
+        """
+        if zoom == 1:
+            return self.pg_surf
+        cached = getattr(self, "_scaled", None)
+        if cached is None or cached[0] is not self.pg_surf or cached[1] != zoom:
+            size = (round(self.pg_surf.get_width() * zoom), round(self.pg_surf.get_height() * zoom))
+            cached = (self.pg_surf, zoom, pg.transform.scale(self.pg_surf, size))
+            self._scaled = cached
+        return cached[2]
+
+    def get_bounds(self) -> Bounds | None:
+        center = self.game_object.transform.world_position
+        half_x = self.pg_surf.get_width() / 2
+        half_y = self.pg_surf.get_height() / 2
+        return center.x - half_x, center.y - half_y, center.x + half_x, center.y + half_y
 
     def draw(self):
-        display = pg.display.get_surface()
-
-        pos = self.game_object.get_absolute_coords() - GameObject.get_by_tag("camera").position + Vector2d.from_tuple(pg.display.get_window_size()) / 2
-        top_left = pos - Vector2d(self.pg_surf.get_width() / 2, self.pg_surf.get_height() / 2)
-        display.blit(
-            self.pg_surf, 
-            top_left.as_tuple() + (self.pg_surf.get_width(), self.pg_surf.get_height())
-        )
\ No newline at end of file
+        viewport = Viewport.current
+        surface = self.get_scaled(viewport.zoom)
+        transform = self.game_object.transform
+        position = transform.render_position
+        dest = self._dest
+        if (dest is None or dest[0] is not viewport.projection or dest[1] is not surface or dest[2] is not position
+                or dest[3] != transform.revision):
+            x, y = viewport.to_screen(position)
+            dest = self._dest = (
+                viewport.projection,
+                surface,
+                position,
+                transform.revision,
+                (x - surface.get_width() / 2, y - surface.get_height() / 2)
+            )
+        SpriteBatch.blit(surface, dest[4])
@@ -1,14 +1,22 @@
 from ..core.game_object import GameObject, Component
+from ..input import Input, KeyEdge
 from typing import Callable, Any
-import pygame as pg
 
 
 class KeybindComponent(Component):
+    """Calls a function when some of the listened keys are pressed, released or held.
+
+    The keys are bound through Input, so the component costs nothing in frames when its keys don't change.
+
+    cmd             Function called with the game object and the list of active keys.
+    listen          Keys to listen to.
+    listen_for_hold If true, cmd is called every frame while some of the keys are held.
+    on_press        If listen_for_hold is false: call cmd when the keys are pressed if true, when they are released otherwise.
+    """
     cmd: Callable[[GameObject, list[int]], Any]
     listen: list[int]
     listen_for_hold: bool
     on_press: bool
-    previous: list[int]
 
 
     def __init__(self, listen: list[int], cmd: Callable[[GameObject, list[int]], Any], listen_for_hold: bool = False, on_press: bool = True):
@@ -16,22 +24,18 @@ class KeybindComponent(Component):
         self.listen_for_hold = listen_for_hold
         self.on_press = on_press
         self.cmd = cmd
-    
-    def update(self):
-        keys = pg.key.get_pressed()
-        listen_keys = []
-        
-        for i in self.listen:
-            if keys[i]: listen_keys.append(i)
-
-        active_keys = []
-        if not self.listen_for_hold:
-            for i in self.listen:
-                if (self.on_press == (i in listen_keys) == (not (i in self.previous))):
-                    active_keys.append(i)
-            self.previous = listen_keys.copy()
+
+    def init(self, go: GameObject):
+        super().init(go)
+        if self.listen_for_hold:
+            edge = KeyEdge.HELD
         else:
-            active_keys = listen_keys
-        
-        if len(active_keys) != 0:
-            self.cmd(self.game_object, active_keys)
\ No newline at end of file
+            edge = KeyEdge.PRESSED if self.on_press else KeyEdge.RELEASED
+        Input.bind(self, self.listen, edge, self._on_keys)
+
+    def _on_keys(self, keys: list[int]):
+        if self.game_object.active:
+            self.cmd(self.game_object, keys)
+
+    def destroy(self):
+        Input.unbind(self)
@@ -1,28 +1,35 @@
 from ..core.game_object import GameObject
 from ..core.game_object import Component
+from ..input import Input
 import pygame as pg
 
 
 class MovementComponent(Component):
     """Binds position of the camera to the position of the game object. Also implements basic camera movement.
+
+    speed       Movement speed in units per update, or in units per second if per_second is set.
+    per_second  Scales the movement by the time step, so the speed doesn't depend on the frame or step rate.
     """
     speed: float
+    per_second: bool
 
-    def __init__(self, speed):
+    def __init__(self, speed, per_second: bool = False):
         super().__init__()
         self.speed = speed
+        self.per_second = per_second
 
-    def update(self):
-        pressed = pg.key.get_pressed()
+    def update(self, dt: float = 0):
+        held = Input.held
         camera = GameObject.get_by_tag("camera")
+        distance = self.speed * dt / 1000 if self.per_second else self.speed
 
-        if pressed[pg.K_w]:
-            self.game_object.position.y -= self.speed
-        if pressed[pg.K_s]:
-            self.game_object.position.y += self.speed
-        if pressed[pg.K_a]:
-            self.game_object.position.x -= self.speed
-        if pressed[pg.K_d]:
-            self.game_object.position.x += self.speed
+        if pg.K_w in held:
+            self.game_object.position.y -= distance
+        if pg.K_s in held:
+            self.game_object.position.y += distance
+        if pg.K_a in held:
+            self.game_object.position.x -= distance
+        if pg.K_d in held:
+            self.game_object.position.x += distance
 
         camera.position = self.game_object.position
\ No newline at end of file
@@ -1,38 +1,79 @@
 from typing import Callable
-import pygame
 
 from ...vmath.vector import Vector2d
 from ..draw.shape_component import ShapeComponent
-from ...core.game_object import Component
+from ...core.game_object import Component, GameObject
+from ...core.spatial import Bounds
 
 
 class ClickableComponent(Component):
     """Clickable component with its own shape.
 
+    Clicks are routed by ClickableComponent.dispatch(), which the engine calls once per frame: only the topmost
+    clickable object under the cursor receives the click.
+
     cmd     Function that will be called when button is clicked.
     once    To call the function only once when clicked.
     """
 
     cmd: Callable
     once: bool
-    _clicked: bool
+
+    _pressed: bool = False
 
     def __init__(self, cmd: Callable, once: bool, *args):
         self.cmd = cmd
         self.once = once
         self.args = args
 
-    def update(self):
-        if pygame.mouse.get_pressed(3)[0]: # 0 - Left Mouse Button
-            pos = Vector2d.from_tuple(pygame.mouse.get_pos()) - self.game_object.get_relative_coords()
-
-            if self.game_object.get_component(ShapeComponent).interception(pos) and not self._clicked:
-                self.cmd(self.args)
-            if self.once: 
-                self._clicked = True
-        else:
-            self._clicked = False
-
     def draw(self):
         self.game_object.get_component(ShapeComponent).draw()
 
+    def get_bounds(self) -> Bounds | None:
+        if not self.game_object.contains_component(ShapeComponent):
+            return None
+        return self.game_object.get_component(ShapeComponent).get_bounds()
+
+    @staticmethod
+    def pick(position: Vector2d) -> GameObject | None:
+        """Finds the topmost active clickable game object whose shape contains the position.
+
+        Args:
+            position    World coordinates.
+        """
+        index = GameObject.spatial_index
+        index.sync()
+
+        picked = None
+        for shape in index.query_point(position.x, position.y):
+            if not isinstance(shape, ShapeComponent):
+                continue
+            go = shape.game_object
+            if not go.active or not go.contains_component(ClickableComponent):
+                continue
+            if picked is not None and go.z_index > picked.z_index:
+                continue
+            if shape.interception(position - go.transform.world_position):
+                picked = go
+        return picked
+
+    @staticmethod
+    def dispatch(position: Vector2d | None, pressed: bool):
+        """Routes the state of the left mouse button to the clickable object under the cursor.
+
+        Args:
+            position    Cursor position in world coordinates. Not needed while the button is released.
+            pressed     If the left mouse button is held.
+        """
+        if not pressed:
+            ClickableComponent._pressed = False
+            return
+        first = not ClickableComponent._pressed
+        ClickableComponent._pressed = True
+
+        go = ClickableComponent.pick(position)
+        if go is None:
+            return
+        for clickable in go.get_components(ClickableComponent):
+            if first or not clickable.once:
+                clickable.cmd(clickable.args)
@@ -0,0 +1,121 @@
+from collections import OrderedDict
+import pygame
+
+_fonts: dict[tuple[str, int], pygame.font.Font] = {}
+
+
+def get_font(name: str, size: int) -> pygame.font.Font:
+    """Returns a system font. Fonts are loaded once and shared, since pygame.font.SysFont scans system fonts.
+
+    Args:
+        name    Name of the font.
+        size    Size of the font in pixels.
+    """
+    font = _fonts.get((name, size))
+    if font is None:
+        font = _fonts[(name, size)] = pygame.font.SysFont(name, size)
+    return font
+
+
+class TextCache:
+    """Least recently used cache of rendered text surfaces.
+
+    capacity    Maximum number of kept surfaces.
+    hits        Number of render() calls served from the cache.
+    misses      Number of render() calls that rendered the text.
+    """
+    capacity: int
+    hits: int
+    misses: int
+    _surfaces: OrderedDict[tuple, pygame.Surface]
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font: pygame.font.Font, text: str, color: tuple[int, int, int], antialias: bool = True) -> pygame.Surface:
+        """Same as font.render(), but returns the same surface for the same arguments. It must not be modified.
+        """
+        key = (font, text, color, antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color)
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+class GlyphAtlas:
+    """Renders text by composing glyphs that are rendered once per character.
+
+    Much cheaper than font.render() for text that changes often but uses few characters, like score or FPS
+    counters. Kerning is not applied.
+
+    Atlases are shared per font, color and antialias setting. At most capacity of them are kept; the least
+    recently used one is dropped first, so animated text colors don't keep glyphs alive forever.
+    """
+    capacity: int = 64
+    _atlases: OrderedDict[tuple, "GlyphAtlas"] = OrderedDict()
+
+    font: pygame.font.Font
+    color: tuple[int, int, int]
+    antialias: bool
+    _glyphs: dict[str, pygame.Surface]
+
+    def __init__(self, font: pygame.font.Font, color: tuple[int, int, int], antialias: bool = True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self._glyphs = {}
+
+    @staticmethod
+    def get(font: pygame.font.Font, color: tuple[int, int, int], antialias: bool = True) -> "GlyphAtlas":
+        """Returns the shared atlas of the font and color.
+        """
+        key = (font, color, antialias)
+        atlases = GlyphAtlas._atlases
+        atlas = atlases.get(key)
+        if atlas is not None:
+            atlases.move_to_end(key)
+            return atlas
+
+        atlas = atlases[key] = GlyphAtlas(font, color, antialias)
+        if len(atlases) > GlyphAtlas.capacity:
+            atlases.popitem(last=False)
+        return atlas
+
+    def get_glyph(self, char: str) -> pygame.Surface:
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, self.antialias, self.color)
+            if pygame.display.get_surface() is not None:
+                glyph = glyph.convert_alpha()
+            self._glyphs[char] = glyph
+        return glyph
+
+    def render(self, text: str) -> pygame.Surface:
+        glyphs = [self.get_glyph(char) for char in text]
+        surface = pygame.Surface(
+            (sum(glyph.get_width() for glyph in glyphs), self.font.get_height()),
+            pygame.SRCALPHA
+        )
+        x = 0
+        sprites = []
+        for glyph in glyphs:
+            sprites.append((glyph, (x, 0)))
+            x += glyph.get_width()
+        surface.blits(sprites, False)
+        return surface
+
+
+text_cache = TextCache()
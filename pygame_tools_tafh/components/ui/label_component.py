@@ -1,22 +1,72 @@
 import pygame
 from ..draw.surface_component import SurfaceComponent
+from ...core.game_object import GameObject
+from .fonts import get_font, text_cache, GlyphAtlas
 
 
 class LabelComponent(SurfaceComponent):
     """A component that represents one line of text.
 
+    Fonts and rendered texts are cached, so labels can be created and changed cheaply. The text is rendered
+    again only when it is drawn after text or color has changed.
+
     Attributes:
-        font    Pygame font object.
-        text    Content of thsis label.
-        color   Color of the text.
+        font        Pygame font object.
+        text        Content of thsis label.
+        color       Color of the text.
+        glyph_atlas If true, the text is composed from cached glyphs instead of rendered with the font. Suits
+                    labels that change every frame, like score and FPS counters.
     """
 
     font: pygame.font.Font
-    text: str
-    color: tuple[int, int, int]
-
-    def __init__(self, text: str, color: tuple[int, int, int], font_name="Arial", size=50):
-        self.font = pygame.font.SysFont(font_name, size)
-        self.text = text
-        self.color = color
-        self.pg_surf = self.font.render(self.text, True, self.color)
\ No newline at end of file
+    glyph_atlas: bool
+    _text: str
+    _color: tuple[int, int, int]
+    _stale: bool
+
+    def __init__(self, text: str, color: tuple[int, int, int], font_name="Arial", size=50, glyph_atlas: bool = False):
+        self.font = get_font(font_name, size)
+        self.glyph_atlas = glyph_atlas
+        self._text = text
+        self._color = color
+        self._pg_surf = None
+        self._stale = True
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        if value != self._text:
+            self._text = value
+            self._invalidate()
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        return self._color
+
+    @color.setter
+    def color(self, value: tuple[int, int, int]):
+        if value != self._color:
+            self._color = value
+            self._invalidate()
+
+    def _invalidate(self):
+        self._stale = True
+        GameObject.spatial_index.mark(self)
+
+    def _get_surf(self) -> pygame.Surface:
+        if self._stale:
+            self._stale = False
+            if self.glyph_atlas:
+                self._pg_surf = GlyphAtlas.get(self.font, self._color).render(self._text)
+            else:
+                self._pg_surf = text_cache.render(self.font, self._text, self._color)
+        return self._pg_surf
+
+    def _set_surf(self, surface: pygame.Surface):
+        self._stale = False
+        SurfaceComponent.pg_surf.fset(self, surface)
+
+    pg_surf = property(_get_surf, _set_surf)
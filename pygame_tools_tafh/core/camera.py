@@ -0,0 +1,102 @@
+import pygame as pg
+
+from .game_object import GameObject
+from ..vmath import Vector2d
+
+
+class Viewport:
+    """Region of the display that shows the world as seen by a camera game object.
+
+    The world-to-screen projection is computed once per frame by refresh(), draw helpers only read it.
+
+    camera      Tag of the game object used as camera.
+    rect        Region of the display in pixels. Whole window if None.
+    zoom        Scale factor applied to world coordinates.
+    offset_x    X offset added to scaled world coordinates, updated by refresh().
+    offset_y    Y offset added to scaled world coordinates, updated by refresh().
+    projection  (offset_x, offset_y, zoom). Replaced by a new tuple only when the projection changes, so it can be
+                used to validate cached screen positions.
+    """
+    current: "Viewport | None" = None
+
+    camera: str
+    rect: pg.Rect | None
+    zoom: float
+    offset_x: float
+    offset_y: float
+    projection: tuple[float, float, float]
+
+    def __init__(self, camera: str = "camera", rect: pg.Rect | None = None, zoom: float = 1.0):
+        self.camera = camera
+        self.rect = rect
+        self.zoom = zoom
+        self.offset_x = 0
+        self.offset_y = 0
+        self.projection = (0, 0, zoom)
+
+    def refresh(self):
+        """Recomputes the projection from the current camera position and display size.
+        """
+        if self.rect is None:
+            width, height = pg.display.get_window_size()
+            left, top = 0, 0
+        else:
+            left, top, width, height = self.rect
+
+        # Interpolated like every drawn object, so objects the camera follows stay centered.
+        camera = GameObject.get_by_tag(self.camera).transform.render_position
+        self.offset_x = left + width // 2 - camera.x * self.zoom
+        self.offset_y = top + height // 2 - camera.y * self.zoom
+        projection = (self.offset_x, self.offset_y, self.zoom)
+        if projection != self.projection:
+            self.projection = projection
+
+    def to_screen(self, position: Vector2d) -> tuple[float, float]:
+        """Projects world coordinates to the display.
+
+        Args:
+            position    World coordinates.
+
+        Returns:
+            Display coordinates.
+        """
+        return position.x * self.zoom + self.offset_x, position.y * self.zoom + self.offset_y
+
+    def to_world(self, position: tuple[float, float]) -> Vector2d:
+        """Projects display coordinates back to the world.
+
+        Args:
+            position    Display coordinates, e.g. from pygame.mouse.get_pos().
+
+        Returns:
+            World coordinates.
+        """
+        return Vector2d((position[0] - self.offset_x) / self.zoom, (position[1] - self.offset_y) / self.zoom)
+
+    def get_world_rect(self) -> tuple[float, float, float, float]:
+        """Returns the part of the world visible through the viewport as (left, top, right, bottom).
+        """
+        if self.rect is None:
+            width, height = pg.display.get_window_size()
+            left, top = 0, 0
+        else:
+            left, top, width, height = self.rect
+        return (
+            (left - self.offset_x) / self.zoom,
+            (top - self.offset_y) / self.zoom,
+            (left + width - self.offset_x) / self.zoom,
+            (top + height - self.offset_y) / self.zoom
+        )
+
+    def contains(self, position: tuple[float, float]) -> bool:
+        """Checks if display coordinates belong to this viewport.
+        """
+        if self.rect is None:
+            return True
+        return pg.Rect(self.rect).collidepoint(position)
+
+    def activate(self):
+        """Makes draw helpers project through this viewport.
+        """
+        Viewport.current = self
+        pg.display.get_surface().set_clip(self.rect)
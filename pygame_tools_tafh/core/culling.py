@@ -0,0 +1,55 @@
+from typing import Iterable
+
+from .game_object import GameObject
+from .camera import Viewport
+
+
+class Culler:
+    """Selects game objects that have to be drawn through a viewport.
+
+    An object is visible if the bounds of one of its components intersect the viewport, or if one of its drawing
+    components has no bounds. The visible list of every viewport is cached and rebuilt only after the camera,
+    the objects or the drawing order have changed.
+    """
+    _cache: dict[Viewport, tuple[tuple, list[GameObject]]]
+    _order: list[GameObject] | None
+    _ranks: dict[GameObject, int]
+
+    def __init__(self):
+        self._cache = {}
+        self._order = None
+        self._ranks = {}
+
+    def get_visible(self, viewport: Viewport) -> list[GameObject]:
+        """Returns visible game objects in drawing order. The returned list must not be modified.
+        """
+        index = GameObject.spatial_index
+        index.sync()
+        order = GameObject.render_queue.get_order()
+
+        rect = viewport.get_world_rect()
+        key = (rect, id(index), index.version, id(order))
+        cached = self._cache.get(viewport)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        objects = {}
+        for component in index.query_rect(*rect):
+            objects[component.game_object] = None
+        for component in index.unbounded:
+            objects[component.game_object] = None
+        visible = self.sort(objects)
+
+        self._cache[viewport] = (key, visible)
+        return visible
+
+    def sort(self, objects: Iterable[GameObject]) -> list[GameObject]:
+        """Returns the game objects in drawing order. Objects that aren't in the render queue are left out.
+        """
+        order = GameObject.render_queue.get_order()
+        if order is not self._order:
+            self._order = order
+            self._ranks = {obj: i for i, obj in enumerate(order)}
+        ranks = self._ranks
+        # Objects that were removed from the queue can still be tracked until they are destroyed.
+        return sorted((obj for obj in objects if obj in ranks), key=ranks.__getitem__)
@@ -0,0 +1,127 @@
+import math
+import pygame as pg
+
+from .game_object import GameObject, Timer
+from .camera import Viewport
+from .culling import Culler
+from .spatial import Bounds
+from .transform import Transform
+from .sprite_batch import SpriteBatch
+
+
+class DirtyRectRenderer:
+    """Redraws only the parts of the display that have changed since the previous frame.
+
+    Changes are collected by GameObject.spatial_index: old and new bounds of every component that moved, was
+    added, removed or marked (see GameObject.mark_changed()). Every damaged region is cleared and only the
+    objects overlapping it are redrawn, then the regions are presented with pygame.display.update().
+
+    A viewport is redrawn completely when its camera or zoom changes, when a drawing component without bounds
+    exists, when positions are interpolated (see Transform.interpolate) or when the damaged area exceeds
+    max_coverage of the viewport.
+
+    background      Color the damaged regions are cleared with.
+    max_coverage    Part of a viewport that may be damaged before it is redrawn completely.
+    padding         Pixels added around every damaged region, to cover rounding and antialiasing.
+    """
+    background: tuple[int, int, int]
+    max_coverage: float
+    padding: int
+    culler: Culler
+    batch: SpriteBatch
+    _keys: dict[Viewport, tuple]
+    _index: object | None
+
+    def __init__(self, culler: Culler, batch: SpriteBatch, background: tuple[int, int, int] = (0, 0, 0), max_coverage: float = 0.5, padding: int = 2):
+        self.culler = culler
+        self.batch = batch
+        self.background = background
+        self.max_coverage = max_coverage
+        self.padding = padding
+        self._keys = {}
+        self._index = None
+
+    def reset(self):
+        """Forces a complete redraw on the next frame.
+        """
+        self._keys = {}
+        self._index = None
+
+    def render(self, viewports: list[Viewport], timer: Timer | None = None):
+        """Draws all viewports and updates the changed parts of the display.
+
+        Args:
+            timer   Passed to GameObject.draw() of every drawn object.
+        """
+        index = GameObject.spatial_index
+        if index is not self._index or index.damage is None:
+            self.reset()
+            self._index = index
+            index.damage = []
+        index.sync()
+        damage = index.damage
+        index.damage = []
+
+        display = pg.display.get_surface()
+        self.batch.begin()
+        updated = []
+        for viewport in viewports:
+            viewport.refresh()
+            viewport.activate()
+            area = pg.Rect(viewport.rect) if viewport.rect is not None else display.get_rect()
+
+            key = (tuple(area), viewport.offset_x, viewport.offset_y, viewport.zoom)
+            if self._keys.get(viewport) != key or index.unbounded or Transform.interpolate:
+                self._keys[viewport] = key
+                self._redraw(viewport, display, area, timer)
+                updated.append(area)
+                continue
+
+            rects = self._project(viewport, damage, area)
+            if sum(rect.w * rect.h for rect in rects) > area.w * area.h * self.max_coverage:
+                self._redraw(viewport, display, area, timer)
+                updated.append(area)
+                continue
+
+            for rect in rects:
+                display.set_clip(rect)
+                display.fill(self.background, rect)
+                start = viewport.to_world(rect.topleft)
+                end = viewport.to_world(rect.bottomright)
+                objects = {component.game_object: None for component in index.query_rect(start.x, start.y, end.x, end.y)}
+                for obj in self.culler.sort(objects):
+                    obj.draw(timer)
+                self.batch.flush()
+            display.set_clip(viewport.rect)
+            updated.extend(rects)
+        self.batch.end()
+
+        if updated:
+            pg.display.update(updated)
+
+    def _redraw(self, viewport: Viewport, display: pg.Surface, area: pg.Rect, timer: Timer | None = None):
+        display.fill(self.background, area)
+        for obj in self.culler.get_visible(viewport):
+            obj.draw(timer)
+        self.batch.flush()
+
+    def _project(self, viewport: Viewport, damage: list[Bounds], area: pg.Rect) -> list[pg.Rect]:
+        """Projects damaged world bounds to the display, clipped to the viewport. Overlapping rects are merged.
+        """
+        zoom = viewport.zoom
+        padding = self.padding
+        rects = []
+        for left, top, right, bottom in damage:
+            x0 = math.floor(left * zoom + viewport.offset_x) - padding
+            y0 = math.floor(top * zoom + viewport.offset_y) - padding
+            x1 = math.ceil(right * zoom + viewport.offset_x) + padding
+            y1 = math.ceil(bottom * zoom + viewport.offset_y) + padding
+            rect = pg.Rect(x0, y0, x1 - x0, y1 - y0).clip(area)
+            if rect.w == 0 or rect.h == 0:
+                continue
+            i = rect.collidelist(rects)
+            while i != -1:
+                rect.union_ip(rects.pop(i))
+                i = rect.collidelist(rects)
+            rects.append(rect)
+        return rects
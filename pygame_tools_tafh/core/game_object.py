@@ -1,14 +1,35 @@
-from typing import TypeVar
+from typing import Any, Callable, TypeVar, Iterator
+from time import perf_counter_ns
+import inspect
 from ..vmath import Vector2d, Angle
+from .transform import Transform
+from .render_queue import RenderQueue
+from .spatial import SpatialIndex, Bounds
+from .sprite_batch import SpriteBatch
+from ..tween import Tween
 
-import pygame as pg
+# Receives a component, the name of the called method and the duration of the call in nanoseconds.
+Timer = Callable[["Component", str, int], Any]
 
 class Component:
     """Base class for all components.
 
     game_object     Associated GameObject.
+    batched         True if the component draws only through SpriteBatch.blit(). Components that override draw()
+                    are not batched unless they declare it.
+    takes_dt        True if update() accepts the time step. Detected automatically, so components written as
+                    update(self) keep working.
     """
     game_object: "GameObject"
+    batched: bool = True
+    takes_dt: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "draw" in cls.__dict__ and "batched" not in cls.__dict__:
+            cls.batched = False
+        if "update" in cls.__dict__ and "takes_dt" not in cls.__dict__:
+            cls.takes_dt = len(inspect.signature(cls.update).parameters) > 1
 
     def init(self, go: "GameObject"):
         self.game_object = go
@@ -16,12 +37,41 @@ class Component:
     def draw(self):
         pass
 
-    def update(self):
+    def update(self, dt: float = 0):
+        """Called once per simulation step.
+
+        Args:
+            dt  Length of the step in milliseconds.
+        """
         pass
 
     def destroy(self):
         pass 
 
+    def get_bounds(self) -> Bounds | None:
+        """Returns world-space bounding box of everything the component draws as (left, top, right, bottom).
+
+        Components that draw and return None are never culled.
+        """
+        return None
+
+    def clone(self) -> "Component":
+        """Returns a copy of the component that isn't attached to any game object yet.
+
+        Attributes are copied shallowly and __init__ isn't called, so cloning is cheap. Components that keep
+        mutable or object-specific state should override this method.
+        """
+        component = type(self).__new__(type(self))
+        component.__dict__.update(self.__dict__)
+        component.__dict__.pop("game_object", None)
+        return component
+
+    def is_spatial(self) -> bool:
+        """Checks if the component draws or has bounds, and so has to be kept in GameObject.spatial_index.
+        """
+        cls = type(self)
+        return cls.draw is not Component.draw or cls.get_bounds is not Component.get_bounds
+
 T = TypeVar("T")
 
 class GameObject:
@@ -29,91 +79,235 @@ class GameObject:
 
     active      If false, this game object won't be displayed and updated. The same is true for it's childs.
     tag         Tag of the object. There can't be two game objects with the same tag.
+    transform   Position of the object in the hierarchy, see Transform.
+    z_index     Drawing layer. Objects with greater z_index are drawn first.
+    destroyed   True once the object has been destroyed.
+
+    All game objects are kept in class-level registries, which belong to the loaded scene (see Registry).
+    objects is an insertion-ordered dict used as a set, so objects are added and removed in O(1).
     """
     components: list[Component]
     active: bool
+    destroyed: bool
     tag: str
     parent: "GameObject | None"
-    position: Vector2d
+    transform: Transform
     childs: list["GameObject"]
-    z_index: int
+    _z_index: int
+    _component_index: dict[type, list[Component]]
+
+    _next_tag: int = 0
+
+    deferring: bool = False
+    _pending: dict["GameObject", None] = {}
 
     tag_objects: dict[str, "GameObject"] = {}
-    objects: list["GameObject"] = []
+    objects: dict["GameObject", None] = {}
+    parked: dict["GameObject", None] = {}
+    render_queue: RenderQueue = RenderQueue()
+    component_objects: dict[type, dict["GameObject", None]] = {}
+    spatial_index: SpatialIndex = SpatialIndex()
 
     def __init__(self, tag: str):
         self.components = []
+        self._component_index = {}
         self.childs = []
         self.active = True
+        self.destroyed = False
         self.tag = tag
         self.parent = None
-        self.position = Vector2d(0, 0)
-        self.z_index = 0
+        self.transform = Transform(self)
+        self._z_index = 0
 
         if (self.tag in GameObject.tag_objects.keys()):
             raise Exception(f"Tried to create two object with same tag: {self.tag}")
-        GameObject.objects.append(self)
+        GameObject.objects[self] = None
+        GameObject.render_queue.add(self)
             
         GameObject.tag_objects[self.tag] = self
 
-    def draw(self):
+    def draw(self, timer: Timer | None = None):
+        """Draws all components.
+
+        Args:
+            timer   If given, called with every component, "draw" and the duration of the call in nanoseconds.
+        """
         if (not self.active): return
 
+        batch = SpriteBatch.current
         for component in self.components:
-            component.draw()
+            if batch is not None and batch.sprites and not component.batched:
+                batch.flush()
+            if timer is None:
+                component.draw()
+            else:
+                start = perf_counter_ns()
+                component.draw()
+                timer(component, "draw", perf_counter_ns() - start)
 
-    def update(self):
+    def update(self, dt: float = 0, timer: Timer | None = None):
+        """Updates all components.
+
+        Args:
+            dt      Length of the step in milliseconds.
+            timer   If given, called with every component, "update" and the duration of the call in nanoseconds.
+        """
         if (not self.active): return
         
         for i in self.components:
-            i.update()
+            if timer is not None:
+                start = perf_counter_ns()
+            if i.takes_dt:
+                i.update(dt)
+            else:
+                i.update()
+            if timer is not None:
+                timer(i, "update", perf_counter_ns() - start)
 
     def on_destroy(self):
         for i in self.components:
             i.destroy()
 
+        Tween.stop_target(self, self.transform, self.position, *self.components)
+
         for i in self.childs:
-            GameObject.destroy(i)
+            GameObject._destroy_now(i)
 
     def add_component(self, component: Component):
         component.init(self)
         self.components.append(component)
+
+        # Index the component under all of its base classes, so that subclass lookups stay O(1).
+        for cls in type(component).__mro__[:-1]:
+            components = self._component_index.get(cls)
+            if components is None:
+                self._component_index[cls] = [component]
+                GameObject.component_objects.setdefault(cls, {})[self] = None
+            else:
+                components.append(component)
+
+        if component.is_spatial():
+            GameObject.spatial_index.track(component)
         return self
 
     def get_component(self, component: type[T]) -> T:
-        for i in self.components:
-            if isinstance(i, component):
-                return i
-        raise Exception(f"No such component: {component}")
-    
-    def contains_component(self, component: type[T]) -> T:
-        for i in self.components:
-            if isinstance(i, component):
-                return True
-        return False
+        components = self._component_index.get(component)
+        if components is None:
+            raise Exception(f"No such component: {component}")
+        return components[0]
+
+    def get_components(self, component: type[T]) -> list[T]:
+        """Returns all components of the given type (including subclasses) in the order they were added.
+        """
+        return list(self._component_index.get(component, ()))
+
+    def contains_component(self, component: type[T]) -> bool:
+        return component in self._component_index
+
+    @staticmethod
+    def query(*components: type) -> Iterator["GameObject"]:
+        """Iterates over all game objects that have components of every given type.
+
+        Only objects that have the rarest of the given components are visited.
+
+        Args:
+            components  Required component types.
+
+        Example:
+
+        for obj in GameObject.query(MovementComponent, RectShapeComponent):
+            ...
+        """
+        candidates = []
+        for component in components:
+            objects = GameObject.component_objects.get(component)
+            if not objects:
+                return
+            candidates.append(objects)
+        candidates.sort(key=len)
+
+        rest = candidates[1:]
+        for obj in list(candidates[0]):
+            if all(obj in objects for objects in rest):
+                yield obj
     
     def add_child(self, child: "GameObject"):
         child.parent = self
         self.childs.append(child)
+        if self.transform.store is not None:
+            self.transform.store.parents[self.transform.slot] = True
+        child.transform.invalidate()
         return self
 
     def set_active(self, active: bool):
         self.active = active
+        self.mark_changed()
+
+    def mark_changed(self):
+        """Reports that the appearance of the game object has changed, so that it is redrawn by dirty-rectangle
+        rendering. Moving the object and assigning properties of built-in components report it automatically.
+        """
+        for component in self.components:
+            GameObject.spatial_index.mark(component)
+
+    def clone(self, tag: str | None = None) -> "GameObject":
+        """Creates a copy of the game object with copies of its components and children, see Component.clone().
+
+        Args:
+            tag     Tag of the copy. Generated from the tag of this object if None, see unique_tag().
+        """
+        obj = GameObject(tag if tag is not None else GameObject.unique_tag(self.tag))
+        obj.active = self.active
+        obj.z_index = self._z_index
+        obj.transform.position = self.transform.position
+        for component in self.components:
+            obj.add_component(component.clone())
+        for child in self.childs:
+            obj.add_child(child.clone())
+        return obj
+
+    @staticmethod
+    def unique_tag(base: str) -> str:
+        """Generates a tag that isn't used by any game object, like "bullet#12".
+        """
+        while True:
+            GameObject._next_tag += 1
+            tag = f"{base}#{GameObject._next_tag}"
+            if tag not in GameObject.tag_objects:
+                return tag
+
+    @property
+    def position(self) -> Vector2d:
+        """Position relative to the parent. Can be modified in place or reassigned.
+        """
+        return self.transform.position
+
+    @position.setter
+    def position(self, value: Vector2d):
+        self.transform.position = value
 
-    def clone(self) -> "GameObject":
-        # TODO
-        raise NotImplemented()
+    @property
+    def z_index(self) -> int:
+        return self._z_index
+
+    @z_index.setter
+    def z_index(self, value: int):
+        if value == self._z_index:
+            return
+        old = self._z_index
+        self._z_index = value
+        if self in GameObject.render_queue.layers.get(old, ()):
+            GameObject.render_queue.move(self, old)
+        self.mark_changed()
 
     def get_absolute_coords(self):
         """Function to get absolute game_object's coordinates.
 
         Returns:
-            game_object's absolute coordinates.
+            game_object's absolute coordinates, as a new vector. Use transform.world_position to read them
+            without copying.
         """
-        if not self.parent:
-            return self.position
-        
-        return self.parent.get_absolute_coords() + self.position
+        return self.transform.world_position.copy()
     
     def get_relative_coords(self):
         """Function to get game_object's coordinates relative to center of viewport.
@@ -121,7 +315,7 @@ class GameObject:
         Returns:
             game_object's relative coordinates.
         """
-        return self.get_absolute_coords() - GameObject.get_by_tag("camera").position + Vector2d.from_tuple(pg.display.get_window_size()) // 2
+        return Vector2d.from_tuple(Viewport.current.to_screen(self.transform.world_position))
 
     @staticmethod
     def get_by_tag(tag: str) -> "GameObject":
@@ -131,9 +325,50 @@ class GameObject:
 
     @staticmethod
     def destroy(obj: "GameObject"):
-        GameObject.objects.remove(obj)
-        GameObject.tag_objects.pop(obj.tag)
+        """Destroys the game object and its children.
+
+        While deferring is set (the engine sets it for the duration of a frame), the object is only queued and
+        destroyed by flush_destroyed() at the end of the frame, so that no loop over game objects is disturbed.
+        """
+        if GameObject.deferring:
+            GameObject._pending[obj] = None
+        else:
+            GameObject._destroy_now(obj)
+
+    @staticmethod
+    def flush_destroyed():
+        """Destroys all game objects queued by destroy().
+        """
+        while GameObject._pending:
+            pending = GameObject._pending
+            GameObject._pending = {}
+            for obj in pending:
+                GameObject._destroy_now(obj)
+
+    @staticmethod
+    def _destroy_now(obj: "GameObject"):
+        if obj.destroyed:
+            return
+        obj.destroyed = True
+        GameObject.objects.pop(obj, None)
+        GameObject.parked.pop(obj, None)
+        if GameObject.tag_objects.get(obj.tag) is obj:
+            del GameObject.tag_objects[obj.tag]
+        GameObject.render_queue.remove(obj)
+        for cls in obj._component_index:
+            objects = GameObject.component_objects.get(cls)
+            if objects is not None and objects.pop(obj, 0) is None and not objects:
+                del GameObject.component_objects[cls]
+        for component in obj.components:
+            GameObject.spatial_index.untrack(component)
+        if obj.parent is not None and not obj.parent.destroyed:
+            obj.parent.childs.remove(obj)
         obj.on_destroy()
+        obj.transform.release()
 
     def __str__(self):
         return f"GameObject {self.tag}"
+
+
+# Imported last because the camera module depends on GameObject.
+from .camera import Viewport
@@ -0,0 +1,154 @@
+from .game_object import GameObject, Component
+from ..tween import Tween
+from ..vmath import Vector2d
+
+
+class Prefab:
+    """Template of a game object.
+
+    Instances get clones of the template components (see Component.clone()), so component constructors run only
+    once, when the prefab is created.
+
+    tag         Base of the tags of instances, see GameObject.unique_tag().
+    components  Template components. They are never attached to a game object, but may hold resources such as
+                asset references until destroy() is called.
+    z_index     z_index of instances.
+    children    Prefabs of the children of instances.
+
+    Example:
+
+    bullet = Prefab("bullet", [CircleShapeComponent((255, 255, 0), 3, cached=True), BulletComponent()])
+    bullet.instantiate(position=gun.get_absolute_coords())
+    """
+    tag: str
+    components: list[Component]
+    z_index: int
+    children: list["Prefab"]
+
+    def __init__(self, tag: str, components: list[Component], z_index: int = 0, children: list["Prefab"] | None = None):
+        self.tag = tag
+        self.components = components
+        self.z_index = z_index
+        self.children = children or []
+
+    @staticmethod
+    def from_object(obj: GameObject) -> "Prefab":
+        """Creates a prefab that produces copies of the game object in its current state.
+        """
+        return Prefab(
+            obj.tag,
+            [component.clone() for component in obj.components],
+            obj.z_index,
+            [Prefab.from_object(child) for child in obj.childs]
+        )
+
+    def instantiate(self, tag: str | None = None, position: Vector2d | None = None) -> GameObject:
+        """Creates a game object from the template.
+
+        Args:
+            tag         Tag of the object. Generated if None.
+            position    Position of the object.
+        """
+        obj = GameObject(tag if tag is not None else GameObject.unique_tag(self.tag))
+        obj.z_index = self.z_index
+        if position is not None:
+            obj.transform.position = position
+        for component in self.components:
+            obj.add_component(component.clone())
+        for child in self.children:
+            obj.add_child(child.instantiate())
+        return obj
+
+    def destroy(self):
+        """Destroys the template components, releasing what they hold. The prefab must not be instantiated after.
+        """
+        for component in self.components:
+            component.destroy()
+        for child in self.children:
+            child.destroy()
+
+
+class ObjectPool:
+    """Recycles game objects of a prefab instead of creating and destroying them.
+
+    Released objects are deactivated and taken out of updating, drawing, hit-testing and queries (they are moved
+    to GameObject.parked), but keep their components and their tags, so acquiring one again allocates nothing.
+
+    prefab  Prefab of the pooled objects.
+    free    Released objects, ready to be acquired.
+
+    Example:
+
+    bullets = ObjectPool(bullet, size=100)
+    obj = bullets.acquire(position)
+    ...
+    bullets.release(obj)
+    """
+    prefab: Prefab
+    free: list[GameObject]
+    _free: set[GameObject]
+
+    def __init__(self, prefab: Prefab, size: int = 0):
+        self.prefab = prefab
+        self.free = []
+        self._free = set()
+        for _ in range(size):
+            self.release(prefab.instantiate())
+
+    def acquire(self, position: Vector2d | None = None) -> GameObject:
+        """Returns a released object, or a new instance of the prefab if there is none.
+
+        Args:
+            position    Position of the object.
+        """
+        if not self.free:
+            return self.prefab.instantiate(position=position)
+
+        obj = self.free.pop()
+        self._free.discard(obj)
+        if position is not None:
+            obj.transform.position = position
+        ObjectPool._restore(obj)
+        return obj
+
+    def release(self, obj: GameObject):
+        """Deactivates the object and keeps it for reuse. The object must not be used until it is acquired again.
+
+        Raises:
+            Exception if the object has already been released.
+        """
+        if obj in self._free:
+            raise Exception(f"Object {obj.tag} has already been released to the pool")
+        ObjectPool._park(obj)
+        self.free.append(obj)
+        self._free.add(obj)
+
+    @staticmethod
+    def _park(obj: GameObject):
+        Tween.stop_target(obj, obj.transform, obj.position, *obj.components)
+        obj.set_active(False)
+        if GameObject.objects.pop(obj, 0) is None:
+            GameObject.parked[obj] = None
+        GameObject.render_queue.remove(obj)
+        for cls in obj._component_index:
+            objects = GameObject.component_objects.get(cls)
+            if objects is not None and objects.pop(obj, 0) is None and not objects:
+                del GameObject.component_objects[cls]
+        for component in obj.components:
+            GameObject.spatial_index.untrack(component)
+        for child in obj.childs:
+            ObjectPool._park(child)
+
+    @staticmethod
+    def _restore(obj: GameObject):
+        obj.active = True
+        if GameObject.parked.pop(obj, 0) is None:
+            GameObject.objects[obj] = None
+        GameObject.render_queue.add(obj)
+        for cls in obj._component_index:
+            GameObject.component_objects.setdefault(cls, {})[obj] = None
+        for component in obj.components:
+            if component.is_spatial():
+                GameObject.spatial_index.track(component)
+        for child in obj.childs:
+            ObjectPool._restore(child)
@@ -0,0 +1,92 @@
+from .game_object import GameObject
+from .render_queue import RenderQueue
+from .spatial import SpatialIndex
+from ..tween import Tween
+
+
+class Registry:
+    """All game objects of a scene together with their lookup structures.
+
+    The registry that is active is exposed through the class attributes of GameObject, so switching scenes only
+    swaps a few references.
+
+    objects             Game objects in creation order.
+    parked              Game objects kept by object pools, which are neither updated nor found by queries.
+    tag_objects         Game objects by tag.
+    render_queue        Drawing order.
+    component_objects   Game objects by component type.
+    spatial_index       Bounds of drawing components.
+    """
+    objects: dict[GameObject, None]
+    parked: dict[GameObject, None]
+    tag_objects: dict[str, GameObject]
+    render_queue: RenderQueue
+    component_objects: dict[type, dict[GameObject, None]]
+    spatial_index: SpatialIndex
+
+    def __init__(self):
+        self.objects = {}
+        self.parked = {}
+        self.tag_objects = {}
+        self.render_queue = RenderQueue()
+        self.component_objects = {}
+        self.spatial_index = SpatialIndex()
+
+    @staticmethod
+    def current() -> "Registry":
+        """Returns the active registry.
+        """
+        registry = Registry.__new__(Registry)
+        registry.objects = GameObject.objects
+        registry.parked = GameObject.parked
+        registry.tag_objects = GameObject.tag_objects
+        registry.render_queue = GameObject.render_queue
+        registry.component_objects = GameObject.component_objects
+        registry.spatial_index = GameObject.spatial_index
+        return registry
+
+    def activate(self):
+        """Makes new game objects and all lookups use this registry.
+        """
+        GameObject.objects = self.objects
+        GameObject.parked = self.parked
+        GameObject.tag_objects = self.tag_objects
+        GameObject.render_queue = self.render_queue
+        GameObject.component_objects = self.component_objects
+        GameObject.spatial_index = self.spatial_index
+
+    def destroy(self):
+        """Destroys all game objects of the registry in one pass.
+
+        Components and tweens of every object are stopped, but the objects aren't removed from the lookups one by
+        one: the lookups are emptied at once.
+
+        Destroy hooks may destroy or create game objects: destruction is deferred meanwhile, and objects created
+        by the hooks are destroyed as well.
+        """
+        deferring = GameObject.deferring
+        GameObject.deferring = True
+        try:
+            while self.objects or self.parked:
+                objects = [*self.objects, *self.parked]
+                self.objects.clear()
+                self.parked.clear()
+                for obj in objects:
+                    if obj.destroyed:
+                        continue
+                    obj.destroyed = True
+                    for component in obj.components:
+                        component.destroy()
+                    if Tween._targets:
+                        Tween.stop_target(obj, obj.transform, obj.position, *obj.components)
+                    obj.transform.release()
+        finally:
+            GameObject.deferring = deferring
+        if not deferring:
+            # Objects queued by the hooks are already destroyed, unless they belong to another registry.
+            GameObject.flush_destroyed()
+
+        self.tag_objects.clear()
+        self.render_queue.clear()
+        self.component_objects.clear()
+        self.spatial_index.clear()
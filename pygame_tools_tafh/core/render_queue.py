@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .game_object import GameObject
+
+
+class RenderQueue:
+    """Game objects grouped into layers by z_index, in drawing order.
+
+    Layers with greater z_index are drawn first, objects of the same layer are drawn in the order
+    they entered it. The flat drawing order is rebuilt only after an object was added, removed or
+    moved to another layer, so only the distinct z values are ever sorted.
+
+    layers  Objects of every z_index.
+    """
+    layers: dict[int, dict["GameObject", None]]
+    _order: list["GameObject"] | None
+
+    def __init__(self):
+        self.layers = {}
+        self._order = []
+
+    def add(self, obj: "GameObject"):
+        layer = self.layers.get(obj.z_index)
+        if layer is None:
+            layer = self.layers[obj.z_index] = {}
+        layer[obj] = None
+        self._order = None
+
+    def remove(self, obj: "GameObject", z_index: int | None = None):
+        """Removes the object from the queue, if it is there.
+
+        Args:
+            obj         Object to remove.
+            z_index     Layer the object is stored in, defaults to its current z_index.
+        """
+        if z_index is None:
+            z_index = obj.z_index
+        layer = self.layers.get(z_index)
+        if layer is None or obj not in layer:
+            return
+        del layer[obj]
+        if not layer:
+            del self.layers[z_index]
+        self._order = None
+
+    def move(self, obj: "GameObject", old_z_index: int):
+        """Moves the object from the layer it was stored in to the layer of its current z_index.
+        """
+        self.remove(obj, old_z_index)
+        self.add(obj)
+
+    def clear(self):
+        self.layers = {}
+        self._order = []
+
+    def get_order(self) -> list["GameObject"]:
+        """Returns all objects in drawing order. The returned list must not be modified.
+        """
+        if self._order is None:
+            order = []
+            for z_index in sorted(self.layers, reverse=True):
+                order.extend(self.layers[z_index])
+            self._order = order
+        return self._order
+
+    def __iter__(self) -> Iterator["GameObject"]:
+        return iter(self.get_order())
+
+    def __len__(self) -> int:
+        return len(self.get_order())
@@ -0,0 +1,219 @@
+from typing import Hashable, Iterable, TYPE_CHECKING
+import weakref
+
+from .transform_store import TransformStore
+
+if TYPE_CHECKING:
+    from .game_object import Component
+
+Bounds = tuple[float, float, float, float]
+
+
+class SpatialHash:
+    """Uniform grid that maps keys to the cells overlapped by their bounding boxes.
+
+    Bounds are (left, top, right, bottom) tuples in world coordinates.
+
+    cell_size   Size of one cell. Should be about the size of a typical object.
+    bounds      Bounds of every key.
+    """
+    cell_size: float
+    bounds: dict[Hashable, Bounds]
+    _cells: dict[tuple[int, int], dict[Hashable, None]]
+    _ranges: dict[Hashable, tuple[int, int, int, int]]
+
+    def __init__(self, cell_size: float = 128):
+        self.cell_size = cell_size
+        self.bounds = {}
+        self._cells = {}
+        self._ranges = {}
+
+    def _range(self, bounds: Bounds) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return int(bounds[0] // size), int(bounds[1] // size), int(bounds[2] // size), int(bounds[3] // size)
+
+    def insert(self, key: Hashable, bounds: Bounds):
+        """Inserts the key or moves it to new bounds.
+        """
+        cells = self._range(bounds)
+        old = self._ranges.get(key)
+        self.bounds[key] = bounds
+        if old == cells:
+            return
+        if old is not None:
+            self._unlink(key, old)
+        self._ranges[key] = cells
+        for cx in range(cells[0], cells[2] + 1):
+            for cy in range(cells[1], cells[3] + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is None:
+                    cell = self._cells[(cx, cy)] = {}
+                cell[key] = None
+
+    def remove(self, key: Hashable):
+        cells = self._ranges.pop(key, None)
+        if cells is None:
+            return
+        del self.bounds[key]
+        self._unlink(key, cells)
+
+    def _unlink(self, key: Hashable, cells: tuple[int, int, int, int]):
+        for cx in range(cells[0], cells[2] + 1):
+            for cy in range(cells[1], cells[3] + 1):
+                cell = self._cells[(cx, cy)]
+                del cell[key]
+                if not cell:
+                    del self._cells[(cx, cy)]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._ranges
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def query_point(self, x: float, y: float) -> list[Hashable]:
+        """Returns keys whose bounds contain the point.
+        """
+        cell = self._cells.get((int(x // self.cell_size), int(y // self.cell_size)))
+        if cell is None:
+            return []
+        bounds = self.bounds
+        result = []
+        for key in cell:
+            left, top, right, bottom = bounds[key]
+            if left <= x <= right and top <= y <= bottom:
+                result.append(key)
+        return result
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> list[Hashable]:
+        """Returns keys whose bounds intersect the rectangle.
+        """
+        x0, y0, x1, y1 = self._range((left, top, right, bottom))
+        bounds = self.bounds
+        seen = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is None:
+                    continue
+                for key in cell:
+                    if key in seen:
+                        continue
+                    b = bounds[key]
+                    if b[0] <= right and b[2] >= left and b[1] <= bottom and b[3] >= top:
+                        seen[key] = None
+        return list(seen)
+
+    def query_radius(self, x: float, y: float, radius: float) -> list[Hashable]:
+        """Returns keys whose bounds intersect the circle.
+        """
+        result = []
+        r2 = radius * radius
+        for key in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            left, top, right, bottom = self.bounds[key]
+            dx = x - min(max(x, left), right)
+            dy = y - min(max(y, top), bottom)
+            if dx * dx + dy * dy <= r2:
+                result.append(key)
+        return result
+
+
+class SpatialIndex(SpatialHash):
+    """SpatialHash of components that keeps their bounds in sync with the world.
+
+    Components are marked as stale when they or their game object move, and reinserted lazily by sync().
+    Objects moved by bulk operations of a TransformStore are found by sync() itself.
+    Tracked components whose get_bounds() returns None are kept in unbounded instead.
+
+    unbounded   Tracked components without bounds.
+    version     Incremented whenever the content of the index changes.
+    damage      If not None, old and new bounds of every changed component are collected here.
+    """
+    unbounded: dict["Component", None]
+    version: int
+    damage: list[Bounds] | None
+    _tracked: dict["Component", None]
+    _stale: dict["Component", None]
+    _stores: "weakref.WeakKeyDictionary[TransformStore, int]"
+
+    def __init__(self, cell_size: float = 128):
+        super().__init__(cell_size)
+        self.unbounded = {}
+        self.version = 0
+        self.damage = None
+        self._tracked = {}
+        self._stale = {}
+        self._stores = weakref.WeakKeyDictionary()
+
+    def track(self, component: "Component"):
+        self._tracked[component] = None
+        self._stale[component] = None
+        component.game_object.transform.listeners[(self, component)] = lambda: self.mark(component)
+
+    def untrack(self, component: "Component"):
+        if self._tracked.pop(component, 0) is None:
+            component.game_object.transform.listeners.pop((self, component), None)
+            self.version += 1
+        self._stale.pop(component, None)
+        self.unbounded.pop(component, None)
+        if self.damage is not None and component in self.bounds:
+            self.damage.append(self.bounds[component])
+        self.remove(component)
+
+    def mark(self, component: "Component"):
+        """Marks the component as changed, e.g. after its size or color has changed.
+        """
+        if component in self._tracked:
+            self._stale[component] = None
+
+    def sync(self):
+        """Reinserts all components whose bounds are outdated.
+        """
+        for store in TransformStore.instances:
+            seen = self._stores.get(store, 0)
+            if store.version != seen:
+                self._stores[store] = store.version
+                tracked = self._tracked
+                for transform in store.moved_since(seen):
+                    for component in transform.game_object.components:
+                        if component in tracked:
+                            self._stale[component] = None
+        if not self._stale:
+            return
+        stale = self._stale
+        self._stale = {}
+        self.version += 1
+        damage = self.damage
+        for component in stale:
+            bounds = component.get_bounds()
+            if damage is not None:
+                old = self.bounds.get(component)
+                if old is not None and old != bounds:
+                    damage.append(old)
+                if bounds is not None:
+                    damage.append(bounds)
+            if bounds is None:
+                self.remove(component)
+                self.unbounded[component] = None
+            else:
+                self.unbounded.pop(component, None)
+                self.insert(component, bounds)
+
+    def tracked(self) -> Iterable["Component"]:
+        return self._tracked.keys()
+
+    def clear(self):
+        """Stops tracking all components.
+        """
+        for component in self._tracked:
+            component.game_object.transform.listeners.pop((self, component), None)
+        self._tracked = {}
+        self._stale = {}
+        self.unbounded = {}
+        self.bounds = {}
+        self._cells = {}
+        self._ranges = {}
+        self.version += 1
+        if self.damage is not None:
+            # Everything has to be redrawn.
+            self.damage = None
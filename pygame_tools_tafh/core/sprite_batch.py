@@ -0,0 +1,47 @@
+import pygame as pg
+
+
+class SpriteBatch:
+    """Collects blits and submits them to the display with a single Surface.blits() call.
+
+    While a batch is active, SpriteBatch.blit() queues surfaces instead of drawing them immediately. Components
+    that draw in any other way have batched set to False, and GameObject.draw() flushes the queued blits before
+    calling them, so the drawing order is preserved.
+
+    sprites     Queued (surface, destination) pairs.
+    """
+    current: "SpriteBatch | None" = None
+
+    sprites: list[tuple[pg.Surface, tuple[float, float]]]
+
+    def __init__(self):
+        self.sprites = []
+
+    def begin(self):
+        """Makes SpriteBatch.blit() queue into this batch.
+        """
+        SpriteBatch.current = self
+
+    def end(self):
+        """Draws the queued blits and stops batching.
+        """
+        self.flush()
+        if SpriteBatch.current is self:
+            SpriteBatch.current = None
+
+    def flush(self):
+        """Draws the queued blits. Has to be called before the clip of the display changes.
+        """
+        if self.sprites:
+            pg.display.get_surface().blits(self.sprites, False)
+            self.sprites = []
+
+    @staticmethod
+    def blit(surface: pg.Surface, dest: tuple[float, float]):
+        """Draws the surface to the display, or queues it if a batch is active.
+        """
+        batch = SpriteBatch.current
+        if batch is None:
+            pg.display.get_surface().blit(surface, dest)
+        else:
+            batch.sprites.append((surface, dest))
@@ -0,0 +1,164 @@
+from typing import TYPE_CHECKING, Any, Callable
+from ..vmath import Vector2d
+
+if TYPE_CHECKING:
+    from .game_object import GameObject
+    from .transform_store import TransformStore
+
+
+class TrackedVector(Vector2d):
+    """Vector that notifies its owner whenever one of its components changes.
+
+    owner   Object that owns this vector, e.g. a Transform. Its invalidate() method is called on every change.
+    """
+    __slots__ = ("owner",)
+
+    def __init__(self, owner, a: float = 0, b: float = 0):
+        object.__setattr__(self, "owner", owner)
+        super().__init__(a, b)
+
+    def __setattr__(self, name: str, value):
+        object.__setattr__(self, name, value)
+        if name == "x" or name == "y":
+            self.owner.invalidate()
+
+
+class Transform:
+    """Position of a game object in the scene hierarchy.
+
+    World coordinates are cached and recomputed only after the local position of the object
+    or of one of its ancestors has changed.
+
+    While interpolate is enabled, every transform that moves during a simulation step remembers its world position
+    from before the step, and render_position blends it with the current one by alpha. The engine enables it for
+    fixed timesteps, see Engine.fixed_step.
+
+    game_object     Associated GameObject.
+    position        Position relative to the parent.
+    store           TransformStore that holds the position, or None.
+    slot            Row of the position in the store.
+    listeners       Callbacks invoked when world coordinates become outdated, keyed by their owner. Moves by
+                    bulk operations of a TransformStore don't call them, see TransformStore.
+    revision        Incremented whenever world coordinates are recomputed.
+    """
+    default_store: "TransformStore | None" = None
+    interpolate: bool = False
+    alpha: float = 1.0
+    _moved: list["Transform"] = []
+
+    game_object: "GameObject"
+    store: "TransformStore | None"
+    slot: int
+    listeners: dict[Any, Callable[[], Any]]
+    revision: int
+    _seen: int
+    _position: TrackedVector
+    _world: Vector2d
+    _dirty: bool
+    _previous: Vector2d | None
+
+    def __init__(self, game_object: "GameObject"):
+        self.game_object = game_object
+        self.store = None
+        self.slot = -1
+        self.listeners = {}
+        self.revision = 0
+        self._seen = 0
+        self._dirty = True
+        self._previous = None
+        self._position = TrackedVector(self)
+        self._world = Vector2d(0, 0)
+
+        if Transform.default_store is not None:
+            Transform.default_store.attach(self)
+
+    @property
+    def position(self) -> Vector2d:
+        return self._position
+
+    @position.setter
+    def position(self, value: Vector2d):
+        # Copy instead of aliasing so the vector keeps reporting changes to this transform.
+        object.__setattr__(self._position, "x", value.x)
+        object.__setattr__(self._position, "y", value.y)
+        self.invalidate()
+
+    @property
+    def velocity(self) -> Vector2d:
+        """Velocity in units per second, applied by TransformStore.integrate(). Only available for stored transforms.
+        """
+        if self.store is None:
+            raise Exception("Velocity is only available for transforms attached to a TransformStore")
+        return self.store.get_velocity(self.slot)
+
+    @velocity.setter
+    def velocity(self, value: Vector2d):
+        if self.store is None:
+            raise Exception("Velocity is only available for transforms attached to a TransformStore")
+        self.store.velocities[self.slot] = (value.x, value.y)
+
+    @property
+    def world_position(self) -> Vector2d:
+        """Absolute coordinates of the game object. The returned vector must not be modified.
+        """
+        store = self.store
+        if store is not None and store.version != self._seen:
+            if store.moved[self.slot] > self._seen:
+                self._dirty = True
+            self._seen = store.version
+        if self._dirty:
+            parent = self.game_object.parent
+            if parent is None:
+                self._world.x = self._position.x
+                self._world.y = self._position.y
+            else:
+                origin = parent.transform.world_position
+                self._world.x = origin.x + self._position.x
+                self._world.y = origin.y + self._position.y
+            self._dirty = False
+            self.revision += 1
+        return self._world
+
+    @property
+    def render_position(self) -> Vector2d:
+        """World position the game object is drawn at. The returned vector must not be modified.
+        """
+        world = self.world_position
+        previous = self._previous
+        if previous is None:
+            return world
+        alpha = Transform.alpha
+        return Vector2d(previous.x + (world.x - previous.x) * alpha, previous.y + (world.y - previous.y) * alpha)
+
+    @staticmethod
+    def begin_step():
+        """Starts a simulation step: forgets world positions recorded for interpolation in the previous step.
+        """
+        for transform in Transform._moved:
+            transform._previous = None
+            # Recompute world coordinates, so that a move during this step is recorded again.
+            transform.world_position
+        Transform._moved = []
+
+    def release(self):
+        """Frees resources held by the transform. Called when its game object is destroyed.
+        """
+        if self.store is not None:
+            self.store.detach(self)
+
+    def invalidate(self):
+        """Marks cached world coordinates of this transform and of all its descendants as outdated.
+        """
+        if self._dirty:
+            # Descendants can't be clean while their ancestor is dirty.
+            return
+        self._dirty = True
+        if Transform.interpolate and self._previous is None:
+            # World coordinates are still valid, they are the position before this step.
+            self._previous = self._world.copy()
+            Transform._moved.append(self)
+        if self.listeners:
+            for listener in list(self.listeners.values()):
+                listener()
+        for child in self.game_object.childs:
+            child.transform.invalidate()
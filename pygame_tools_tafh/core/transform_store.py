@@ -0,0 +1,250 @@
+from typing import TYPE_CHECKING
+import weakref
+
+from ..vmath import Vector2d
+from .transform import TrackedVector, Transform
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+if TYPE_CHECKING:
+    from .game_object import GameObject
+
+
+class PositionView(TrackedVector):
+    """Position of a transform stored in a row of TransformStore.positions.
+
+    store   Store that owns the row.
+    slot    Index of the row.
+    """
+    __slots__ = ("store", "slot")
+
+    store: "TransformStore"
+    slot: int
+
+    def __init__(self, transform: "Transform", store: "TransformStore", slot: int):
+        object.__setattr__(self, "store", store)
+        object.__setattr__(self, "slot", slot)
+        object.__setattr__(self, "owner", transform)
+
+    @property
+    def x(self) -> float:
+        return float(self.store.positions[self.slot, 0])
+
+    @x.setter
+    def x(self, value: float):
+        self.store.positions[self.slot, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self.store.positions[self.slot, 1])
+
+    @y.setter
+    def y(self, value: float):
+        self.store.positions[self.slot, 1] = value
+
+
+class VelocityView(Vector2d):
+    """Velocity of a transform stored in a row of TransformStore.velocities.
+
+    store   Store that owns the row.
+    slot    Index of the row.
+    """
+    __slots__ = ("store", "slot")
+
+    store: "TransformStore"
+    slot: int
+
+    def __init__(self, store: "TransformStore", slot: int):
+        self.store = store
+        self.slot = slot
+
+    @property
+    def x(self) -> float:
+        return float(self.store.velocities[self.slot, 0])
+
+    @x.setter
+    def x(self, value: float):
+        self.store.velocities[self.slot, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self.store.velocities[self.slot, 1])
+
+    @y.setter
+    def y(self, value: float):
+        self.store.velocities[self.slot, 1] = value
+
+
+class TransformStore:
+    """Struct-of-arrays storage for local positions and velocities of many transforms.
+
+    Attached transforms keep working as usual, but their positions become views into the arrays
+    below, so systems can move, clamp or cull thousands of objects with a single NumPy call.
+    Requires numpy.
+
+    Bulk operations don't invalidate the moved transforms one by one. They only mark the rows in moved, and
+    Transform.world_position and SpatialIndex.sync() compare it with the version they have seen. Rows of objects
+    with children, and every row while Transform.interpolate is set, are still invalidated at once.
+
+    positions   Array of shape (capacity, 2) with local positions.
+    velocities  Array of shape (capacity, 2) with velocities in units per second.
+    used        Mask of the rows that belong to attached transforms.
+    parents     Mask of the rows whose game objects have children.
+    moved       Array with the version of the last bulk operation that moved every row.
+    version     Incremented by every bulk operation that moves transforms.
+    transforms  Transform attached to every row, or None.
+    """
+    instances: "weakref.WeakSet[TransformStore]" = weakref.WeakSet()
+
+    positions: "np.ndarray"
+    velocities: "np.ndarray"
+    used: "np.ndarray"
+    parents: "np.ndarray"
+    moved: "np.ndarray"
+    version: int
+    transforms: list["Transform | None"]
+    _free: list[int]
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ImportError("TransformStore requires numpy to be installed")
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.used = np.zeros(capacity, dtype=bool)
+        self.parents = np.zeros(capacity, dtype=bool)
+        self.moved = np.zeros(capacity, dtype=np.int64)
+        self.version = 0
+        self.transforms = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+        TransformStore.instances.add(self)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.transforms)
+
+    def _grow(self):
+        old = self.capacity
+        new = max(old * 2, 16)
+        self.positions = np.concatenate((self.positions, np.zeros((new - old, 2))))
+        self.velocities = np.concatenate((self.velocities, np.zeros((new - old, 2))))
+        self.used = np.concatenate((self.used, np.zeros(new - old, dtype=bool)))
+        self.parents = np.concatenate((self.parents, np.zeros(new - old, dtype=bool)))
+        self.moved = np.concatenate((self.moved, np.zeros(new - old, dtype=np.int64)))
+        self.transforms.extend([None] * (new - old))
+        self._free.extend(range(new - 1, old - 1, -1))
+
+    def attach(self, transform: "Transform"):
+        """Moves position of the transform into the store. Its position vector is replaced by a view.
+        """
+        if transform.store is not None:
+            raise Exception("Transform is already attached to a store")
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        position = transform.position
+        self.positions[slot] = (position.x, position.y)
+        self.used[slot] = True
+        self.parents[slot] = bool(transform.game_object.childs)
+        self.transforms[slot] = transform
+
+        transform.store = self
+        transform.slot = slot
+        transform._seen = self.version
+        transform._position = PositionView(transform, self, slot)
+
+    def detach(self, transform: "Transform"):
+        """Moves position of the transform back out of the store and frees its row.
+        """
+        slot = transform.slot
+        if self.moved[slot] > transform._seen:
+            # Nothing is going to compare versions for the transform after it leaves the store.
+            transform.invalidate()
+        x, y = self.positions[slot].tolist()
+        self.positions[slot] = 0
+        self.velocities[slot] = 0
+        self.used[slot] = False
+        self.parents[slot] = False
+        self.moved[slot] = 0
+        self.transforms[slot] = None
+        self._free.append(slot)
+
+        transform.store = None
+        transform.slot = -1
+        transform._position = TrackedVector(transform, x, y)
+
+    def get_velocity(self, slot: int) -> VelocityView:
+        """Returns a view of the velocity stored in the row.
+        """
+        return VelocityView(self, slot)
+
+    def moved_since(self, version: int) -> list["Transform"]:
+        """Returns the transforms moved by bulk operations after the given version.
+        """
+        transforms = self.transforms
+        return [transforms[slot] for slot in np.flatnonzero(self.moved > version).tolist()]
+
+    def _invalidate(self, slots: "np.ndarray"):
+        if len(slots) == 0:
+            return
+        self.version += 1
+        self.moved[slots] = self.version
+        # Children and interpolation have to learn about the move right away.
+        eager = slots if Transform.interpolate else slots[self.parents[slots]]
+        transforms = self.transforms
+        for slot in eager.tolist():
+            transforms[slot].invalidate()
+
+    def integrate(self, dt: float):
+        """Moves every attached transform by its velocity.
+
+        Args:
+            dt  Time step in seconds.
+        """
+        moving = np.flatnonzero(np.any(self.velocities != 0, axis=1))
+        if len(moving) == 0:
+            return
+        self.positions[moving] += self.velocities[moving] * dt
+        self._invalidate(moving)
+
+    def translate(self, offset: Vector2d, mask: "np.ndarray | None" = None):
+        """Moves attached transforms by the same offset.
+
+        Args:
+            offset  Offset to apply.
+            mask    Boolean mask or indices of the rows to move, all attached transforms if None.
+        """
+        slots = np.flatnonzero(self.used) if mask is None else np.flatnonzero(self.used & self._as_mask(mask))
+        self.positions[slots] += (offset.x, offset.y)
+        self._invalidate(slots)
+
+    def clamp(self, low: Vector2d, high: Vector2d):
+        """Clamps local positions of all attached transforms to the box between low and high.
+        """
+        clamped = np.clip(self.positions, (low.x, low.y), (high.x, high.y))
+        changed = np.flatnonzero(np.any(clamped != self.positions, axis=1) & self.used)
+        self.positions[changed] = clamped[changed]
+        self._invalidate(changed)
+
+    def mask_in_rect(self, left: float, top: float, width: float, height: float) -> "np.ndarray":
+        """Returns mask of the attached transforms whose local position is inside of the rectangle.
+        """
+        x = self.positions[:, 0]
+        y = self.positions[:, 1]
+        return self.used & (x >= left) & (x < left + width) & (y >= top) & (y < top + height)
+
+    def cull(self, left: float, top: float, width: float, height: float) -> list["GameObject"]:
+        """Returns game objects whose local position is inside of the rectangle.
+        """
+        transforms = self.transforms
+        return [transforms[slot].game_object for slot in np.flatnonzero(self.mask_in_rect(left, top, width, height)).tolist()]
+
+    def _as_mask(self, mask: "np.ndarray") -> "np.ndarray":
+        mask = np.asarray(mask)
+        if mask.dtype == bool:
+            return mask
+        result = np.zeros(self.capacity, dtype=bool)
+        result[mask] = True
+        return result
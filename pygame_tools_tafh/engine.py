@@ -1,7 +1,21 @@
+import asyncio
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from .scene import Scene
 from .core.game_object import GameObject
+from .core.camera import Viewport
+from .core.transform import Transform
+from .core.culling import Culler
+from .core.registry import Registry
+from .loader import AssetLoader
+from .asset_manager import AssetManager
+from .core.dirty_rects import DirtyRectRenderer
+from .core.sprite_batch import SpriteBatch
 from .tween import Tween
+from .profiler import Profiler
+from .input import Input
+from .components.ui.clickable_component import ClickableComponent
 import pygame as pg
 import logging
 
@@ -12,6 +26,21 @@ class Engine:
     display     Basically pygame.display.get_display()
     scene       Current loaded scene
     scenes      List of all registered scenes
+    viewports   Regions of the display the scene is drawn to, each through its own camera
+    culling     If true, only game objects inside of a viewport are drawn
+    dirty_rects If true, only changed parts of the display are redrawn, see DirtyRectRenderer.
+                Suits mostly static scenes such as menus.
+    fixed_step  Length of a simulation step in milliseconds. If set, the game is simulated in steps of this length
+                independently of the frame rate. If None, it is simulated once per frame.
+    max_steps   Maximum number of simulation steps per frame. If the simulation falls further behind, the rest
+                of the time is dropped, so a slow frame doesn't cause even slower ones.
+    interpolate If true, objects are drawn between their positions of the last two simulation steps, so that
+                motion is smooth when the frame rate differs from the step rate. Used with fixed_step only.
+    profiler    Frame profiler, disabled by default.
+    asset_executor  Thread pool that loads assets declared by Scene.preload(). Shut down when the game loop ends.
+    transition      Scene being switched to with its data, AssetLoader and loading scene, see begin_transition().
+    running         True while the game loop runs.
+    assets          Cache of images in the display format, see AssetManager.
     """
     instance = None
 
@@ -20,10 +49,41 @@ class Engine:
     logger: logging.Logger
     scene: Scene
     display: pg.Surface
+    viewports: list[Viewport]
+    culling: bool
+    culler: Culler
+    dirty_rects: bool
+    dirty_renderer: DirtyRectRenderer
+    sprite_batch: SpriteBatch
+    fixed_step: float | None
+    max_steps: int
+    interpolate: bool
+    accumulator: float
+    profiler: Profiler
+    asset_executor: ThreadPoolExecutor
+    assets: AssetManager
+    transition: tuple[Scene, any, AssetLoader, Scene | None] | None
+    running: bool
+    clock: pg.time.Clock
+    next_frame: float
     fps: int
 
     def __init__(self, app_name: str, fps: int, resolution: tuple[int, int] = (800, 600)):
         self.fps = fps
+        self.culling = True
+        self.culler = Culler()
+        self.dirty_rects = False
+        self.sprite_batch = SpriteBatch()
+        self.fixed_step = None
+        self.max_steps = 5
+        self.interpolate = True
+        self.accumulator = 0
+        self.profiler = Profiler()
+        self.asset_executor = ThreadPoolExecutor(thread_name_prefix="assets")
+        self.assets = AssetManager.get_default()
+        self.transition = None
+        self.running = False
+        self.dirty_renderer = DirtyRectRenderer(self.culler, self.sprite_batch)
         self.scenes = []
         self.scene = None
         self.app_name = app_name
@@ -47,32 +107,127 @@ class Engine:
         pg.display.set_caption(self.app_name)
         logging.info("Engine initialized.")
         GameObject("camera")
+        self.viewports = [Viewport()]
+        self.viewports[0].activate()
+        self.viewports[0].refresh()
 
     def register(self, scene: Scene):
         self.scenes.append(scene)
 
-    async def load_scene(self, scene_name: str, data: any):
-        scene = next((x for x in self.scenes if x.name == scene_name), None)
+    async def load_scene(self, scene_name: str, data: any, loading_scene: str | None = None):
+        """Loads the scene and runs the game loop.
+
+        If the game loop is already running, e.g. when called from a scene, only begins the transition,
+        see begin_transition().
+
+        Args:
+            scene_name      Name of the scene to load.
+            data            Data given to Scene.load().
+            loading_scene   Name of the scene shown while assets are loading.
+        """
+        if not self.begin_transition(scene_name, data, loading_scene) or self.running:
+            return
+
+        self.running = True
+        try:
+            self.clock = pg.time.Clock()
+            self.next_frame = time.perf_counter()
+            while True:
+                await self.run_frame()
+        except Exception as e:
+            logging.critical(traceback.format_exc())
+            exit(1)
+        finally:
+            self.running = False
+            self.shutdown()
+
+    def begin_transition(self, scene_name: str, data: any, loading_scene: str | None = None) -> bool:
+        """Switches to the scene once its assets are loaded. The switch happens at the start of a frame.
 
+        Assets declared by Scene.preload() are loaded on the asset thread pool. Meanwhile the loading scene,
+        if given, is shown; it receives the AssetLoader as data, so it can display the progress.
+
+        Args:
+            scene_name      Name of the scene to switch to.
+            data            Data given to Scene.load().
+            loading_scene   Name of the scene shown while assets are loading.
+
+        Returns:
+            False if the scene doesn't exist.
+        """
+        scene = self.get_scene(scene_name)
+        if not scene:
+            return False
+        loading = self.get_scene(loading_scene) if loading_scene is not None else None
+
+        loader = AssetLoader(self.asset_executor)
+        scene.preload(loader)
+        self.transition = (scene, data, loader, loading)
+        return True
+
+    def poll_transition(self):
+        """Shows the loading scene or switches to the next scene, depending on the progress of the transition.
+
+        Raises:
+            The exception of the first asset that failed to load.
+        """
+        scene, data, loader, loading = self.transition
+        if loader.done:
+            self.transition = None
+            loader.raise_errors()
+            self.switch_scene(scene, data)
+        elif loading is not None and self.scene is not loading:
+            self.switch_scene(loading, loader)
+
+    def shutdown(self):
+        """Stops the asset thread pool without waiting for assets that are still loading.
+        """
+        self.asset_executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_scene(self, scene_name: str) -> Scene | None:
+        scene = next((x for x in self.scenes if x.name == scene_name), None)
         if not scene:
             logging.error(f"Scene {scene_name} not found.")
-            return
-        
+        return scene
+
+    def switch_scene(self, scene: Scene, data: any):
+        """Destroys the current scene and loads the given one.
+        """
         if self.scene:
-            scene.destroy()
+            self.scene.destroy()
+            Registry().activate()
             
         self.scene = scene
+        # Objects created before the first scene is loaded, such as the camera, belong to it.
+        scene.registry = Registry.current()
+        for viewport in self.viewports:
+            if viewport.camera not in GameObject.tag_objects:
+                GameObject(viewport.camera)
         scene.load(data)
         
         logging.info(f"Scene {scene.name} loaded")
-        try:
-            clock = pg.time.Clock()
-            while True:
-                dt = clock.tick(self.fps)
-                await self.iteration(dt)
-        except Exception as e:
-            logging.critical(traceback.format_exc())
-            exit(1)
+
+    async def run_frame(self):
+        if self.transition is not None:
+            self.poll_transition()
+        dt = self.clock.tick()
+        await self.iteration(dt)
+
+        # Wait for the next frame inside the event loop, so network I/O and other tasks run meanwhile.
+        self.next_frame += 1 / self.fps
+        delay = self.next_frame - time.perf_counter()
+        if delay < 0:
+            self.next_frame = time.perf_counter()
+            delay = 0
+        await asyncio.sleep(delay)
+
+    def get_viewport(self, position: tuple[int, int]) -> Viewport:
+        """Returns the topmost viewport that contains the display position.
+        """
+        for viewport in reversed(self.viewports):
+            if viewport.contains(position):
+                return viewport
+        return self.viewports[0]
 
     def event_processing(self, event: pg.event.Event):
         if event.type == pg.QUIT:
@@ -80,18 +235,104 @@ class Engine:
             exit()
 
     async def iteration(self, dt: int):
+        profiler = self.profiler if self.profiler.enabled else None
+        if profiler is not None:
+            profiler.begin_frame()
+        GameObject.deferring = True
+
         events = pg.event.get()
         
         for event in events:
             self.event_processing(event)
+        Input.process(events)
+        if profiler is not None:
+            profiler.mark("events")
         
-        for i in GameObject.objects:
-            i.update()
+        if self.fixed_step is None:
+            Transform.interpolate = False
+            Transform.alpha = 1.0
+            Transform.begin_step()
+            self.simulate(dt)
+        else:
+            self.run_steps(dt)
+
+        if 1 in Input.mouse_held:
+            mouse = Input.mouse_position
+            ClickableComponent.dispatch(self.get_viewport(mouse).to_world(mouse), True)
+        else:
+            ClickableComponent.dispatch(None, False)
+        if profiler is not None:
+            profiler.mark("clicks")
+
+        GameObject.deferring = False
+        GameObject.flush_destroyed()
+        self.render()
+        if profiler is not None:
+            profiler.end_frame()
+
+    def simulate(self, dt: float):
+        """Advances the game by dt milliseconds.
+        """
+        profiler = self.profiler if self.profiler.enabled else None
+        timer = profiler.record if profiler is not None else None
+
+        # Objects created during the step are updated from the next step on.
+        for i in list(GameObject.objects):
+            i.update(dt, timer)
+        if profiler is not None:
+            profiler.mark("update")
 
         Tween.update_all(dt)
+        if profiler is not None:
+            profiler.mark("tweens")
+
+    def run_steps(self, dt: float):
+        """Runs as many fixed simulation steps as fit into the elapsed time, see fixed_step.
+        """
+        step = self.fixed_step
+        Transform.interpolate = self.interpolate
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= step and steps < self.max_steps:
+            Transform.begin_step()
+            self.simulate(step)
+            self.accumulator -= step
+            steps += 1
+        if self.accumulator >= step:
+            self.accumulator %= step
+        Transform.alpha = self.accumulator / step if self.interpolate else 1.0
+
+    def render(self):
+        profiler = self.profiler if self.profiler.enabled else None
+        timer = profiler.record if profiler is not None else None
+        if self.dirty_rects:
+            self.dirty_renderer.render(self.viewports, timer)
+            if profiler is not None:
+                profiler.mark("draw")
+                if profiler.overlay:
+                    pg.display.update(profiler.draw_overlay(self.display))
+                    profiler.mark("present")
+            return
+
+        # Stops collecting damage, so the dirty renderer redraws everything if it is enabled again.
+        GameObject.spatial_index.damage = None
         self.display.fill((0, 0, 0))
-        for i in sorted(GameObject.objects, key=lambda x: -x.z_index):
-            i.draw()
+        self.sprite_batch.begin()
+        for viewport in self.viewports:
+            viewport.refresh()
+            viewport.activate()
+            objects = self.culler.get_visible(viewport) if self.culling else GameObject.render_queue
+            if profiler is not None:
+                profiler.mark("cull")
+            for i in objects:
+                i.draw(timer)
+            self.sprite_batch.flush()
+            if profiler is not None:
+                profiler.mark("draw")
+        self.sprite_batch.end()
 
+        if profiler is not None and profiler.overlay:
+            profiler.draw_overlay(self.display)
         pg.display.flip()
-            
+        if profiler is not None:
+            profiler.mark("present")
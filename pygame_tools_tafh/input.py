@@ -0,0 +1,136 @@
+from typing import Any, Callable, Hashable
+from enum import Enum
+import pygame as pg
+
+
+class KeyEdge(Enum):
+    """Changes of a key that listeners can be bound to"""
+    PRESSED = 0
+    RELEASED = 1
+    HELD = 2
+
+
+class Input:
+    """Keyboard and mouse state, captured once per frame by the engine from the pygame events.
+
+    Listeners are indexed by key, so only listeners of keys that changed (or are held, for HELD bindings) are
+    called, however many bindings exist.
+
+    held            Keys held down.
+    pressed         Keys pressed this frame.
+    released        Keys released this frame.
+    mouse_position  Cursor position on the display.
+    mouse_held      Mouse buttons held down (1 is the left one, as in pygame events).
+    mouse_pressed   Mouse buttons pressed this frame.
+    mouse_released  Mouse buttons released this frame.
+    """
+    held: set[int] = set()
+    pressed: set[int] = set()
+    released: set[int] = set()
+    mouse_position: tuple[int, int] = (0, 0)
+    mouse_held: set[int] = set()
+    mouse_pressed: set[int] = set()
+    mouse_released: set[int] = set()
+
+    _bindings: dict[tuple[int, KeyEdge], dict[Hashable, Callable[[list[int]], Any]]] = {}
+    _owners: dict[Hashable, list[tuple[int, KeyEdge]]] = {}
+
+    @staticmethod
+    def process(events: list[pg.event.Event]):
+        """Updates the state from the events of a frame and calls listeners of the changed keys.
+        """
+        Input.pressed = set()
+        Input.released = set()
+        Input.mouse_pressed = set()
+        Input.mouse_released = set()
+
+        for event in events:
+            match event.type:
+                case pg.KEYDOWN:
+                    if event.key not in Input.held:
+                        Input.held.add(event.key)
+                        Input.pressed.add(event.key)
+                case pg.KEYUP:
+                    if event.key in Input.held:
+                        Input.held.discard(event.key)
+                        Input.released.add(event.key)
+                case pg.MOUSEMOTION:
+                    Input.mouse_position = event.pos
+                case pg.MOUSEBUTTONDOWN:
+                    Input.mouse_position = event.pos
+                    Input.mouse_held.add(event.button)
+                    Input.mouse_pressed.add(event.button)
+                case pg.MOUSEBUTTONUP:
+                    Input.mouse_position = event.pos
+                    if event.button in Input.mouse_held:
+                        Input.mouse_held.discard(event.button)
+                        Input.mouse_released.add(event.button)
+                case pg.WINDOWFOCUSLOST:
+                    # Key up events are not delivered while the window is unfocused.
+                    Input.released |= Input.held
+                    Input.mouse_released |= Input.mouse_held
+                    Input.held = set()
+                    Input.mouse_held = set()
+
+        if Input._bindings:
+            Input.dispatch()
+
+    @staticmethod
+    def dispatch():
+        calls = {}
+        for edge, keys in ((KeyEdge.PRESSED, Input.pressed), (KeyEdge.RELEASED, Input.released), (KeyEdge.HELD, Input.held)):
+            for key in keys:
+                listeners = Input._bindings.get((key, edge))
+                if not listeners:
+                    continue
+                for owner, listener in listeners.items():
+                    call = calls.get(owner)
+                    if call is None:
+                        calls[owner] = (listener, [key])
+                    else:
+                        call[1].append(key)
+        for listener, keys in calls.values():
+            listener(keys)
+
+    @staticmethod
+    def bind(owner: Hashable, keys: list[int], edge: KeyEdge, listener: Callable[[list[int]], Any]):
+        """Calls the listener once per frame in which some of the keys change as given by edge.
+
+        Args:
+            owner       Object the binding belongs to, used to unbind it.
+            keys        Keys to listen to.
+            edge        PRESSED or RELEASED to be called when keys change, HELD to be called every frame while
+                        the keys are held.
+            listener    Receives the list of the keys that changed.
+        """
+        bindings = Input._owners.setdefault(owner, [])
+        for key in keys:
+            listeners = Input._bindings.get((key, edge))
+            if listeners is None:
+                listeners = Input._bindings[(key, edge)] = {}
+            listeners[owner] = listener
+            bindings.append((key, edge))
+
+    @staticmethod
+    def unbind(owner: Hashable):
+        """Removes all bindings of the owner.
+        """
+        for binding in Input._owners.pop(owner, ()):
+            listeners = Input._bindings.get(binding)
+            if listeners is None:
+                continue
+            listeners.pop(owner, None)
+            if not listeners:
+                del Input._bindings[binding]
+
+    @staticmethod
+    def is_held(key: int) -> bool:
+        return key in Input.held
+
+    @staticmethod
+    def is_pressed(key: int) -> bool:
+        return key in Input.pressed
+
+    @staticmethod
+    def is_released(key: int) -> bool:
+        return key in Input.released
@@ -0,0 +1,92 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+import asyncio
+import json
+import pygame as pg
+
+
+class AssetLoader:
+    """Loads assets on a thread pool, so the window keeps responding while a scene is being prepared.
+
+    Every method returns a concurrent.futures.Future immediately. Reading files and decoding images release the
+    GIL, so several assets are loaded in parallel with the main thread.
+
+    Surfaces are returned as loaded: convert them on the main thread, e.g. through AssetManager.
+
+    total       Number of requested assets.
+    completed   Number of assets that are loaded or failed.
+    """
+    executor: ThreadPoolExecutor
+    futures: list[Future]
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        self.executor = executor
+        self.futures = []
+
+    def submit(self, function: Callable[..., Any], *args) -> Future:
+        """Runs the function on the thread pool and tracks it as an asset.
+        """
+        future = self.executor.submit(function, *args)
+        self.futures.append(future)
+        return future
+
+    def image(self, path: str) -> Future:
+        """Loads an image as a pygame.Surface.
+        """
+        return self.submit(pg.image.load, path)
+
+    def font(self, path: str | None, size: int) -> Future:
+        """Loads a font file as a pygame.font.Font. Uses the default font if path is None.
+        """
+        return self.submit(pg.font.Font, path, size)
+
+    def json(self, path: str) -> Future:
+        return self.submit(_read_json, path)
+
+    def bytes(self, path: str) -> Future:
+        return self.submit(_read_bytes, path)
+
+    @property
+    def total(self) -> int:
+        return len(self.futures)
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for future in self.futures if future.done())
+
+    @property
+    def progress(self) -> float:
+        """Part of the requested assets that have been loaded, from 0 to 1.
+        """
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    @property
+    def done(self) -> bool:
+        return self.completed >= self.total
+
+    def raise_errors(self):
+        """Raises the exception of the first asset that failed to load, if any. Doesn't wait for other assets.
+        """
+        for future in self.futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+
+    async def wait(self):
+        """Waits until all assets are loaded without blocking the event loop.
+
+        Raises:
+            The exception of the first asset that failed to load.
+        """
+        for future in self.futures:
+            await asyncio.wrap_future(future)
+
+
+def _read_json(path: str) -> Any:
+    with open(path, "rb") as file:
+        return json.loads(file.read())
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
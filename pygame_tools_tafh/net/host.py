@@ -1,13 +1,99 @@
-from .serialization import PlayerConn
+from typing import Any, Callable
+import asyncio
+import logging
+
+from .serialization import PlayerConn, Serializable, encode_message
 
 
 class Host:
+    """asyncio server that accepts players and exchanges messages with them.
+
+    The server runs in the event loop of Engine.load_scene, so no thread is needed per connection.
+
+    players     Connected players.
+
+    Example:
+
+    host = Host(port=7777)
+    host.on("move", lambda player, data: ...)
+
+    class GameScene(Scene):
+        def load(self, data):
+            asyncio.ensure_future(host.start())
+    """
     players: list[PlayerConn]
-    
-    def __init__(self):
+    address: str
+    port: int
+    max_buffer: int
+    max_frame: int
+    _server: asyncio.Server | None
+    _listeners: dict[str, list[Callable[[PlayerConn, Any], Any]]]
+
+    def __init__(self, address: str = "0.0.0.0", port: int = 7777, max_buffer: int = 1 << 20, max_frame: int = 1 << 20):
         self.players = []
+        self.address = address
+        self.port = port
+        self.max_buffer = max_buffer
+        self.max_frame = max_frame
+        self._server = None
+        self._listeners = {}
+
+    async def start(self):
+        """Starts accepting players.
+        """
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: PlayerConn(self, self.max_buffer, self.max_frame), self.address, self.port
+        )
+        logging.info(f"Host listening on {self.address}:{self.port}")
+
+    async def stop(self):
+        """Disconnects all players and stops accepting new ones.
+        """
+        for player in self.players[:]:
+            player.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def on(self, event: str, listener: Callable[[PlayerConn, Any], Any]):
+        """Registers a listener for messages from any player. Listener receives the player and the data.
+
+        Besides the messages sent by players, "connect" is emitted when a player connects and "disconnect" when
+        it disconnects.
+        """
+        if event not in self._listeners.keys():
+            self._listeners[event] = []
+        self._listeners[event].append(listener)
+
+    def broadcast(self, event: str, data: Serializable | dict[str, Any], exclude: PlayerConn | None = None, droppable: bool = False):
+        """Sends a message to every player. The message is encoded only once.
+
+        Args:
+            event       Name of the event.
+            data        Payload of the message.
+            exclude     Player that shouldn't receive the message.
+            droppable   Skip players whose connection is congested instead of queueing more data for them.
+        """
+        frame = encode_message(event, data)
+        for player in self.players:
+            if player is not exclude:
+                player.send_frame(frame, droppable)
+
+    def emit(self, event: str, data: Serializable | dict[str, Any]):
+        self.broadcast(event, data)
 
-    def emit(self):
-        pass
+    def _dispatch(self, player: PlayerConn, event: str, data: Any):
+        if event in self._listeners.keys():
+            for listener in self._listeners[event]:
+                listener(player, data)
 
+    def _connected(self, player: PlayerConn):
+        self.players.append(player)
+        self._dispatch(player, "connect", None)
 
+    def _disconnected(self, player: PlayerConn):
+        if player in self.players:
+            self.players.remove(player)
+        self._dispatch(player, "disconnect", None)
@@ -0,0 +1,264 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+import struct
+
+from .serialization import Serializable, PlayerConn, encode_message, _encode, _decode, _encode_key, _decode_key
+from .host import Host
+
+KEYFRAME = 0
+DELTA = 1
+
+# Object entries inside a snapshot.
+FULL = 0
+CHANGED = 1
+
+_HEADER = struct.Struct("!BII")
+_COUNT = struct.Struct("!I")
+_ENTRY = struct.Struct("!IB")
+_FIELD = struct.Struct("!B")
+
+Snapshot = dict[int, tuple]
+
+
+class Replicator:
+    """Server side of state replication.
+
+    Every tick the state of all replicated objects is captured with snapshot(). Each client then receives only
+    the fields that changed since the last snapshot it acknowledged, addressed by field ids instead of names.
+    Clients without a usable acknowledged snapshot, and every client each keyframe_interval ticks, receive a
+    keyframe with the full state, so clients can join late. Snapshots encoded against the same base are cached
+    and shared between clients.
+
+    Replicated fields of an object are Serializable.fields if declared, otherwise the keys returned by its first
+    serialize() call. A field id is the index of the field in that list.
+
+    tick                Number of the last captured snapshot.
+    keyframe_interval   Number of ticks between forced keyframes.
+    history             Number of snapshots kept to compute deltas against.
+    """
+    tick: int
+    keyframe_interval: int
+    history: int
+    objects: dict[int, Serializable]
+    _ids: dict[int, int]
+    _schemas: dict[int, tuple[str, ...]]
+    _snapshots: dict[int, Snapshot]
+    _acked: dict[Hashable, int]
+    _encoded: dict[int | None, bytes]
+    _next_id: int
+
+    def __init__(self, keyframe_interval: int = 60, history: int = 32):
+        self.tick = 0
+        self.keyframe_interval = keyframe_interval
+        self.history = history
+        self.objects = {}
+        self._ids = {}
+        self._schemas = {}
+        self._snapshots = {}
+        self._acked = {}
+        self._encoded = {}
+        self._next_id = 1
+
+    def add(self, obj: Serializable) -> int:
+        """Starts replicating the object.
+
+        Returns:
+            Network id of the object.
+        """
+        net_id = self._next_id
+        self._next_id += 1
+        self.objects[net_id] = obj
+        self._ids[id(obj)] = net_id
+        return net_id
+
+    def remove(self, obj: Serializable):
+        net_id = self._ids.pop(id(obj))
+        del self.objects[net_id]
+        self._schemas.pop(net_id, None)
+
+    def snapshot(self):
+        """Captures the state of all replicated objects as a new tick.
+        """
+        snapshot = {}
+        for net_id, obj in self.objects.items():
+            data = obj.serialize()
+            schema = self._schemas.get(net_id)
+            if schema is None:
+                schema = self._schemas[net_id] = tuple(type(obj).fields or data.keys())
+            snapshot[net_id] = tuple(data[field] for field in schema)
+
+        self.tick += 1
+        self._snapshots[self.tick] = snapshot
+        self._snapshots.pop(self.tick - self.history, None)
+        self._encoded = {}
+
+    def acknowledge(self, client: Hashable, tick: int):
+        """Records that the client has applied the snapshot of the given tick.
+        """
+        if tick > self._acked.get(client, 0):
+            self._acked[client] = tick
+
+    def forget(self, client: Hashable):
+        self._acked.pop(client, None)
+
+    def encode_for(self, client: Hashable) -> bytes:
+        """Encodes the latest snapshot for the client, as a delta when possible.
+        """
+        base = self._acked.get(client)
+        if base not in self._snapshots or self.tick % self.keyframe_interval == 0:
+            base = None
+
+        data = self._encoded.get(base)
+        if data is None:
+            data = self._encoded[base] = self._encode(base)
+        return data
+
+    def _encode(self, base: int | None) -> bytes:
+        current = self._snapshots[self.tick]
+        previous = self._snapshots[base] if base is not None else {}
+        out = bytearray(_HEADER.pack(KEYFRAME if base is None else DELTA, self.tick, base or 0))
+
+        count_at = len(out)
+        out += _COUNT.pack(0)
+        count = 0
+        for net_id, values in current.items():
+            old = previous.get(net_id)
+            if old is None:
+                schema = self._schemas[net_id]
+                out += _ENTRY.pack(net_id, FULL)
+                out += _FIELD.pack(len(schema))
+                for field, value in zip(schema, values):
+                    _encode_key(out, field)
+                    _encode(out, value)
+            elif old != values:
+                changed = [i for i, (a, b) in enumerate(zip(old, values)) if a != b]
+                out += _ENTRY.pack(net_id, CHANGED)
+                out += _FIELD.pack(len(changed))
+                for i in changed:
+                    out += _FIELD.pack(i)
+                    _encode(out, values[i])
+            else:
+                continue
+            count += 1
+        _COUNT.pack_into(out, count_at, count)
+
+        removed = [net_id for net_id in previous if net_id not in current]
+        out += _COUNT.pack(len(removed))
+        for net_id in removed:
+            out += _COUNT.pack(net_id)
+        return bytes(out)
+
+    def attach(self, host: Host):
+        """Receives acknowledgements from the players of the host. Use send() to replicate to them.
+        """
+        host.on("ack", lambda player, data: self.acknowledge(player, data))
+        host.on("disconnect", lambda player, data: self.forget(player))
+
+    def send(self, host: Host, event: str = "replicate"):
+        """Captures a snapshot and sends it to every player of the host.
+
+        Snapshots are droppable: a congested player simply acknowledges a later one.
+        """
+        self.snapshot()
+        frames = {}
+        for player in host.players:
+            data = self.encode_for(player)
+            frame = frames.get(id(data))
+            if frame is None:
+                frame = frames[id(data)] = encode_message(event, data)
+            player.send_frame(frame, droppable=True)
+
+
+class ReplicaState:
+    """Client side of state replication. Applies snapshots produced by Replicator.
+
+    objects     Replicated state, field names to values for every network id.
+    tick        Tick of the last applied snapshot.
+    """
+    objects: dict[int, dict[str, Any]]
+    tick: int
+    _schemas: dict[int, tuple[str, ...]]
+    _snapshots: OrderedDict[int, Snapshot]
+    history: int
+
+    def __init__(self, history: int = 32):
+        self.objects = {}
+        self.tick = 0
+        self.history = history
+        self._schemas = {}
+        self._snapshots = OrderedDict()
+
+    def apply(self, data: bytes) -> int | None:
+        """Applies an encoded snapshot.
+
+        Returns:
+            Tick to acknowledge, or None if the snapshot is outdated or its base is unknown.
+        """
+        with memoryview(data) as buf:
+            kind, tick, base = _HEADER.unpack_from(buf, 0)
+            if tick <= self.tick:
+                return None
+            if kind == KEYFRAME:
+                snapshot = {}
+            elif base in self._snapshots:
+                snapshot = dict(self._snapshots[base])
+            else:
+                return None
+
+            # Objects are updated incrementally only when the delta continues the state shown right now.
+            incremental = kind == DELTA and base == self.tick
+            objects = self.objects if incremental else {}
+
+            offset = _HEADER.size
+            (count,) = _COUNT.unpack_from(buf, offset)
+            offset += _COUNT.size
+            for _ in range(count):
+                net_id, entry = _ENTRY.unpack_from(buf, offset)
+                offset += _ENTRY.size
+                (fields,) = _FIELD.unpack_from(buf, offset)
+                offset += _FIELD.size
+                if entry == FULL:
+                    schema = []
+                    values = []
+                    for _ in range(fields):
+                        field, offset = _decode_key(buf, offset)
+                        value, offset = _decode(buf, offset)
+                        schema.append(field)
+                        values.append(value)
+                    self._schemas[net_id] = tuple(schema)
+                else:
+                    values = list(snapshot[net_id])
+                    for _ in range(fields):
+                        (index,) = _FIELD.unpack_from(buf, offset)
+                        values[index], offset = _decode(buf, offset + _FIELD.size)
+                snapshot[net_id] = tuple(values)
+                if incremental:
+                    objects[net_id] = dict(zip(self._schemas[net_id], values))
+
+            (count,) = _COUNT.unpack_from(buf, offset)
+            offset += _COUNT.size
+            for _ in range(count):
+                (net_id,) = _COUNT.unpack_from(buf, offset)
+                offset += _COUNT.size
+                snapshot.pop(net_id, None)
+                objects.pop(net_id, None)
+
+        if not incremental:
+            for net_id, values in snapshot.items():
+                objects[net_id] = dict(zip(self._schemas[net_id], values))
+            self.objects = objects
+        self.tick = tick
+        # Ticks only grow, so the oldest snapshots are first. Ticks may be skipped, so all the old ones are dropped.
+        self._snapshots[tick] = snapshot
+        while next(iter(self._snapshots)) <= tick - self.history:
+            self._snapshots.popitem(last=False)
+        return tick
+
+    def attach(self, conn: PlayerConn, event: str = "replicate"):
+        """Applies snapshots received from the server and acknowledges them.
+        """
+        def on_snapshot(data: bytes):
+            tick = self.apply(data)
+            if tick is not None:
+                conn.emit("ack", tick)
+        conn.on(event, on_snapshot)
@@ -1,92 +1,383 @@
-from typing import Callable
-import socket
+from typing import Any, Callable, Iterator, TYPE_CHECKING
+import asyncio
+import logging
+import struct
+
+if TYPE_CHECKING:
+    from .host import Host
+
+# Every value is encoded as a one byte type tag followed by its payload.
+NONE = 0
+STR = 1
+INT = 2
+FLOAT = 3
+BOOL = 4
+LIST = 5
+DICT = 6
+BYTES = 7
+
+_TAG = struct.Struct("!B")
+_LENGTH = struct.Struct("!I")
+_KEY_LENGTH = struct.Struct("!H")
+_INT = struct.Struct("!Bq")
+_FLOAT = struct.Struct("!Bd")
+_BOOL = struct.Struct("!B?")
+_SIZED = struct.Struct("!BI")
+_INT_VALUE = struct.Struct("!q")
+_FLOAT_VALUE = struct.Struct("!d")
+
+# Messages are framed as a 4 byte payload length followed by the event name and the encoded data.
+HEADER_SIZE = _LENGTH.size
 
-SEPARATOR = bytes([0x00])
 
 class Serializable:
+    """Base class for objects that can be sent over the network.
+
+    fields  Names of the fields replicated by net.replication.Replicator, in the order of their ids.
+            If empty, the keys of the first serialize() result are used.
+    """
+    fields: tuple[str, ...] = ()
 
-    def serialize(self) -> dict[str, str | int]:
+    def serialize(self) -> dict[str, Any]:
         return {}
 
     def to_bytes(self) -> bytes:
         return serialize(self.serialize())
 
-def serialize(dc: dict[str, str | int]) -> bytes:
-    data = bytes()
-    for key, value in dc.items():
-        data += key.encode()
-        data += SEPARATOR
-        if isinstance(value, str):
-            data += bytes([1])
-            data += value.encode()
-            data += bytes([0])
-        elif isinstance(value, int):
-            data += bytes([2])
-            data += value.to_bytes(4, "big")
-        else:
-            raise Exception("Invalid type")
-
-    data += bytes([0, 0])
-    return data
-
-class PlayerConn:
-    conn: socket.socket
-    name: str
+
+def _encode_key(out: bytearray, key: str):
+    data = key.encode()
+    out += _KEY_LENGTH.pack(len(data))
+    out += data
+
+def _encode(out: bytearray, value: Any):
+    # bool is a subclass of int, so it has to be checked first.
+    if value is None:
+        out += _TAG.pack(NONE)
+    elif value is True or value is False:
+        out += _BOOL.pack(BOOL, value)
+    elif isinstance(value, int):
+        out += _INT.pack(INT, value)
+    elif isinstance(value, float):
+        out += _FLOAT.pack(FLOAT, value)
+    elif isinstance(value, str):
+        data = value.encode()
+        out += _SIZED.pack(STR, len(data))
+        out += data
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        out += _SIZED.pack(BYTES, len(value))
+        out += value
+    elif isinstance(value, dict):
+        out += _SIZED.pack(DICT, len(value))
+        for key, item in value.items():
+            _encode_key(out, key)
+            _encode(out, item)
+    elif isinstance(value, (list, tuple)):
+        out += _SIZED.pack(LIST, len(value))
+        for item in value:
+            _encode(out, item)
+    elif isinstance(value, Serializable):
+        _encode(out, value.serialize())
+    else:
+        raise Exception(f"Invalid type: {type(value)}")
+
+def _decode_key(buf: memoryview, offset: int) -> tuple[str, int]:
+    (length,) = _KEY_LENGTH.unpack_from(buf, offset)
+    offset += _KEY_LENGTH.size
+    return str(buf[offset:offset + length], "utf-8"), offset + length
+
+def _decode(buf: memoryview, offset: int) -> tuple[Any, int]:
+    tag = buf[offset]
+    offset += 1
+    match tag:
+        case 0:
+            return None, offset
+        case 1:
+            (length,) = _LENGTH.unpack_from(buf, offset)
+            offset += _LENGTH.size
+            return str(buf[offset:offset + length], "utf-8"), offset + length
+        case 2:
+            return _INT_VALUE.unpack_from(buf, offset)[0], offset + _INT_VALUE.size
+        case 3:
+            return _FLOAT_VALUE.unpack_from(buf, offset)[0], offset + _FLOAT_VALUE.size
+        case 4:
+            return buf[offset] != 0, offset + 1
+        case 5:
+            (count,) = _LENGTH.unpack_from(buf, offset)
+            offset += _LENGTH.size
+            items = []
+            for _ in range(count):
+                item, offset = _decode(buf, offset)
+                items.append(item)
+            return items, offset
+        case 6:
+            (count,) = _LENGTH.unpack_from(buf, offset)
+            offset += _LENGTH.size
+            obj = {}
+            for _ in range(count):
+                key, offset = _decode_key(buf, offset)
+                obj[key], offset = _decode(buf, offset)
+            return obj, offset
+        case 7:
+            (length,) = _LENGTH.unpack_from(buf, offset)
+            offset += _LENGTH.size
+            return bytes(buf[offset:offset + length]), offset + length
+        case _:
+            raise Exception(f"Invalid type tag: {tag}")
+
+def serialize(dc: dict[str, Any]) -> bytes:
+    """Encodes a value into bytes. Supports None, bool, int, float, str, bytes and nested lists and dicts.
+    """
+    out = bytearray()
+    _encode(out, dc)
+    return bytes(out)
+
+def deserialize(data: bytes | memoryview) -> Any:
+    """Decodes a value encoded by serialize().
+    """
+    with memoryview(data) as buf:
+        return _decode(buf, 0)[0]
+
+def encode_message(event: str, data: Serializable | dict[str, Any]) -> bytes:
+    """Encodes a framed message ready to be sent in one call.
+
+    Args:
+        event   Name of the event.
+        data    Payload of the message.
+
+    Returns:
+        Length prefix, event name and encoded data.
+    """
+    out = bytearray(HEADER_SIZE)
+    _encode_key(out, event)
+    _encode(out, data.serialize() if isinstance(data, Serializable) else data)
+    _LENGTH.pack_into(out, 0, len(out) - HEADER_SIZE)
+    return bytes(out)
+
+def decode_message(payload: bytes | memoryview) -> tuple[str, Any]:
+    """Decodes the payload of a frame produced by encode_message().
+
+    Returns:
+        Name of the event and its data.
+    """
+    with memoryview(payload) as buf:
+        event, offset = _decode_key(buf, 0)
+        return event, _decode(buf, offset)[0]
+
+
+class FrameBuffer:
+    """Receive buffer that splits a byte stream into length-prefixed frames.
+
+    Data is received directly into the buffer (see get_buffer()), so a single recv_into() call can deliver
+    any number of messages.
+
+    max_frame   Maximum payload size in bytes. Longer frames are never buffered, see overflow.
+    overflow    True once a frame longer than max_frame was announced. No frames are returned after that.
+    """
+    max_frame: int
+    overflow: bool
+    _data: bytearray
+    _start: int
+    _end: int
+
+    def __init__(self, capacity: int = 65536, max_frame: int = 1 << 20):
+        self.max_frame = max_frame
+        self.overflow = False
+        self._data = bytearray(capacity)
+        self._start = 0
+        self._end = 0
+
+    def get_buffer(self, min_size: int = 4096) -> memoryview:
+        """Returns writable free space at the end of the buffer. Call commit() after writing into it.
+        """
+        if self._start == self._end:
+            self._start = self._end = 0
+        if len(self._data) - self._end < min_size:
+            pending = self._end - self._start
+            if self._start > 0:
+                self._data[:pending] = self._data[self._start:self._end]
+                self._start, self._end = 0, pending
+            if len(self._data) - self._end < min_size:
+                self._data.extend(bytes(max(min_size, len(self._data))))
+        return memoryview(self._data)[self._end:]
+
+    def commit(self, size: int):
+        """Marks size bytes written into the memory returned by get_buffer() as received.
+        """
+        self._end += size
+
+    def feed(self, data: bytes):
+        """Copies received data into the buffer.
+        """
+        with self.get_buffer(len(data)) as buf:
+            buf[:len(data)] = data
+        self.commit(len(data))
+
+    def _next_frame(self) -> tuple[int, int] | None:
+        """Consumes the next complete frame and returns bounds of its payload, or None if there is none yet.
+        """
+        if self.overflow or self._end - self._start < HEADER_SIZE:
+            return None
+        (length,) = _LENGTH.unpack_from(self._data, self._start)
+        if length > self.max_frame:
+            self.overflow = True
+            return None
+        start = self._start + HEADER_SIZE
+        end = start + length
+        if end > self._end:
+            return None
+        self._start = end
+        return start, end
+
+    def frames(self) -> Iterator[bytes]:
+        """Iterates over payloads of all complete frames received so far.
+        """
+        while (bounds := self._next_frame()) is not None:
+            yield bytes(self._data[bounds[0]:bounds[1]])
+
+    def messages(self) -> Iterator[tuple[str, Any]]:
+        """Iterates over all complete messages received so far. Payloads are decoded in place, without copying.
+        """
+        while (bounds := self._next_frame()) is not None:
+            with memoryview(self._data) as buf, buf[bounds[0]:bounds[1]] as payload:
+                message = decode_message(payload)
+            yield message
+
+
+class PlayerConn(asyncio.BufferedProtocol):
+    """Non-blocking connection to a player, driven by the asyncio event loop.
+
+    Incoming data is received straight into a FrameBuffer and every complete message is dispatched to the
+    listeners. Outgoing messages never block: they are queued in the transport, and a player whose queue grows
+    over max_buffer bytes is disconnected so it can't exhaust the memory of the server. So is a player that
+    announces an incoming message longer than max_frame bytes.
+
+    name            Name of the player, sent in the first "name" message.
+    congested       True while the transport asks to stop writing (its buffer is over the high-water mark).
+    max_buffer      Maximum number of queued outgoing bytes.
+    max_frame       Maximum size of an incoming message in bytes.
+    """
+    transport: asyncio.Transport | None
+    name: str | None
+    congested: bool
+    max_buffer: int
+    max_frame: int
     _listeners: dict[str, list[Callable]]
+    _buffer: FrameBuffer
+    _drained: asyncio.Event | None
 
-    def __init__(self, conn) -> None:
-        self.conn = conn
+    def __init__(self, host: "Host | None" = None, max_buffer: int = 1 << 20, max_frame: int = 1 << 20) -> None:
+        self.host = host
+        self.transport = None
+        self.name = None
+        self.congested = False
+        self.max_buffer = max_buffer
+        self.max_frame = max_frame
         self._listeners = {}
+        self._buffer = FrameBuffer(max_frame=max_frame)
+        self._drained = None
 
     def on(self, event: str, listener: Callable):
         if event not in self._listeners.keys():
             self._listeners[event] = []
         self._listeners[event].append(listener)
 
-    def emit(self, event: str, data: Serializable):
-        self.conn.send(event.encode())
-        self.conn.send(SEPARATOR)
-        self.conn.send(data.to_bytes())
+    def emit(self, event: str, data: Serializable | dict[str, Any]):
+        self.send_frame(encode_message(event, data))
+
+    def send_frame(self, frame: bytes, droppable: bool = False) -> bool:
+        """Queues an already encoded message.
+
+        Args:
+            frame       Message produced by encode_message().
+            droppable   Skip the message instead of queueing it while the connection is congested.
+
+        Returns:
+            True if the message was queued.
+        """
+        transport = self.transport
+        if transport is None or transport.is_closing():
+            return False
+        if droppable and self.congested:
+            return False
+        if transport.get_write_buffer_size() + len(frame) > self.max_buffer:
+            logging.warning(f"Disconnecting player {self.name}: too much pending data")
+            transport.abort()
+            return False
+        transport.write(frame)
+        return True
 
-    async def load(self):
-        event = self.read_string()
-        data = self.read_object()
+    async def drain(self):
+        """Waits until the transport accepts more data.
+        """
+        if self.congested:
+            if self._drained is None:
+                self._drained = asyncio.Event()
+            await self._drained.wait()
 
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+    def dispatch(self, event: str, data: Any):
         if event in self._listeners.keys():
             for listener in self._listeners[event]:
                 listener(data)
 
-    def load_name(self):
-        name = self.read_string()
-        self.name = name
-        return name
-    
-    def read_object(self):
-        obj = {}
-        while 1:
-            key = self.read_string()
-            tp = int.from_bytes(self.conn.recv(1), "big")
-
-            match tp:
-                case 0:
-                    break
-                case 1:
-                    obj[key] = self.read_string()
-                case 2:
-                    obj[key] = self.read_int()
-                case _:
-                    break
-        return obj
-
-    def read_string(self):
-        bts = bytes()
-        while 1:
-            bt = self.conn.recv(1)
-            if bt == SEPARATOR:
-                break
-            bts += bt
-        return bts.decode()
-    
-    def read_int(self):
-        bts = self.conn.recv(4)
-        return int.from_bytes(bts, "big")
\ No newline at end of file
+    # asyncio.BufferedProtocol callbacks
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.transport = transport
+        transport.set_write_buffer_limits(high=self.max_buffer // 4)
+        if self.host is not None:
+            self.host._connected(self)
+
+    def connection_lost(self, exc: Exception | None):
+        self.transport = None
+        if self._drained is not None:
+            self._drained.set()
+        self.dispatch("disconnect", exc)
+        if self.host is not None:
+            self.host._disconnected(self)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._buffer.get_buffer(max(sizehint, 4096))
+
+    def buffer_updated(self, nbytes: int):
+        self._buffer.commit(nbytes)
+        for event, data in self._buffer.messages():
+            if event == "name" and self.name is None:
+                self.name = data
+            self.dispatch(event, data)
+            if self.host is not None:
+                self.host._dispatch(self, event, data)
+        if self._buffer.overflow and self.transport is not None:
+            logging.warning(f"Disconnecting player {self.name}: message over {self.max_frame} bytes")
+            self.transport.abort()
+
+    def pause_writing(self):
+        self.congested = True
+        if self._drained is not None:
+            self._drained.clear()
+
+    def resume_writing(self):
+        self.congested = False
+        if self._drained is not None:
+            self._drained.set()
+
+
+async def connect(host: str, port: int, name: str) -> PlayerConn:
+    """Connects to a Host as a client and introduces itself.
+
+    Args:
+        host    Address of the server.
+        port    Port of the server.
+        name    Name of the player.
+
+    Returns:
+        Connection to the server. Use on() and emit() as on the server side.
+    """
+    loop = asyncio.get_running_loop()
+    _, conn = await loop.create_connection(PlayerConn, host, port)
+    conn.emit("name", name)
+    return conn
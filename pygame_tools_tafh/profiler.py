@@ -0,0 +1,201 @@
+from collections import deque
+from time import perf_counter_ns
+import csv
+import json
+import pygame as pg
+
+from .components.ui.fonts import get_font, GlyphAtlas
+
+# Frames are stored as (start, end, phases), where phases is a list of (name, start, end). Times are in ns.
+Frame = tuple[int, int, list[tuple[str, int, int]]]
+
+
+class Profiler:
+    """Records where the time of every frame goes.
+
+    The engine splits every frame into phases (events, update, tweens, clicks, cull, draw, present) and, while
+    the profiler is enabled, reports the end of each phase with mark(). Update and draw are then also timed per
+    component class. While disabled, the engine only checks the enabled flag.
+
+    Times of sprites drawn through SpriteBatch are included in the draw phase, but not in the time of their
+    component class, since they are blitted together.
+
+    enabled     If false, nothing is recorded.
+    overlay     If true, statistics are drawn over the game.
+    frames      Last recorded frames, oldest first.
+    components  Total time in nanoseconds and number of calls per (component class name, "update" or "draw").
+
+    Example:
+
+    engine.profiler.enabled = True
+    ...
+    print(engine.profiler.percentile(99))
+    engine.profiler.export_chrome_trace("trace.json")  # open in chrome://tracing or Perfetto
+    """
+    enabled: bool
+    overlay: bool
+    frames: deque[Frame]
+    components: dict[tuple[str, str], list[int]]
+    _start: int
+    _last: int
+    _phases: list[tuple[str, int, int]]
+
+    def __init__(self, history: int = 600):
+        self.enabled = False
+        self.overlay = False
+        self.frames = deque(maxlen=history)
+        self.components = {}
+        self._start = 0
+        self._last = 0
+        self._phases = []
+
+    def clear(self):
+        self.frames.clear()
+        self.components = {}
+
+    def begin_frame(self):
+        self._start = self._last = perf_counter_ns()
+        self._phases = []
+
+    def mark(self, phase: str):
+        """Ends the current phase of the frame. A phase can be reported several times per frame.
+        """
+        now = perf_counter_ns()
+        self._phases.append((phase, self._last, now))
+        self._last = now
+
+    def end_frame(self):
+        self.frames.append((self._start, perf_counter_ns(), self._phases))
+
+    def record(self, component: object, method: str, time: int):
+        """Adds the time of one call of a component method. Passed as timer to GameObject.update() and draw().
+
+        Args:
+            component   Component that was called.
+            method      "update" or "draw".
+            time        Duration of the call in nanoseconds.
+        """
+        key = (type(component).__name__, method)
+        stats = self.components.get(key)
+        if stats is None:
+            self.components[key] = [time, 1]
+        else:
+            stats[0] += time
+            stats[1] += 1
+
+    # Statistics
+
+    def frame_times(self) -> list[float]:
+        """Returns durations of the recorded frames in milliseconds, oldest first.
+        """
+        return [(end - start) / 1e6 for start, end, _ in self.frames]
+
+    def percentile(self, percent: float) -> float:
+        """Returns the frame time in milliseconds that the given percent of recorded frames don't exceed.
+        """
+        times = sorted(self.frame_times())
+        if not times:
+            return 0.0
+        index = min(len(times) - 1, max(0, round(percent / 100 * len(times)) - 1))
+        return times[index]
+
+    def histogram(self, bucket: float = 1.0) -> dict[float, int]:
+        """Counts recorded frames by their duration.
+
+        Args:
+            bucket  Width of a bucket in milliseconds.
+
+        Returns:
+            Number of frames for the lower bound of every non-empty bucket, in ascending order.
+        """
+        counts = {}
+        for time in self.frame_times():
+            low = time // bucket * bucket
+            counts[low] = counts.get(low, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def phase_averages(self) -> dict[str, float]:
+        """Returns average time per frame of every phase in milliseconds.
+        """
+        totals = {}
+        for _, _, phases in self.frames:
+            for name, start, end in phases:
+                totals[name] = totals.get(name, 0) + end - start
+        count = max(1, len(self.frames))
+        return {name: total / count / 1e6 for name, total in totals.items()}
+
+    def component_averages(self) -> dict[tuple[str, str], float]:
+        """Returns average time per call in milliseconds for every component class and method, slowest first.
+        """
+        averages = {key: total / calls / 1e6 for key, (total, calls) in self.components.items()}
+        return dict(sorted(averages.items(), key=lambda item: -item[1]))
+
+    def summary(self) -> dict:
+        times = self.frame_times()
+        return {
+            "frames": len(times),
+            "average": sum(times) / len(times) if times else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(times, default=0.0),
+            "phases": self.phase_averages(),
+            "components": {f"{name}.{method}": time for (name, method), time in self.component_averages().items()},
+        }
+
+    # Export
+
+    def export_csv(self, filename: str):
+        """Writes one row per recorded frame with its duration and the duration of every phase in milliseconds.
+        """
+        names = list(self.phase_averages())
+        with open(filename, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "total"] + names)
+            for i, (start, end, phases) in enumerate(self.frames):
+                totals = dict.fromkeys(names, 0)
+                for name, phase_start, phase_end in phases:
+                    totals[name] += phase_end - phase_start
+                writer.writerow([i, (end - start) / 1e6] + [totals[name] / 1e6 for name in names])
+
+    def export_json(self, filename: str):
+        """Writes summary() and the frame times.
+        """
+        with open(filename, "w") as file:
+            json.dump({"summary": self.summary(), "frames": self.frame_times()}, file, indent=2)
+
+    def export_chrome_trace(self, filename: str):
+        """Writes the recorded frames in the Chrome trace event format.
+        """
+        events = []
+        for start, end, phases in self.frames:
+            events.append({"name": "frame", "ph": "X", "ts": start / 1e3, "dur": (end - start) / 1e3, "pid": 0, "tid": 0})
+            for name, phase_start, phase_end in phases:
+                events.append({
+                    "name": name, "ph": "X", "ts": phase_start / 1e3, "dur": (phase_end - phase_start) / 1e3, "pid": 0, "tid": 0
+                })
+        with open(filename, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    # Overlay
+
+    def draw_overlay(self, surface: pg.Surface) -> pg.Rect:
+        """Draws frame statistics in the top left corner of the surface.
+
+        Returns:
+            Area covered by the overlay.
+        """
+        atlas = GlyphAtlas.get(get_font("Consolas", 16), (255, 255, 255))
+        lines = [
+            f"frame {self.percentile(50):.2f} ms  p95 {self.percentile(95):.2f}  p99 {self.percentile(99):.2f}"
+        ]
+        for name, time in self.phase_averages().items():
+            lines.append(f"{name} {time:.2f} ms")
+        rendered = [atlas.render(line) for line in lines]
+
+        height = atlas.font.get_height()
+        rect = pg.Rect(0, 0, max(text.get_width() for text in rendered) + 8, height * len(rendered) + 8)
+        surface.set_clip(None)
+        surface.fill((0, 0, 0), rect)
+        surface.blits([(text, (4, 4 + i * height)) for i, text in enumerate(rendered)], False)
+        return rect
@@ -1,16 +1,33 @@
-from .core.game_object import GameObject
+from .core.registry import Registry
+from .loader import AssetLoader
 
 
 class Scene:
     """Base class for scenes.
     
-    name    Name of the scene.
+    name        Name of the scene.
+    registry    Game objects of the scene, set while the scene is loaded.
     """
     name: str
+    registry: Registry | None
 
     def __init__(self, name: str):
         self.name = name
+        self.registry = None
         
+    def preload(self, loader: AssetLoader):
+        """Declares assets the scene needs. They are loaded in the background before load() is called.
+
+        Example:
+
+        def preload(self, loader):
+            AssetManager.get_default().preload(loader, "background.png")
+
+        def load(self, data):
+            obj.add_component(SurfaceComponent("background.png"))
+        """
+        pass
+
     def load(self, data: any):
         """Loads the scene, creates necessary game objects and components.
         
@@ -20,7 +37,8 @@ class Scene:
         pass
 
     def destroy(self):
-        for i in GameObject.objects:
-            GameObject.destroy(i)
-
-        GameObject.objects = []
+        """Destroys all game objects of the scene at once.
+        """
+        if self.registry is not None:
+            self.registry.destroy()
+            self.registry = None
@@ -5,6 +5,11 @@ from enum import Enum
 
 from .vmath.vector import Vector2d
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
 class EaseType(Enum):
     """Easing function types"""
     LINEAR = 0
@@ -85,9 +90,131 @@ class Easing:
             EaseType.IN_OUT_BACK: Easing.in_out_back,
         }[ease_type]
 
+    @staticmethod
+    def get_array_ease_function(ease_type: EaseType) -> Callable[["np.ndarray"], "np.ndarray"]:
+        """Returns easing function that works on whole NumPy arrays of progress values.
+        """
+        c2 = 1.70158 * 1.525
+        piecewise = {
+            EaseType.IN_OUT_QUAD: lambda t: np.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2),
+            EaseType.IN_OUT_CUBIC: lambda t: np.where(t < 0.5, 4 * t * t * t, 1 - (-2 * t + 2) ** 3 / 2),
+            EaseType.IN_OUT_BACK: lambda t: np.where(
+                t < 0.5,
+                ((2 * t) ** 2 * ((c2 + 1) * 2 * t - c2)) / 2,
+                ((2 * t - 2) ** 2 * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
+            ),
+        }
+        # The remaining functions only use arithmetic, so they work on arrays as they are.
+        return piecewise.get(ease_type) or Easing.get_ease_function(ease_type)
+
+class _TweenBatch:
+    """Numeric tweens with the same easing, advanced together with NumPy.
+
+    While a tween belongs to a batch, its timing state lives in the arrays below.
+    """
+
+    def __init__(self, ease_type: EaseType, capacity: int = 64):
+        self.ease_function = Easing.get_array_ease_function(ease_type)
+        self.tweens: list["Tween"] = []
+        self.elapsed = np.zeros(capacity)
+        self.delay = np.zeros(capacity)
+        self.delay_elapsed = np.zeros(capacity)
+        self.duration = np.ones(capacity)
+        self.start = np.zeros(capacity)
+        self.delta = np.zeros(capacity)
+
+    def _grow(self):
+        size = len(self.elapsed) * 2
+        for name in ("elapsed", "delay", "delay_elapsed", "duration", "start", "delta"):
+            old = getattr(self, name)
+            new = np.ones(size) if name == "duration" else np.zeros(size)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, tween: "Tween"):
+        index = len(self.tweens)
+        if index == len(self.elapsed):
+            self._grow()
+        self.tweens.append(tween)
+        self.elapsed[index] = tween.elapsed_time
+        self.delay[index] = tween.delay
+        self.delay_elapsed[index] = tween.delay_elapsed
+        self.duration[index] = tween.duration
+        self.set_values(index, tween.start_value, tween.end_value)
+        tween._batch = self
+        tween._batch_index = index
+
+    def remove(self, tween: "Tween"):
+        """Removes the tween by moving the last tween into its place. Writes timing state back to the tween.
+        """
+        index = tween._batch_index
+        tween.elapsed_time = float(self.elapsed[index])
+        tween.delay_elapsed = float(self.delay_elapsed[index])
+        tween._batch = None
+
+        last = len(self.tweens) - 1
+        moved = self.tweens.pop()
+        if index != last:
+            self.tweens[index] = moved
+            moved._batch_index = index
+            for array in (self.elapsed, self.delay, self.delay_elapsed, self.duration, self.start, self.delta):
+                array[index] = array[last]
+
+    def set_values(self, index: int, start: float, end: float):
+        self.start[index] = start
+        self.delta[index] = end - start
+
+    def update(self, dt: int):
+        count = len(self.tweens)
+        if count == 0:
+            return
+
+        delay_elapsed = self.delay_elapsed[:count]
+        delay_elapsed += dt
+        running = delay_elapsed >= self.delay[:count]
+        elapsed = self.elapsed[:count]
+        elapsed += dt * running
+
+        progress = np.minimum(elapsed / self.duration[:count], 1.0)
+        eased = self.ease_function(progress)
+        values = (self.start[:count] + self.delta[:count] * eased).tolist()
+
+        tweens = self.tweens[:]
+        indices = range(count) if running.all() else np.flatnonzero(running).tolist()
+        eased = eased.tolist()
+        for i in indices:
+            tween = tweens[i]
+            # Tweens stopped by a callback earlier in this loop must not write their target any more.
+            if tween._batch is not self:
+                continue
+            setattr(tween._owner, tween._attribute, values[i])
+            if tween.on_update:
+                tween.on_update(values[i], eased[i])
+
+        finished = np.flatnonzero(running & (progress >= 1.0)).tolist()
+        for tween in [tweens[i] for i in finished]:
+            if tween._batch is self:
+                tween._finish_cycle()
+
+
 class Tween:
-    """A class for creating smooth transitions between values in Pygame"""
-    active_tweens: list["Tween"] = []
+    """A class for creating smooth transitions between values in Pygame
+
+    Tweens between plain numbers are advanced in batches, one NumPy pass per easing type, when numpy is installed.
+    Active tweens are indexed by handle, target and group, so they can be found, paused or stopped in O(1).
+
+    handle  Stable integer id of the tween, see Tween.get().
+    group   Name of the group the tween belongs to, or None.
+    """
+    active_tweens: dict["Tween", None] = {}
+    batching: bool = np is not None
+
+    _batches: dict[EaseType, _TweenBatch] = {}
+    _unbatched: dict["Tween", None] = {}
+    _handles: dict[int, "Tween"] = {}
+    _targets: dict[int, dict["Tween", None]] = {}
+    _groups: dict[str, dict["Tween", None]] = {}
+    _next_handle: int = 1
 
     def __init__(
         self,
@@ -102,17 +229,20 @@ class Tween:
         yoyo: bool = False,
         on_start: Optional[Callable] = None,
         on_update: Optional[Callable] = None,
-        on_complete: Optional[Callable] = None
+        on_complete: Optional[Callable] = None,
+        group: Optional[str] = None
     ):
         self.target = target
         self.property = property
         self.start_value = start_value
         self.end_value = end_value
         self.duration = duration
+        self.ease_type = ease_type
         self.ease_function = Easing.get_ease_function(ease_type)
         self.delay = delay
         self.repeat = repeat
         self.yoyo = yoyo
+        self.group = group
         
         self.on_start = on_start
         self.on_update = on_update
@@ -121,52 +251,170 @@ class Tween:
         self.elapsed_time = 0
         self.delay_elapsed = 0
         self.is_running = False
+        self.is_paused = False
         self.is_complete = False
         self.current_repeat = 0
 
-    def start(self):
-        """Start the tween"""
+        self.handle = Tween._next_handle
+        Tween._next_handle += 1
+
+        self._owner = None
+        self._attribute = None
+        self._interpolate = None
+        self._batch = None
+        self._batch_index = -1
+
+    def _is_numeric(self) -> bool:
+        return all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in (self.start_value, self.end_value)
+        )
+
+    def _compile(self):
+        """Resolves the property path and picks the interpolation once, instead of on every update"""
+        parts = self.property.split('.')
+        obj = self.target
+        for part in parts[:-1]:
+            obj = getattr(obj, part)
+        self._owner = obj
+        self._attribute = parts[-1]
+
+        if isinstance(self.start_value, pygame.Color):
+            self._interpolate = self._interpolate_color
+        elif isinstance(self.start_value, tuple) and len(self.start_value) == 2:
+            self._interpolate = self._interpolate_pair
+        else:
+            self._interpolate = self._interpolate_generic
+
+    def start(self) -> int:
+        """Start the tween
+
+        Returns:
+            Handle of the tween.
+        """
         if not self.is_running and not self.is_complete:
             self.is_running = True
-            Tween.active_tweens.append(self)
+            self._compile()
+            Tween.active_tweens[self] = None
+            Tween._handles[self.handle] = self
+            Tween._targets.setdefault(id(self.target), {})[self] = None
+            if self.group is not None:
+                Tween._groups.setdefault(self.group, {})[self] = None
+            if not self.is_paused:
+                self._schedule()
             if self.on_start:
                 self.on_start()
+        return self.handle
+
+    def _schedule(self):
+        """Adds the tween to the structures that are advanced by update_all"""
+        if Tween.batching and self._is_numeric():
+            batch = Tween._batches.get(self.ease_type)
+            if batch is None:
+                batch = Tween._batches[self.ease_type] = _TweenBatch(self.ease_type)
+            batch.add(self)
+        else:
+            Tween._unbatched[self] = None
+
+    def _unschedule(self):
+        if self._batch is not None:
+            self._batch.remove(self)
+        else:
+            Tween._unbatched.pop(self, None)
+
+    def _deactivate(self):
+        Tween.active_tweens.pop(self, None)
+        Tween._handles.pop(self.handle, None)
+        self._unschedule()
+
+        key = id(self.target)
+        tweens = Tween._targets.get(key)
+        if tweens is not None:
+            tweens.pop(self, None)
+            if not tweens:
+                del Tween._targets[key]
+        if self.group is not None:
+            tweens = Tween._groups.get(self.group)
+            if tweens is not None:
+                tweens.pop(self, None)
+                if not tweens:
+                    del Tween._groups[self.group]
 
     def stop(self):
         """Stop the tween"""
         if self.is_running:
             self.is_running = False
-            if self in Tween.active_tweens:
-                Tween.active_tweens.remove(self)
+            self._deactivate()
+
+    def pause(self):
+        """Pause the tween. It keeps its progress and stays active, but isn't updated until resumed"""
+        if not self.is_paused:
+            self.is_paused = True
+            if self.is_running:
+                self._unschedule()
+
+    def resume(self):
+        """Resume the paused tween"""
+        if self.is_paused:
+            self.is_paused = False
+            if self.is_running:
+                self._schedule()
+
+    def _interpolate_color(self, progress: float) -> pygame.Color:
+        r = self.start_value.r + (self.end_value.r - self.start_value.r) * progress
+        g = self.start_value.g + (self.end_value.g - self.start_value.g) * progress
+        b = self.start_value.b + (self.end_value.b - self.start_value.b) * progress
+        a = self.start_value.a + (self.end_value.a - self.start_value.a) * progress
+        return pygame.Color(int(r), int(g), int(b), int(a))
+
+    def _interpolate_pair(self, progress: float) -> tuple[float, float]:
+        # For positions/vectors
+        x = self.start_value[0] + (self.end_value[0] - self.start_value[0]) * progress
+        y = self.start_value[1] + (self.end_value[1] - self.start_value[1]) * progress
+        return (x, y)
+
+    def _interpolate_generic(self, progress: float) -> Any:
+        return self.start_value + (self.end_value - self.start_value) * progress
 
     def _interpolate_value(self, progress: float) -> Any:
         """Interpolate between start and end values based on progress"""
-        if isinstance(self.start_value, pygame.Color):
-            r = self.start_value.r + (self.end_value.r - self.start_value.r) * progress
-            g = self.start_value.g + (self.end_value.g - self.start_value.g) * progress
-            b = self.start_value.b + (self.end_value.b - self.start_value.b) * progress
-            a = self.start_value.a + (self.end_value.a - self.start_value.a) * progress
-            return pygame.Color(int(r), int(g), int(b), int(a))
-        elif isinstance(self.start_value, tuple) and len(self.start_value) == 2:
-            # For positions/vectors
-            x = self.start_value[0] + (self.end_value[0] - self.start_value[0]) * progress
-            y = self.start_value[1] + (self.end_value[1] - self.start_value[1]) * progress
-            return (x, y)
-        return self.start_value + (self.end_value - self.start_value) * progress
+        if self._interpolate is None:
+            self._compile()
+        return self._interpolate(progress)
 
     def _set_property(self, value: Any):
         """Set the property value on the target object"""
-        parts = self.property.split('.')
-        obj = self.target
-        for part in parts[:-1]:
-            obj = getattr(obj, part)
-        setattr(obj, parts[-1], value)
+        if self._owner is None:
+            self._compile()
+        setattr(self._owner, self._attribute, value)
+
+    def _finish_cycle(self):
+        """Restarts the tween if it has repeats left, completes it otherwise"""
+        if self.repeat == -1 or self.current_repeat < self.repeat:
+            self.elapsed_time = 0
+            self.current_repeat += 1
+            if self.yoyo:
+                self.start_value, self.end_value = self.end_value, self.start_value
+            if self._batch is not None:
+                self._batch.elapsed[self._batch_index] = 0
+                self._batch.set_values(self._batch_index, self.start_value, self.end_value)
+        else:
+            self.is_complete = True
+            self.is_running = False
+            self._deactivate()
+            if self.on_complete:
+                self.on_complete()
 
     def update(self, dt: int):
         """Update the tween with the time delta in milliseconds"""
-        if not self.is_running or self.is_complete:
+        if not self.is_running or self.is_complete or self.is_paused:
             return
 
+        if self._batch is not None:
+            # Updated by hand, so the tween can't be advanced with the others anymore.
+            self._batch.remove(self)
+            Tween._unbatched[self] = None
+
         if self.delay > 0:
             self.delay_elapsed += dt
             if self.delay_elapsed < self.delay:
@@ -184,31 +432,58 @@ class Tween:
             self.on_update(current_value, eased_progress)
 
         if progress >= 1.0:
-            if self.repeat == -1 or self.current_repeat < self.repeat:
-                self.elapsed_time = 0
-                self.current_repeat += 1
-                if self.yoyo:
-                    self.start_value, self.end_value = self.end_value, self.start_value
-            else:
-                self.is_complete = True
-                self.is_running = False
-                Tween.active_tweens.remove(self)
-                if self.on_complete:
-                    self.on_complete()
+            self._finish_cycle()
 
     @staticmethod
     def update_all(dt: int):
         """Update all active tweens"""
-        # Create a copy of the list to avoid modification during iteration
-        for tween in Tween.active_tweens[:]:
+        for batch in list(Tween._batches.values()):
+            batch.update(dt)
+        # Create a copy to avoid modification during iteration
+        for tween in list(Tween._unbatched):
             tween.update(dt)
 
+    @staticmethod
+    def get(handle: int) -> Optional["Tween"]:
+        """Returns the active tween with the given handle, or None if it was stopped or completed"""
+        return Tween._handles.get(handle)
+
     @staticmethod
     def stop_all():
         """Stop all active tweens"""
-        for tween in Tween.active_tweens[:]:
-            tween.stop()
-        Tween.active_tweens.clear()
+        for tween in Tween.active_tweens:
+            tween.is_running = False
+            tween._batch = None
+        Tween.active_tweens = {}
+        Tween._batches = {}
+        Tween._unbatched = {}
+        Tween._handles = {}
+        Tween._targets = {}
+        Tween._groups = {}
+
+    @staticmethod
+    def stop_target(*targets: Any):
+        """Stop all tweens that animate properties of the given objects"""
+        for target in targets:
+            tweens = Tween._targets.get(id(target))
+            if tweens is not None:
+                for tween in list(tweens):
+                    tween.stop()
+
+    @staticmethod
+    def pause_group(group: str):
+        """Pause all tweens of the group"""
+        for tween in list(Tween._groups.get(group, ())):
+            tween.pause()
 
+    @staticmethod
+    def resume_group(group: str):
+        """Resume all paused tweens of the group"""
+        for tween in list(Tween._groups.get(group, ())):
+            tween.resume()
 
- 
+    @staticmethod
+    def stop_group(group: str):
+        """Stop all tweens of the group"""
+        for tween in list(Tween._groups.get(group, ())):
+            tween.stop()
@@ -3,10 +3,12 @@ from .vector import *
 from .modx import *
 from .others import *
 from .directions import *
+from .vector_array import *
 
 __all__ = [
     'Angle',
     'Vector2d',
+    'Vector2Array',
     'Modx',
     'complex_multiply',
     'Direction',
@@ -14,7 +14,8 @@ class Direction(Modx):
         return Direction((ang.get() + pi / 4) // (pi / 2))
 
     def to_vector(self) -> Vector2d:
-        return Directions.AsVector2D[self.value]
+        # Copied, because vectors can be modified in place and the table is shared.
+        return Directions.AsVector2D[self.value].copy()
 
 
 class Directions:
@@ -7,6 +7,7 @@ class Vector2d:
     x   X component of the vector
     y   Y component of the vector
     """
+    __slots__ = ("x", "y")
 
     x: float
     y: float
@@ -15,6 +16,16 @@ class Vector2d:
         self.x = a
         self.y = b
 
+    def copy(self) -> "Vector2d":
+        return Vector2d(self.x, self.y)
+
+    def set(self, a: float, b: float) -> "Vector2d":
+        """Sets both components in place.
+        """
+        self.x = a
+        self.y = b
+        return self
+
     @staticmethod
     def from_tuple(tpl: tuple[float, float]) -> "Vector2d":
         return Vector2d(tpl[0], tpl[1])
@@ -25,7 +36,32 @@ class Vector2d:
     def mod(self) -> float:
         """Returns length of the vector.
         """
-        return sqrt((self.x ** 2) + (self.y ** 2))
+        return sqrt(self.x * self.x + self.y * self.y)
+
+    def length_squared(self) -> float:
+        """Returns squared length of the vector. Cheaper than mod() when only comparing lengths.
+        """
+        return self.x * self.x + self.y * self.y
+
+    def dot(self, other: "Vector2d") -> float:
+        return self.x * other.x + self.y * other.y
+
+    def normalize(self) -> "Vector2d":
+        """Returns vector of length 1 with the same direction. Zero vector stays zero.
+        """
+        length = self.mod()
+        if length == 0:
+            return Vector2d(0, 0)
+        return Vector2d(self.x / length, self.y / length)
+
+    def normalize_ip(self) -> "Vector2d":
+        """Normalizes the vector in place.
+        """
+        length = self.mod()
+        if length != 0:
+            self.x /= length
+            self.y /= length
+        return self
 
     def intx(self) -> int:
         return int(self.x)
@@ -61,6 +97,9 @@ class Vector2d:
         else:
             return Vector2d(self.x * other, self.y * other)
 
+    def __neg__(self) -> "Vector2d":
+        return Vector2d(-self.x, -self.y)
+
     def __floordiv__(self, other: float):
         return Vector2d(self.x // other, self.y // other)
 
@@ -70,6 +109,30 @@ class Vector2d:
     def __mod__(self, other: float) -> "Vector2d":
         return Vector2d(self.x % other, self.y % other)
 
+    def __iadd__(self, other: "Vector2d") -> "Vector2d":
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other: "Vector2d") -> "Vector2d":
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, other: "float | Vector2d") -> "Vector2d":
+        if isinstance(other, Vector2d):
+            self.x *= other.x
+            self.y *= other.y
+        else:
+            self.x *= other
+            self.y *= other
+        return self
+
+    def __itruediv__(self, other: float) -> "Vector2d":
+        self.x /= other
+        self.y /= other
+        return self
+
     def __repr__(self) -> str:  # for debugging
         return f"<{self.x}, {self.y}>"
 
@@ -0,0 +1,127 @@
+from .vector import Vector2d
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+
+class Vector2Array:
+    """Batch of 2d vectors stored in one contiguous (n, 2) NumPy array. Requires numpy.
+
+    Arithmetic works element-wise with other arrays of the same length, single Vector2d's and scalars.
+    In-place operators don't allocate.
+
+    data    Underlying array of shape (n, 2).
+    """
+    __slots__ = ("data",)
+
+    data: "np.ndarray"
+
+    def __init__(self, data: "np.ndarray | int" = 0):
+        if np is None:
+            raise ImportError("Vector2Array requires numpy to be installed")
+        if isinstance(data, int):
+            self.data = np.zeros((data, 2), dtype=np.float64)
+        else:
+            self.data = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+
+    @staticmethod
+    def from_vectors(vectors: list[Vector2d]) -> "Vector2Array":
+        return Vector2Array([(v.x, v.y) for v in vectors])
+
+    def to_vectors(self) -> list[Vector2d]:
+        return [Vector2d(x, y) for x, y in self.data.tolist()]
+
+    @property
+    def x(self) -> "np.ndarray":
+        """View of the X components.
+        """
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> "np.ndarray":
+        """View of the Y components.
+        """
+        return self.data[:, 1]
+
+    def copy(self) -> "Vector2Array":
+        return Vector2Array(self.data.copy())
+
+    def length_squared(self) -> "np.ndarray":
+        return np.einsum("ij,ij->i", self.data, self.data)
+
+    def mod(self) -> "np.ndarray":
+        """Returns lengths of all vectors.
+        """
+        return np.sqrt(self.length_squared())
+
+    def dot(self, other: "Vector2Array | Vector2d") -> "np.ndarray":
+        if isinstance(other, Vector2d):
+            return self.data @ (other.x, other.y)
+        return np.einsum("ij,ij->i", self.data, other.data)
+
+    def normalize(self) -> "Vector2Array":
+        """Returns vectors of length 1 with the same directions. Zero vectors stay zero.
+        """
+        return self.copy().normalize_ip()
+
+    def normalize_ip(self) -> "Vector2Array":
+        lengths = self.mod()
+        np.divide(self.data, lengths[:, None], out=self.data, where=lengths[:, None] != 0)
+        return self
+
+    @staticmethod
+    def _operand(other: "Vector2Array | Vector2d | float"):
+        if isinstance(other, Vector2Array):
+            return other.data
+        if isinstance(other, Vector2d):
+            return (other.x, other.y)
+        return other
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: int) -> Vector2d:
+        x, y = self.data[index].tolist()
+        return Vector2d(x, y)
+
+    def __setitem__(self, index: int, value: Vector2d):
+        self.data[index] = (value.x, value.y)
+
+    def __iter__(self):
+        return iter(self.to_vectors())
+
+    def __add__(self, other: "Vector2Array | Vector2d") -> "Vector2Array":
+        return Vector2Array(self.data + self._operand(other))
+
+    def __sub__(self, other: "Vector2Array | Vector2d") -> "Vector2Array":
+        return Vector2Array(self.data - self._operand(other))
+
+    def __mul__(self, other: "Vector2Array | Vector2d | float") -> "Vector2Array":
+        return Vector2Array(self.data * self._operand(other))
+
+    def __truediv__(self, other: "Vector2Array | Vector2d | float") -> "Vector2Array":
+        return Vector2Array(self.data / self._operand(other))
+
+    def __neg__(self) -> "Vector2Array":
+        return Vector2Array(-self.data)
+
+    def __iadd__(self, other: "Vector2Array | Vector2d") -> "Vector2Array":
+        self.data += self._operand(other)
+        return self
+
+    def __isub__(self, other: "Vector2Array | Vector2d") -> "Vector2Array":
+        self.data -= self._operand(other)
+        return self
+
+    def __imul__(self, other: "Vector2Array | Vector2d | float") -> "Vector2Array":
+        self.data *= self._operand(other)
+        return self
+
+    def __itruediv__(self, other: "Vector2Array | Vector2d | float") -> "Vector2Array":
+        self.data /= self._operand(other)
+        return self
+
+    def __repr__(self) -> str:
+        return f"Vector2Array({self.data.tolist()})"
@@ -0,0 +1,29 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+import pytest
+
+from pygame_tools_tafh.core.game_object import GameObject
+from pygame_tools_tafh.core.registry import Registry
+
+
+@pytest.fixture
+def registry():
+    """Runs the test with an empty scene that contains only the camera, and restores the previous scene after it.
+    """
+    previous = Registry.current()
+    registry = Registry()
+    registry.activate()
+    GameObject("camera")
+    yield registry
+    registry.destroy()
+    previous.activate()
+
+
+@pytest.fixture
+def display():
+    pg.display.init()
+    return pg.display.set_mode((200, 100))
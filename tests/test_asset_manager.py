@@ -0,0 +1,83 @@
+import pygame as pg
+import pytest
+
+from pygame_tools_tafh import GameObject, SurfaceComponent
+from pygame_tools_tafh.asset_manager import AssetManager
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i in range(3):
+        surface = pg.Surface((10, 10))
+        surface.fill((i * 50, 0, 0))
+        path = tmp_path / f"image{i}.png"
+        pg.image.save(surface, str(path))
+        paths.append(str(path))
+    return paths
+
+
+def test_same_path_is_loaded_once(images, tmp_path):
+    manager = AssetManager()
+    first = manager.acquire(images[0])
+    second = manager.get(str(tmp_path / "." / "image0.png"))
+    assert first is second
+    assert manager.misses == 1
+    assert manager.hits == 1
+
+
+def test_acquire_over_budget_keeps_referenced_surface(images):
+    manager = AssetManager()
+    a = manager.acquire(images[0])
+    manager.budget = AssetManager.get_size(a)
+    b = manager.acquire(images[1])
+    assert manager.acquire(images[1]) is b
+    assert manager.acquire(images[0]) is a
+    assert manager.memory == AssetManager.get_size(a) + AssetManager.get_size(b)
+
+
+def test_get_over_budget_keeps_returned_surface(images):
+    manager = AssetManager()
+    manager.budget = 0
+    surface = manager.get(images[0])
+    assert manager.memory == AssetManager.get_size(surface)
+    manager.get(images[1])
+    assert manager.stats()["assets"] == 1
+    assert manager.evictions == 1
+
+
+def test_released_surfaces_are_evicted_least_recently_used_first(images):
+    manager = AssetManager()
+    a = manager.acquire(images[0])
+    manager.budget = 2 * AssetManager.get_size(a)
+    manager.acquire(images[1])
+    manager.get(images[0])
+    manager.release(images[0])
+    manager.release(images[1])
+    manager.get(images[2])
+    assert manager.evictions == 1
+    assert manager.get(images[0]) is a
+
+
+def test_release_without_acquire_raises(images):
+    manager = AssetManager()
+    manager.acquire(images[0])
+    manager.release(images[0])
+    with pytest.raises(Exception):
+        manager.release(images[0])
+
+
+def test_surface_components_share_and_release_assets(images, registry, monkeypatch):
+    manager = AssetManager()
+    monkeypatch.setattr(AssetManager, "default", manager)
+    obj = GameObject("sprite")
+    component = SurfaceComponent(images[0])
+    obj.add_component(component)
+    copy = obj.clone()
+    assert copy.get_component(SurfaceComponent).pg_surf is component.pg_surf
+    assert manager.stats()["referenced"] == 1
+
+    GameObject.destroy(obj)
+    assert manager.stats()["referenced"] == 1
+    GameObject.destroy(copy)
+    assert manager.stats()["referenced"] == 0
@@ -0,0 +1,20 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_benchmark_script_writes_all_measurements(tmp_path):
+    output = tmp_path / "bench.json"
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYTHONPATH=ROOT)
+    subprocess.run(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "run.py"), "--sizes", "20", "--repeat", "1", "--output", str(output)],
+        env=env, check=True, capture_output=True, timeout=120
+    )
+    results = json.loads(output.read_text())
+    scene = results["scenes"]["20"]
+    for name in ("update", "draw", "tween_update_all", "tween_update_all_numeric", "scene_destroy"):
+        assert scene[name]["min"] >= 0
+    assert "serialize" in results["serialization"]
@@ -0,0 +1,26 @@
+from pygame_tools_tafh import CircleShapeComponent, GameObject, RectShapeComponent, ShapeComponent
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def test_components_are_found_by_base_class(registry):
+    obj = GameObject("obj")
+    rect = RectShapeComponent((0, 0, 0), Vector2d(1, 1))
+    circle = CircleShapeComponent((0, 0, 0), 1)
+    obj.add_component(rect)
+    obj.add_component(circle)
+    assert obj.get_component(RectShapeComponent) is rect
+    assert obj.get_components(ShapeComponent) == [rect, circle]
+    assert obj.contains_component(CircleShapeComponent)
+
+
+def test_query_returns_objects_with_all_components(registry):
+    both = GameObject("both")
+    both.add_component(RectShapeComponent((0, 0, 0), Vector2d(1, 1)))
+    both.add_component(CircleShapeComponent((0, 0, 0), 1))
+    rect = GameObject("rect")
+    rect.add_component(RectShapeComponent((0, 0, 0), Vector2d(1, 1)))
+
+    assert list(GameObject.query(RectShapeComponent, CircleShapeComponent)) == [both]
+    assert set(GameObject.query(RectShapeComponent)) == {both, rect}
+    GameObject.destroy(rect)
+    assert list(GameObject.query(RectShapeComponent)) == [both]
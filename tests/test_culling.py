@@ -0,0 +1,36 @@
+from pygame_tools_tafh import CircleShapeComponent, GameObject, Viewport
+from pygame_tools_tafh.core.culling import Culler
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def _circle(tag: str, x: float) -> GameObject:
+    obj = GameObject(tag)
+    obj.position = Vector2d(x, 0)
+    obj.add_component(CircleShapeComponent((255, 255, 255), 5))
+    return obj
+
+
+def test_only_objects_inside_the_viewport_are_visible(registry, display):
+    inside = _circle("inside", 50)
+    outside = _circle("outside", 500)
+    edge = _circle("edge", 103)
+    viewport = Viewport()
+    viewport.refresh()
+    culler = Culler()
+    assert culler.get_visible(viewport) == [inside, edge]
+
+    GameObject.get_by_tag("camera").position.x = 500
+    viewport.refresh()
+    assert culler.get_visible(viewport) == [outside]
+
+
+def test_visible_list_is_reused_until_something_changes(registry, display):
+    obj = _circle("obj", 0)
+    viewport = Viewport()
+    viewport.refresh()
+    culler = Culler()
+    visible = culler.get_visible(viewport)
+    assert culler.get_visible(viewport) is visible
+
+    obj.z_index = 3
+    assert culler.get_visible(viewport) is not visible
@@ -0,0 +1,58 @@
+import pygame as pg
+
+from pygame_tools_tafh import GameObject, RectShapeComponent, Viewport
+from pygame_tools_tafh.core.culling import Culler
+from pygame_tools_tafh.core.dirty_rects import DirtyRectRenderer
+from pygame_tools_tafh.core.sprite_batch import SpriteBatch
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def test_only_damaged_regions_are_redrawn(registry, display, monkeypatch):
+    updates = []
+    monkeypatch.setattr(pg.display, "update", lambda rects=None: updates.append(rects))
+    obj = GameObject("obj")
+    obj.add_component(RectShapeComponent((255, 0, 0), Vector2d(10, 10)))
+    viewport = Viewport()
+    renderer = DirtyRectRenderer(Culler(), SpriteBatch())
+
+    renderer.render([viewport])
+    assert updates[-1] == [display.get_rect()]
+    assert display.get_at((100, 50)) == (255, 0, 0)
+
+    renderer.render([viewport])
+    assert len(updates) == 1
+
+    obj.position.x = 40
+    renderer.render([viewport])
+    area = updates[-1][0]
+    assert area.w * area.h < display.get_width() * display.get_height() / 2
+    assert display.get_at((100, 50)) == (0, 0, 0)
+    assert display.get_at((140, 50)) == (255, 0, 0)
+
+
+def test_camera_movement_redraws_the_whole_viewport(registry, display, monkeypatch):
+    updates = []
+    monkeypatch.setattr(pg.display, "update", lambda rects=None: updates.append(rects))
+    viewport = Viewport()
+    renderer = DirtyRectRenderer(Culler(), SpriteBatch())
+    renderer.render([viewport])
+    GameObject.get_by_tag("camera").position.x = 5
+    renderer.render([viewport])
+    assert updates[-1] == [display.get_rect()]
+
+
+def test_drawn_objects_are_timed(registry, display, monkeypatch):
+    monkeypatch.setattr(pg.display, "update", lambda rects=None: None)
+    obj = GameObject("obj")
+    shape = RectShapeComponent((255, 0, 0), Vector2d(10, 10))
+    obj.add_component(shape)
+    viewport = Viewport()
+    renderer = DirtyRectRenderer(Culler(), SpriteBatch())
+    timed = []
+    timer = lambda component, method, ns: timed.append((component, method))
+
+    renderer.render([viewport], timer)
+    assert timed == [(shape, "draw")]
+    obj.position.x = 40
+    renderer.render([viewport], timer)
+    assert timed == [(shape, "draw")] * 2
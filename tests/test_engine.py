@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+import pygame as pg
+import pytest
+
+from pygame_tools_tafh import AssetLoader, Component, Engine, GameObject, Input, MovementComponent, Scene, Transform, Viewport
+from pygame_tools_tafh.vmath import Vector2d
+
+
+class RecordingScene(Scene):
+    def __init__(self, name: str, delay: float = 0):
+        super().__init__(name)
+        self.delay = delay
+        self.loads = []
+
+    def preload(self, loader: AssetLoader):
+        if self.delay:
+            self.asset = loader.submit(time.sleep, self.delay)
+
+    def load(self, data):
+        self.loads.append(data)
+        GameObject.unique_tag(self.name)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = Engine("test", 1000, (64, 64))
+    engine.level = RecordingScene("level", 0.05)
+    engine.loading = RecordingScene("loading")
+    engine.register(engine.level)
+    engine.register(engine.loading)
+    return engine
+
+
+def test_transition_shows_loading_scene_until_assets_are_loaded(engine):
+    assert engine.begin_transition("level", "data", "loading")
+    engine.poll_transition()
+    assert engine.scene is engine.loading
+    assert isinstance(engine.loading.loads[-1], AssetLoader)
+
+    engine.level.asset.result()
+    engine.poll_transition()
+    assert engine.scene is engine.level
+    assert engine.level.loads == ["data"]
+    assert engine.transition is None
+
+
+def test_unknown_scene_is_rejected(engine):
+    assert not engine.begin_transition("missing", None)
+    assert engine.transition is None
+
+
+def test_load_scene_while_running_only_begins_transition(engine):
+    engine.running = True
+    try:
+        asyncio.run(asyncio.wait_for(engine.load_scene("loading", None), 1))
+        assert engine.transition is not None
+    finally:
+        engine.running = False
+        engine.transition = None
+
+
+def test_movement_depends_on_time_not_step_rate(engine):
+    Input.held = {pg.K_d}
+    obj = GameObject(GameObject.unique_tag("player"))
+    movement = MovementComponent(100, per_second=True)
+    obj.add_component(movement)
+    assert movement.takes_dt
+    try:
+        engine.fixed_step = 10
+        engine.accumulator = 0
+        for _ in range(100):
+            engine.run_steps(10)
+        assert obj.transform.position.x == pytest.approx(100)
+
+        engine.fixed_step = 50
+        for _ in range(100):
+            engine.run_steps(10)
+        assert obj.transform.position.x == pytest.approx(200)
+    finally:
+        engine.fixed_step = None
+        Transform.interpolate = False
+        Transform.alpha = 1.0
+        Transform.begin_step()
+        Input.held = set()
+        GameObject.destroy(obj)
+
+
+def test_movement_defaults_to_units_per_update(engine):
+    Input.held = {pg.K_d}
+    obj = GameObject(GameObject.unique_tag("player"))
+    obj.add_component(MovementComponent(3))
+    try:
+        engine.fixed_step = 10
+        engine.accumulator = 0
+        engine.run_steps(50)
+        assert obj.transform.position.x == pytest.approx(15)
+    finally:
+        engine.fixed_step = None
+        Transform.interpolate = False
+        Transform.alpha = 1.0
+        Transform.begin_step()
+        Input.held = set()
+        GameObject.destroy(obj)
+
+
+def test_fixed_steps_interpolate_render_position(engine):
+    obj = GameObject(GameObject.unique_tag("interpolated"))
+    steps = []
+
+    class Mover(Component):
+        def update(self, dt):
+            steps.append(dt)
+            self.game_object.position.x += 10
+
+    obj.add_component(Mover())
+    obj.transform.world_position
+    try:
+        engine.fixed_step = 20
+        engine.accumulator = 0
+        engine.run_steps(30)
+        assert steps == [20]
+        assert obj.transform.world_position.x == 10
+        assert obj.transform.render_position.x == pytest.approx(5)
+
+        engine.run_steps(1000)
+        assert len(steps) == 1 + engine.max_steps
+        assert engine.accumulator < engine.fixed_step
+    finally:
+        engine.fixed_step = None
+        Transform.interpolate = False
+        Transform.alpha = 1.0
+        Transform.begin_step()
+        GameObject.destroy(obj)
+
+
+def test_camera_following_an_object_keeps_it_centered(engine):
+    Input.held = {pg.K_d}
+    player = GameObject(GameObject.unique_tag("player"))
+    player.add_component(MovementComponent(100, per_second=True))
+    camera = GameObject.get_by_tag("camera")
+    camera.position = Vector2d(0, 0)
+    camera.transform.world_position
+    player.transform.world_position
+    viewport = Viewport(rect=pg.Rect(0, 0, 64, 64))
+    try:
+        engine.fixed_step = 20
+        engine.accumulator = 0
+        engine.run_steps(30)
+        assert Transform.alpha == pytest.approx(0.5)
+        viewport.refresh()
+        assert viewport.to_screen(player.transform.render_position) == pytest.approx((32, 32))
+    finally:
+        engine.fixed_step = None
+        Transform.interpolate = False
+        Transform.alpha = 1.0
+        Transform.begin_step()
+        Input.held = set()
+        GameObject.destroy(player)
@@ -0,0 +1,48 @@
+import pygame as pg
+import pytest
+
+from pygame_tools_tafh import GameObject, LabelComponent
+from pygame_tools_tafh.components.ui.fonts import GlyphAtlas, TextCache
+
+
+@pytest.fixture(scope="module")
+def font():
+    pg.font.init()
+    return pg.font.Font(None, 16)
+
+
+def test_text_cache_returns_same_surface_and_evicts(font):
+    cache = TextCache(capacity=2)
+    first = cache.render(font, "a", (255, 255, 255))
+    assert cache.render(font, "a", (255, 255, 255)) is first
+    cache.render(font, "b", (255, 255, 255))
+    cache.render(font, "c", (255, 255, 255))
+    assert cache.render(font, "a", (255, 255, 255)) is not first
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_glyph_atlases_are_bounded(font, monkeypatch):
+    monkeypatch.setattr(GlyphAtlas, "capacity", 4)
+    first = GlyphAtlas.get(font, (0, 0, 0))
+    for red in range(1, 10):
+        GlyphAtlas.get(font, (red, 0, 0))
+    assert len(GlyphAtlas._atlases) == 4
+    assert GlyphAtlas.get(font, (0, 0, 0)) is not first
+
+
+def test_glyph_atlas_renders_text_of_glyph_widths(font):
+    atlas = GlyphAtlas.get(font, (255, 255, 255))
+    surface = atlas.render("ab")
+    assert surface.get_width() == atlas.get_glyph("a").get_width() + atlas.get_glyph("b").get_width()
+
+
+def test_label_is_rendered_again_only_after_a_change(registry):
+    label = LabelComponent("score", (255, 255, 255), size=16)
+    GameObject("label").add_component(label)
+    surface = label.pg_surf
+    assert label.pg_surf is surface
+    label.text = "score"
+    assert label.pg_surf is surface
+    label.text = "score!"
+    assert label.pg_surf is not surface
+    assert label.pg_surf.get_width() > surface.get_width()
@@ -0,0 +1,32 @@
+import asyncio
+
+from pygame_tools_tafh.net.host import Host
+from pygame_tools_tafh.net.serialization import connect
+
+
+async def _exchange():
+    host = Host("127.0.0.1", 0)
+    received = asyncio.Queue()
+    host.on("move", lambda player, data: received.put_nowait((player.name, data)))
+    await host.start()
+    port = host._server.sockets[0].getsockname()[1]
+
+    client = await connect("127.0.0.1", port, "alice")
+    replies = asyncio.Queue()
+    client.on("state", replies.put_nowait)
+    client.emit("move", {"x": 1})
+    name, data = await asyncio.wait_for(received.get(), 5)
+
+    host.broadcast("state", {"players": len(host.players)})
+    reply = await asyncio.wait_for(replies.get(), 5)
+
+    client.close()
+    await host.stop()
+    return name, data, reply
+
+
+def test_host_exchanges_messages_with_a_player():
+    name, data, reply = asyncio.run(_exchange())
+    assert name == "alice"
+    assert data == {"x": 1}
+    assert reply == {"players": 1}
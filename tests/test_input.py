@@ -0,0 +1,57 @@
+import pygame as pg
+import pytest
+
+from pygame_tools_tafh import GameObject, Input, KeybindComponent, KeyEdge
+
+
+@pytest.fixture(autouse=True)
+def clean_input():
+    yield
+    Input.process([pg.event.Event(pg.WINDOWFOCUSLOST)])
+    Input.process([])
+
+
+def _key(kind: int, key: int) -> pg.event.Event:
+    return pg.event.Event(kind, key=key)
+
+
+def test_key_edges():
+    Input.process([_key(pg.KEYDOWN, pg.K_a)])
+    assert Input.is_pressed(pg.K_a) and Input.is_held(pg.K_a)
+    Input.process([])
+    assert not Input.is_pressed(pg.K_a) and Input.is_held(pg.K_a)
+    Input.process([_key(pg.KEYUP, pg.K_a)])
+    assert Input.is_released(pg.K_a) and not Input.is_held(pg.K_a)
+
+
+def test_focus_loss_releases_held_keys():
+    Input.process([_key(pg.KEYDOWN, pg.K_a), pg.event.Event(pg.MOUSEBUTTONDOWN, button=1, pos=(3, 4))])
+    Input.process([pg.event.Event(pg.WINDOWFOCUSLOST)])
+    assert Input.released == {pg.K_a}
+    assert Input.mouse_released == {1}
+    assert Input.mouse_position == (3, 4)
+
+
+def test_listeners_are_called_once_per_frame_with_changed_keys():
+    calls = []
+    owner = object()
+    Input.bind(owner, [pg.K_a, pg.K_b], KeyEdge.PRESSED, calls.append)
+    Input.process([_key(pg.KEYDOWN, pg.K_a), _key(pg.KEYDOWN, pg.K_b), _key(pg.KEYDOWN, pg.K_c)])
+    Input.process([])
+    assert len(calls) == 1
+    assert sorted(calls[0]) == [pg.K_a, pg.K_b]
+    Input.unbind(owner)
+    assert not Input._bindings
+
+
+def test_keybind_component_unbinds_when_destroyed(registry):
+    calls = []
+    obj = GameObject("obj")
+    obj.add_component(KeybindComponent([pg.K_SPACE], lambda go, keys: calls.append(go), listen_for_hold=True))
+    Input.process([_key(pg.KEYDOWN, pg.K_SPACE)])
+    Input.process([])
+    assert calls == [obj, obj]
+
+    GameObject.destroy(obj)
+    Input.process([])
+    assert len(calls) == 2
@@ -0,0 +1,99 @@
+import pygame as pg
+import pytest
+
+from pygame_tools_tafh import GameObject, ObjectPool, Prefab, RectShapeComponent, SurfaceComponent
+from pygame_tools_tafh.asset_manager import AssetManager
+from pygame_tools_tafh.vmath import Vector2d
+
+
+@pytest.fixture
+def prefab():
+    return Prefab("bullet", [RectShapeComponent((255, 255, 0), Vector2d(3, 3), cached=True)])
+
+
+def test_instances_get_their_own_components(prefab):
+    a = prefab.instantiate(position=Vector2d(5, 0))
+    b = prefab.instantiate()
+    shape = a.get_component(RectShapeComponent)
+    assert shape is not b.get_component(RectShapeComponent)
+    assert shape is not prefab.components[0]
+    assert a.tag != b.tag
+    assert a.transform.position == Vector2d(5, 0)
+    GameObject.destroy(a)
+    GameObject.destroy(b)
+
+
+def test_pool_reuses_released_objects(prefab):
+    pool = ObjectPool(prefab, size=1)
+    obj = pool.acquire(Vector2d(1, 2))
+    assert obj.active
+    pool.release(obj)
+    assert not obj.active
+    assert obj not in GameObject.render_queue.get_order()
+    assert pool.acquire() is obj
+
+
+def test_pool_rejects_double_release(prefab):
+    pool = ObjectPool(prefab)
+    obj = pool.acquire()
+    pool.release(obj)
+    with pytest.raises(Exception):
+        pool.release(obj)
+    first = pool.acquire()
+    assert pool.acquire() is not first
+
+
+def test_clone_copies_components_and_children(registry):
+    parent = GameObject("parent")
+    parent.add_component(RectShapeComponent((1, 1, 1), Vector2d(4, 4)))
+    parent.add_child(GameObject("child"))
+    parent.z_index = 2
+
+    copy = parent.clone()
+    assert copy.tag.startswith("parent#")
+    assert copy.z_index == 2
+    shape = copy.get_component(RectShapeComponent)
+    assert shape is not parent.get_component(RectShapeComponent)
+    shape.size.x = 10
+    assert parent.get_component(RectShapeComponent).size.x == 4
+    assert len(copy.childs) == 1 and copy.childs[0] is not parent.childs[0]
+
+
+def test_pooled_objects_are_not_updated_or_queried(registry, prefab):
+    pool = ObjectPool(prefab, size=2)
+    assert list(GameObject.query(RectShapeComponent)) == []
+    assert len(GameObject.objects) == 1
+
+    obj = pool.acquire()
+    assert list(GameObject.query(RectShapeComponent)) == [obj]
+    assert obj in GameObject.objects and obj not in GameObject.parked
+
+    pool.release(obj)
+    assert list(GameObject.query(RectShapeComponent)) == []
+    assert obj not in GameObject.objects and obj in GameObject.parked
+
+
+def test_registry_destroys_pooled_objects(registry, prefab):
+    pool = ObjectPool(prefab, size=1)
+    obj = pool.free[0]
+    registry.destroy()
+    assert obj.destroyed
+    assert not registry.parked
+
+
+def test_prefab_destroy_releases_template_assets(registry, tmp_path, monkeypatch):
+    manager = AssetManager()
+    monkeypatch.setattr(AssetManager, "default", manager)
+    path = str(tmp_path / "image.png")
+    pg.image.save(pg.Surface((4, 4)), path)
+
+    obj = GameObject("sprite")
+    obj.add_component(SurfaceComponent(path))
+    prefab = Prefab.from_object(obj)
+    GameObject.destroy(obj)
+    assert manager.stats()["referenced"] == 1
+
+    instance = prefab.instantiate()
+    GameObject.destroy(instance)
+    prefab.destroy()
+    assert manager.stats()["referenced"] == 0
@@ -0,0 +1,25 @@
+from pygame_tools_tafh import Component, GameObject, Profiler
+
+
+class Counter(Component):
+    def __init__(self):
+        self.steps = []
+
+    def update(self, dt):
+        self.steps.append(dt)
+
+
+def test_update_with_timer_records_every_component():
+    profiler = Profiler()
+    obj = GameObject(GameObject.unique_tag("profiled"))
+    counter = Counter()
+    obj.add_component(counter)
+
+    obj.update(16, profiler.record)
+    obj.update(16, profiler.record)
+    obj.set_active(False)
+    obj.update(16, profiler.record)
+
+    assert counter.steps == [16, 16]
+    assert profiler.components[("Counter", "update")][1] == 2
+    GameObject.destroy(obj)
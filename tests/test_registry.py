@@ -0,0 +1,88 @@
+from pygame_tools_tafh import Component, GameObject, RectShapeComponent
+from pygame_tools_tafh.core.registry import Registry
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def test_destroy_is_deferred_while_iterating(registry):
+    victim = GameObject("victim")
+    GameObject.deferring = True
+    try:
+        GameObject.destroy(victim)
+        assert victim in GameObject.objects
+        assert not victim.destroyed
+    finally:
+        GameObject.deferring = False
+    GameObject.flush_destroyed()
+    assert victim.destroyed
+    assert victim not in GameObject.objects
+    assert "victim" not in GameObject.tag_objects
+
+
+def test_destroying_a_child_detaches_it(registry):
+    parent = GameObject("parent")
+    child = GameObject("child")
+    grandchild = GameObject("grandchild")
+    parent.add_child(child)
+    child.add_child(grandchild)
+    GameObject.destroy(child)
+    assert parent.childs == []
+    assert grandchild.destroyed
+    GameObject.destroy(child)
+
+
+def test_registries_are_independent(registry):
+    GameObject("first")
+    other = Registry()
+    other.activate()
+    try:
+        assert "first" not in GameObject.tag_objects
+        GameObject("first")
+    finally:
+        registry.activate()
+    other.destroy()
+    assert GameObject.get_by_tag("first") is not None
+
+
+def test_registry_destroy_stops_components(registry):
+    destroyed = []
+
+    class Tracked(Component):
+        def destroy(self):
+            destroyed.append(self)
+
+    other = Registry()
+    other.activate()
+    obj = GameObject("obj")
+    obj.add_component(Tracked())
+    obj.add_component(RectShapeComponent((0, 0, 0), Vector2d(1, 1)))
+    registry.activate()
+    other.destroy()
+    assert len(destroyed) == 1
+    assert obj.destroyed
+    assert not other.objects and not other.component_objects and len(other.spatial_index) == 0
+
+
+def test_destroy_hooks_may_destroy_and_create_objects(registry):
+    class Companion(Component):
+        def __init__(self, tag: str):
+            self.tag = tag
+
+        def destroy(self):
+            GameObject.destroy(GameObject.get_by_tag(self.tag))
+
+    class Spawner(Component):
+        def destroy(self):
+            GameObject("spawned")
+
+    other = Registry()
+    other.activate()
+    a = GameObject("a")
+    b = GameObject("b")
+    a.add_component(Companion("b"))
+    b.add_component(Companion("a"))
+    GameObject("spawner").add_component(Spawner())
+    other.destroy()
+    registry.activate()
+    assert a.destroyed and b.destroyed
+    assert not other.objects and not other.tag_objects
+    assert not GameObject._pending
@@ -0,0 +1,23 @@
+from pygame_tools_tafh import GameObject
+
+
+def test_greater_z_index_is_drawn_first(registry):
+    camera = GameObject.get_by_tag("camera")
+    a = GameObject("a")
+    b = GameObject("b")
+    c = GameObject("c")
+    b.z_index = 5
+    c.z_index = -1
+    assert GameObject.render_queue.get_order() == [b, camera, a, c]
+
+    a.z_index = 10
+    assert GameObject.render_queue.get_order() == [a, b, camera, c]
+
+
+def test_order_is_cached_until_changed(registry):
+    GameObject("a")
+    order = GameObject.render_queue.get_order()
+    assert GameObject.render_queue.get_order() is order
+    GameObject.destroy(GameObject.get_by_tag("a"))
+    assert GameObject.render_queue.get_order() is not order
+    assert len(GameObject.render_queue) == 1
@@ -0,0 +1,88 @@
+from pygame_tools_tafh.net.replication import ReplicaState, Replicator
+from pygame_tools_tafh.net.serialization import Serializable
+
+
+class Entity(Serializable):
+    fields = ("x", "y", "name")
+
+    def __init__(self, x: float, name: str):
+        self.x = x
+        self.y = 0.0
+        self.name = name
+
+    def serialize(self):
+        return {"x": self.x, "y": self.y, "name": self.name}
+
+
+def test_deltas_carry_only_changed_fields():
+    replicator = Replicator()
+    replica = ReplicaState()
+    a = Entity(1.0, "a")
+    a_id = replicator.add(a)
+    b_id = replicator.add(Entity(2.0, "b"))
+
+    replicator.snapshot()
+    keyframe = replicator.encode_for("client")
+    replicator.acknowledge("client", replica.apply(keyframe))
+    assert replica.objects[b_id] == {"x": 2.0, "y": 0.0, "name": "b"}
+
+    a.x = 5.0
+    replicator.snapshot()
+    delta = replicator.encode_for("client")
+    assert len(delta) < len(keyframe)
+    replicator.acknowledge("client", replica.apply(delta))
+    assert replica.objects[a_id] == {"x": 5.0, "y": 0.0, "name": "a"}
+
+
+def test_removed_objects_disappear_and_late_clients_get_keyframes():
+    replicator = Replicator()
+    replica = ReplicaState()
+    a = Entity(1.0, "a")
+    replicator.add(a)
+    b = Entity(2.0, "b")
+    b_id = replicator.add(b)
+    replicator.snapshot()
+    replicator.acknowledge("client", replica.apply(replicator.encode_for("client")))
+
+    replicator.remove(b)
+    replicator.snapshot()
+    replica.apply(replicator.encode_for("client"))
+    assert b_id not in replica.objects
+
+    late = ReplicaState()
+    assert late.apply(replicator.encode_for("late")) == replicator.tick
+    assert late.objects == replica.objects
+
+
+def test_outdated_and_unknown_base_snapshots_are_ignored():
+    replicator = Replicator()
+    replica = ReplicaState()
+    entity = Entity(1.0, "a")
+    replicator.add(entity)
+    replicator.snapshot()
+    first = replicator.encode_for("client")
+    replica.apply(first)
+    assert replica.apply(first) is None
+
+    replicator.acknowledge("other", 1)
+    entity.x = 2.0
+    replicator.snapshot()
+    replicator.snapshot()
+    stranger = ReplicaState()
+    assert stranger.apply(replicator.encode_for("other")) is None
+
+
+def test_replica_prunes_history_when_ticks_are_dropped():
+    replicator = Replicator(history=4)
+    replica = ReplicaState(history=4)
+    entity = Entity(1.0, "a")
+    replicator.add(entity)
+    for tick in range(1, 30):
+        entity.x = float(tick)
+        replicator.snapshot()
+        data = replicator.encode_for("client")
+        # Only every third snapshot arrives.
+        if tick % 3 == 0:
+            replicator.acknowledge("client", replica.apply(data))
+    assert replica.objects[1]["x"] == 27.0
+    assert list(replica._snapshots) == [24, 27]
@@ -0,0 +1,79 @@
+import struct
+
+import pytest
+
+from pygame_tools_tafh.net.serialization import (
+    FrameBuffer, PlayerConn, Serializable, decode_message, deserialize, encode_message, serialize, HEADER_SIZE
+)
+
+
+VALUES = [
+    None,
+    True,
+    False,
+    0,
+    -(1 << 62),
+    1.5,
+    "",
+    "héllo",
+    b"\x00\xff",
+    [1, "a", [None, 2.5]],
+    {"a": {"b": [True, b"x"]}, "": 1},
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_round_trip(value):
+    decoded = deserialize(serialize(value))
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_unsupported_type_raises():
+    with pytest.raises(Exception):
+        serialize({"a": object()})
+
+
+class Player(Serializable):
+    def serialize(self):
+        return {"x": 1.0, "name": "p"}
+
+
+def test_message_round_trip():
+    frame = encode_message("move", Player())
+    assert decode_message(frame[HEADER_SIZE:]) == ("move", {"x": 1.0, "name": "p"})
+
+
+def test_frame_buffer_splits_a_stream_at_any_boundary():
+    stream = b"".join(encode_message("event", {"i": i, "pad": "x" * i * 100}) for i in range(20))
+    buffer = FrameBuffer(capacity=64)
+    received = []
+    for start in range(0, len(stream), 7):
+        buffer.feed(stream[start:start + 7])
+        received.extend(buffer.messages())
+    assert [data["i"] for _, data in received] == list(range(20))
+    assert list(buffer.frames()) == []
+
+
+def test_oversized_frame_disconnects_the_player():
+    class Transport:
+        aborted = False
+
+        def set_write_buffer_limits(self, high):
+            pass
+
+        def abort(self):
+            self.aborted = True
+
+    conn = PlayerConn(max_frame=64)
+    transport = Transport()
+    conn.connection_made(transport)
+    received = []
+    conn.on("small", received.append)
+    data = encode_message("small", 1) + struct.pack("!I", 1 << 30)
+    with conn.get_buffer(len(data)) as buf:
+        buf[:len(data)] = data
+    conn.buffer_updated(len(data))
+    assert received == [1]
+    assert transport.aborted
+    assert conn._buffer.overflow
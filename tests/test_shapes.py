@@ -0,0 +1,69 @@
+import pygame as pg
+
+from pygame_tools_tafh.core.game_object import GameObject
+from pygame_tools_tafh.components.draw.shape_component import ShapeComponent
+from pygame_tools_tafh.components.draw.rect_shape_component import RectShapeComponent
+from pygame_tools_tafh.components.draw.shape_cache import ShapeCache
+from pygame_tools_tafh.vmath import Vector2d
+
+
+class DotComponent(ShapeComponent):
+    drawn = 0
+
+    def draw(self):
+        self.drawn += 1
+
+
+def test_cached_shape_without_rasterize_is_drawn_uncached():
+    shape = DotComponent((255, 0, 0), cached=True)
+    assert not shape.cached
+    assert not shape.batched
+
+
+def test_cached_rect_is_batched():
+    shape = RectShapeComponent((255, 0, 0), Vector2d(10, 10), cached=True)
+    assert shape.cached
+    assert shape.batched
+    assert shape.get_surface(1).get_size() == (10, 10)
+
+
+def test_resizing_in_place_invalidates_surface_and_bounds():
+    obj = GameObject("rect")
+    shape = RectShapeComponent((255, 0, 0), Vector2d(10, 10), cached=True)
+    obj.add_component(shape)
+    assert shape.get_surface(1).get_size() == (10, 10)
+    GameObject.spatial_index.sync()
+    assert shape not in GameObject.spatial_index.query_point(20, 0)
+
+    shape.size.x = 50
+    assert shape.get_surface(1).get_size() == (50, 10)
+    GameObject.spatial_index.sync()
+    assert GameObject.spatial_index.bounds[shape] == (-25, -5, 25, 5)
+    assert shape in GameObject.spatial_index.query_point(20, 0)
+    GameObject.destroy(obj)
+
+
+def test_size_is_copied_from_the_assigned_vector():
+    size = Vector2d(10, 10)
+    shape = RectShapeComponent((255, 0, 0), size)
+    size.x = 30
+    assert shape.size.x == 10
+    assert shape.clone().size.owner is not shape
+
+
+def test_shape_cache_shares_surfaces_and_evicts():
+    cache = ShapeCache(capacity=1)
+    first = cache.get("a", lambda: pg.Surface((1, 1)))
+    assert cache.get("a", lambda: pg.Surface((1, 1))) is first
+    cache.get("b", lambda: pg.Surface((1, 1)))
+    assert cache.get("a", lambda: pg.Surface((1, 1))) is not first
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_equal_shapes_share_a_cached_surface():
+    a = RectShapeComponent((1, 2, 3), Vector2d(7, 7), cached=True, antialias=True)
+    b = RectShapeComponent((1, 2, 3), Vector2d(7, 7), cached=True, antialias=True)
+    assert a.get_surface(2) is b.get_surface(2)
+    assert a.get_surface(2).get_size() == (14, 14)
+    b.color = (3, 2, 1)
+    assert a.get_surface(2) is not b.get_surface(2)
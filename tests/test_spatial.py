@@ -0,0 +1,54 @@
+from pygame_tools_tafh import ClickableComponent, CircleShapeComponent, GameObject, RectShapeComponent
+from pygame_tools_tafh.core.spatial import SpatialHash
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def test_spatial_hash_queries():
+    grid = SpatialHash(cell_size=10)
+    grid.insert("big", (0, 0, 35, 35))
+    grid.insert("small", (50, 50, 52, 52))
+    assert grid.query_point(30, 30) == ["big"]
+    assert set(grid.query_rect(30, 30, 51, 51)) == {"big", "small"}
+    assert grid.query_radius(55, 55, 4) == []
+    assert grid.query_radius(55, 55, 5) == ["small"]
+
+    grid.insert("small", (0, 0, 1, 1))
+    assert set(grid.query_point(0.5, 0.5)) == {"big", "small"}
+    assert grid.query_point(51, 51) == []
+    grid.remove("big")
+    assert "big" not in grid
+    assert len(grid) == 1
+
+
+def test_index_follows_moving_objects(registry):
+    obj = GameObject("obj")
+    shape = CircleShapeComponent((0, 0, 0), 5)
+    obj.add_component(shape)
+    index = GameObject.spatial_index
+    index.sync()
+    assert index.query_point(0, 0) == [shape]
+
+    obj.position.x = 100
+    index.sync()
+    assert index.query_point(0, 0) == []
+    assert index.query_point(100, 0) == [shape]
+
+    GameObject.destroy(obj)
+    index.sync()
+    assert shape not in index
+
+
+def test_click_goes_to_the_topmost_object(registry):
+    clicks = []
+    for tag, z_index in (("back", 1), ("front", 0)):
+        obj = GameObject(tag)
+        obj.z_index = z_index
+        obj.add_component(RectShapeComponent((0, 0, 0), Vector2d(10, 10)))
+        obj.add_component(ClickableComponent(lambda args: clicks.append(args[0]), True, tag))
+
+    ClickableComponent.dispatch(Vector2d(1, 1), True)
+    ClickableComponent.dispatch(Vector2d(1, 1), True)
+    ClickableComponent.dispatch(None, False)
+    ClickableComponent.dispatch(Vector2d(20, 20), True)
+    ClickableComponent.dispatch(None, False)
+    assert clicks == ["front"]
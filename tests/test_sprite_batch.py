@@ -0,0 +1,39 @@
+import pygame as pg
+
+from pygame_tools_tafh import GameObject, RectShapeComponent, SurfaceComponent, Viewport
+from pygame_tools_tafh.core.sprite_batch import SpriteBatch
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def test_blits_are_queued_until_flushed(display):
+    display.fill((0, 0, 0))
+    batch = SpriteBatch()
+    surface = pg.Surface((4, 4))
+    surface.fill((0, 255, 0))
+    batch.begin()
+    SpriteBatch.blit(surface, (0, 0))
+    assert display.get_at((1, 1)) == (0, 0, 0)
+    batch.end()
+    assert display.get_at((1, 1)) == (0, 255, 0)
+    assert SpriteBatch.current is None
+
+
+def test_unbatched_components_keep_drawing_order(registry, display):
+    surface = pg.Surface((10, 10))
+    surface.fill((0, 255, 0))
+    obj = GameObject("obj")
+    obj.add_component(SurfaceComponent(surface))
+    obj.add_component(RectShapeComponent((255, 0, 0), Vector2d(4, 4)))
+    assert obj.get_component(SurfaceComponent).batched
+    assert not obj.get_component(RectShapeComponent).batched
+
+    viewport = Viewport()
+    viewport.refresh()
+    viewport.activate()
+    display.fill((0, 0, 0))
+    batch = SpriteBatch()
+    batch.begin()
+    obj.draw()
+    batch.end()
+    assert display.get_at((100, 50)) == (255, 0, 0)
+    assert display.get_at((97, 47)) == (0, 255, 0)
@@ -0,0 +1,39 @@
+from pygame_tools_tafh import GameObject
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def test_world_position_follows_parents(registry):
+    parent = GameObject("parent")
+    child = GameObject("child")
+    parent.add_child(child)
+    parent.transform.position = Vector2d(10, 0)
+    child.transform.position = Vector2d(1, 2)
+    assert child.transform.world_position == Vector2d(11, 2)
+
+    parent.position.x = 20
+    assert child.transform.world_position == Vector2d(21, 2)
+    assert child.get_absolute_coords() == Vector2d(21, 2)
+
+
+def test_listeners_are_called_once_until_recomputed(registry):
+    obj = GameObject("obj")
+    calls = []
+    obj.transform.listeners["test"] = lambda: calls.append(1)
+    obj.transform.world_position
+    obj.position.x = 1
+    obj.position.y = 2
+    assert len(calls) == 1
+    obj.transform.world_position
+    obj.position += Vector2d(1, 1)
+    assert len(calls) == 2
+    assert obj.transform.world_position == Vector2d(2, 3)
+
+
+def test_absolute_coords_are_a_copy(registry):
+    parent = GameObject("parent")
+    child = GameObject("child")
+    parent.add_child(child)
+    child.position = Vector2d(1, 1)
+    coords = child.get_absolute_coords()
+    coords += Vector2d(100, 0)
+    assert child.transform.world_position == Vector2d(1, 1)
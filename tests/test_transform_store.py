@@ -0,0 +1,103 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import pygame as pg
+
+from pygame_tools_tafh import GameObject, SurfaceComponent, TransformStore, Viewport
+from pygame_tools_tafh.core.sprite_batch import SpriteBatch
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def test_attached_positions_are_views_into_the_store(registry):
+    store = TransformStore(capacity=1)
+    obj = GameObject("obj")
+    obj.transform.position = Vector2d(3, 4)
+    store.attach(obj.transform)
+    assert obj.transform.position == Vector2d(3, 4)
+
+    obj.position.x = 5
+    assert store.positions[obj.transform.slot].tolist() == [5, 4]
+    assert obj.transform.world_position == Vector2d(5, 4)
+
+    store.detach(obj.transform)
+    obj.position.y = 1
+    assert obj.transform.world_position == Vector2d(5, 1)
+
+
+def test_bulk_operations_invalidate_world_positions(registry):
+    store = TransformStore(capacity=2)
+    a = GameObject("a")
+    b = GameObject("b")
+    store.attach(a.transform)
+    store.attach(b.transform)
+    a.transform.velocity = Vector2d(10, 0)
+    a.transform.world_position
+    b.transform.world_position
+
+    store.integrate(0.5)
+    assert a.transform.world_position == Vector2d(5, 0)
+    store.translate(Vector2d(1, 1))
+    assert b.transform.world_position == Vector2d(1, 1)
+    store.clamp(Vector2d(0, 0), Vector2d(2, 2))
+    assert a.transform.world_position == Vector2d(2, 1)
+    assert store.mask_in_rect(0, 0, 1.5, 1.5)[b.transform.slot]
+
+
+def test_store_grows_when_full(registry):
+    store = TransformStore(capacity=1)
+    for i in range(3):
+        store.attach(GameObject(f"obj{i}").transform)
+    assert store.capacity >= 3
+
+
+def test_bulk_moves_are_picked_up_lazily(registry, display):
+    store = TransformStore(capacity=4)
+    sprite = GameObject("sprite")
+    surface = pg.Surface((4, 4))
+    surface.fill((255, 0, 0))
+    component = SurfaceComponent(surface)
+    sprite.add_component(component)
+    store.attach(sprite.transform)
+    calls = []
+    sprite.transform.listeners["test"] = lambda: calls.append(1)
+
+    index = GameObject.spatial_index
+    index.sync()
+    viewport = Viewport()
+    viewport.refresh()
+    viewport.activate()
+    batch = SpriteBatch()
+    batch.begin()
+    sprite.draw()
+    batch.end()
+
+    store.translate(Vector2d(50, 0))
+    assert calls == []
+    index.sync()
+    assert index.query_point(50, 0) == [component]
+    assert index.query_point(0, 0) == []
+
+    display.fill((0, 0, 0))
+    batch.begin()
+    sprite.draw()
+    batch.end()
+    assert display.get_at((150, 50)) == (255, 0, 0)
+    assert display.get_at((100, 50)) == (0, 0, 0)
+
+
+def test_bulk_moves_reach_children_and_detached_transforms(registry):
+    store = TransformStore(capacity=2)
+    parent = GameObject("parent")
+    child = GameObject("child")
+    parent.add_child(child)
+    lone = GameObject("lone")
+    store.attach(parent.transform)
+    store.attach(lone.transform)
+    child.transform.world_position
+    lone.transform.world_position
+
+    store.translate(Vector2d(3, 4))
+    assert child.transform.world_position == Vector2d(3, 4)
+    store.detach(lone.transform)
+    assert lone.transform.world_position == Vector2d(3, 4)
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pygame_tools_tafh import Tween
+from pygame_tools_tafh.tween import EaseType
+
+
+@pytest.fixture(autouse=True)
+def clean_tweens():
+    yield
+    Tween.stop_all()
+
+
+@pytest.mark.parametrize("ease_type", list(EaseType))
+def test_batched_tweens_match_unbatched_ones(ease_type, monkeypatch):
+    pytest.importorskip("numpy")
+    targets = []
+    for batching in (True, False):
+        monkeypatch.setattr(Tween, "batching", batching)
+        target = SimpleNamespace(value=0.0)
+        tween = Tween(target, "value", 10, 20, 100, ease_type, delay=20)
+        tween.start()
+        assert (tween._batch is not None) == batching
+        values = []
+        for _ in range(8):
+            Tween.update_all(16)
+            values.append(target.value)
+        targets.append(values)
+        Tween.stop_all()
+    assert targets[0] == pytest.approx(targets[1])
+
+
+def test_batched_yoyo_tween_repeats_and_completes():
+    pytest.importorskip("numpy")
+    target = SimpleNamespace(value=0.0)
+    completed = []
+    Tween(target, "value", 0, 10, 100, repeat=1, yoyo=True, on_complete=lambda: completed.append(1)).start()
+    Tween.update_all(100)
+    assert target.value == 10
+    Tween.update_all(50)
+    assert target.value == pytest.approx(5)
+    Tween.update_all(50)
+    assert target.value == 0
+    assert completed == [1]
+    assert not Tween.active_tweens
+
+
+def test_tweens_are_found_by_handle_until_stopped():
+    target = SimpleNamespace(value=0.0)
+    tween = Tween(target, "value", 0, 1, 100)
+    handle = tween.start()
+    assert Tween.get(handle) is tween
+    tween.stop()
+    assert Tween.get(handle) is None
+    assert not Tween.active_tweens
+
+
+def test_stop_target_stops_only_its_tweens():
+    a = SimpleNamespace(value=0.0)
+    b = SimpleNamespace(value=0.0)
+    Tween(a, "value", 0, 1, 100).start()
+    kept = Tween(b, "value", 0, 1, 100)
+    kept.start()
+    Tween.stop_target(a)
+    assert list(Tween.active_tweens) == [kept]
+
+
+def test_paused_group_keeps_progress():
+    target = SimpleNamespace(x=0.0, y=0.0)
+    Tween(target, "x", 0, 100, 100, group="ui").start()
+    other = Tween(target, "y", 0, 100, 200)
+    other.start()
+    Tween.update_all(50)
+    Tween.pause_group("ui")
+    Tween.update_all(25)
+    assert target.x == pytest.approx(50)
+    assert target.y == pytest.approx(37.5)
+    Tween.resume_group("ui")
+    Tween.update_all(25)
+    assert target.x == pytest.approx(75)
+    Tween.stop_group("ui")
+    assert list(Tween.active_tweens) == [other]
+
+
+def test_tween_stopped_by_another_tween_keeps_its_target():
+    pytest.importorskip("numpy")
+    target = SimpleNamespace(a=0.0, b=0.0)
+    stopped = Tween(target, "b", 0, 100, 100)
+    Tween(target, "a", 0, 100, 100, on_update=lambda value, progress: stopped.stop()).start()
+    stopped.start()
+    Tween.update_all(50)
+    assert target.a == pytest.approx(50)
+    assert target.b == 0
@@ -0,0 +1,24 @@
+import pygame as pg
+
+from pygame_tools_tafh import GameObject, Viewport
+from pygame_tools_tafh.vmath import Vector2d
+
+
+def test_projection_round_trip(registry, display):
+    viewport = Viewport(rect=pg.Rect(0, 0, 100, 100), zoom=2)
+    GameObject.get_by_tag("camera").position = Vector2d(10, 10)
+    viewport.refresh()
+    assert viewport.to_screen(Vector2d(10, 10)) == (50, 50)
+    assert viewport.to_world((70, 30)) == Vector2d(20, 0)
+    assert viewport.get_world_rect() == (-15, -15, 35, 35)
+
+
+def test_projection_is_replaced_only_when_it_changes(registry, display):
+    viewport = Viewport()
+    viewport.refresh()
+    projection = viewport.projection
+    viewport.refresh()
+    assert viewport.projection is projection
+    GameObject.get_by_tag("camera").position.x = 5
+    viewport.refresh()
+    assert viewport.projection is not projection
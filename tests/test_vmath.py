@@ -0,0 +1,28 @@
+import pytest
+
+from pygame_tools_tafh.vmath import Directions, Vector2d, Vector2Array
+
+
+def test_in_place_operators_keep_identity():
+    v = Vector2d(1, 2)
+    same = v
+    v += Vector2d(1, 1)
+    v *= 2
+    v -= Vector2d(1, 1)
+    v /= 2
+    assert v is same
+    assert v == Vector2d(1.5, 2.5)
+
+
+def test_direction_vectors_are_copies():
+    v = Directions.UP.to_vector()
+    v += Vector2d(5, 5)
+    assert Directions.UP.to_vector() == Vector2d(0, -1)
+
+
+def test_vector_array_round_trip():
+    pytest.importorskip("numpy")
+    vectors = [Vector2d(1, 2), Vector2d(3, 4)]
+    array = Vector2Array.from_vectors(vectors)
+    array += Vector2d(1, 1)
+    assert array.to_vectors() == [Vector2d(2, 3), Vector2d(4, 5)]